@@ -1,399 +1,779 @@
-#!/usr/bin/env python3
-"""
-University Remote Control Agent
-Zero-installation remote control for university computers.
-"""
-
-import sys
-import os
-import json
-import time
-import threading
-import base64
-import secrets
-import urllib.request
-import urllib.parse
-import io
-from datetime import datetime
-
-# Try to import optional dependencies with fallbacks
-try:
-    import PIL.ImageGrab as ImageGrab
-    from PIL import Image
-    HAS_PIL = True
-except ImportError:
-    HAS_PIL = False
-
-try:
-    # Dynamic import to avoid automatic dependency detection
-    import pynput.mouse as pynput_mouse
-    import pynput.keyboard as pynput_keyboard
-    mouse = pynput_mouse
-    keyboard = pynput_keyboard
-    HAS_PYNPUT = True
-    print("✅ pynput imported successfully")
-except ImportError as e:
-    print(f"❌ pynput import failed: {e}")
-    HAS_PYNPUT = False
-
-# Load configuration
-def load_config():
-    """Load configuration from config.json"""
-    try:
-        config_path = os.path.join(os.path.dirname(__file__), 'config.json')
-        with open(config_path, 'r') as f:
-            return json.load(f)
-    except Exception:
-        # Default configuration
-        return {
-            "server_url": "https://web-production-463b89.up.railway.app",
-            "settings": {
-                "screen_fps": 10,  # Increased from 1 to 10 FPS for better responsiveness
-                "screen_quality": 60,  # Increased quality slightly
-                "screen_width": 1280,  # Higher resolution
-                "screen_height": 720,
-                "command_check_interval": 0.05,  # Reduced from 0.1 to 0.05 (50ms)
-                "connection_timeout": 10,
-                "retry_delay": 1  # Reduced retry delay
-            }
-        }
-
-config = load_config()
-
-
-class RemoteControlAgent:
-    """Remote Control Agent for University Computers"""
-    
-    def __init__(self, server_url=None):
-        self.server_url = (server_url or config.get('server_url')).rstrip('/')
-        self.session_id = None
-        self.running = False
-        self.settings = config.get('settings', {})
-        self.last_screen_time = 0
-        self.command_queue = []
-        self.last_screenshot_hash = None  # For change detection
-
-    def start(self):
-        """Start the remote control agent"""
-        print("University Remote Control Agent Starting...")
-        print(f"Server: {self.server_url}")
-        print(f"PIL Available: {HAS_PIL}")
-        print(f"Input Control: {HAS_PYNPUT}")
-        
-        if not self.register():
-            print("FAILED to register with server")
-            return
-        
-        print()
-        print("=" * 60)
-        print(f"SUCCESS! Agent Active! Session ID: {self.session_id}")
-        print("=" * 60)
-        print("COPY THIS SESSION ID TO YOUR CONTROLLER!")
-        print(f"Session ID: {self.session_id}")
-        print(f"Controller URL: {self.server_url}")
-        print("=" * 60)
-        print()
-        print("Agent is running... Press Ctrl+C to stop")
-        
-        self.running = True
-        
-        # Start background threads for screen capture and command processing
-        if HAS_PIL:
-            screen_thread = threading.Thread(target=self.screen_capture_loop, daemon=True)
-            screen_thread.start()
-        
-        if HAS_PYNPUT:
-            command_thread = threading.Thread(target=self.command_loop, daemon=True)
-            command_thread.start()
-        
-        try:
-            while self.running:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            print("\n🛑 Agent stopped by user")
-            self.running = False
-
-    def register(self):
-        """Register agent with server and get session ID"""
-        # Prepare registration data
-        data = {
-            'platform': sys.platform,
-            'python_version': sys.version.split()[0],
-            'has_pil': HAS_PIL,
-            'has_pynput': HAS_PYNPUT,
-            'timestamp': datetime.now().isoformat(),
-            'agent_type': 'university'
-        }
-        
-        try:
-            # Try to register with server
-            print("📝 Registering with server...")
-            response = self.http_post('/api/register', data)
-            if response and 'sessionId' in response:
-                self.session_id = response['sessionId']
-                print("✅ Server registration successful")
-                return True
-        except Exception as e:
-            print(f"⚠️ Server registration failed: {e}")
-        
-        # Fallback - generate local session ID
-        try:
-            self.session_id = secrets.token_hex(4).upper()
-            print("⚠️ Using local session ID (server unavailable)")
-            return True
-        except:
-            import random
-            self.session_id = f"{random.randint(1000, 9999):04d}"
-            print("⚠️ Using random session ID (crypto unavailable)")
-            return True 
-            print("⚠️ Using random session ID (crypto unavailable)")
-            return True
-
-    def screen_capture_loop(self):
-        """Continuously capture and send screen updates"""
-        fps_delay = 1.0 / self.settings.get('screen_fps', 10)
-        
-        while self.running:
-            try:
-                current_time = time.time()
-                if current_time - self.last_screen_time >= fps_delay:
-                    screen_data = self.capture_screen()
-                    if screen_data:
-                        self.send_screen(screen_data)
-                    self.last_screen_time = current_time
-                time.sleep(0.01)  # Reduced sleep time for better responsiveness
-            except Exception as e:
-                print(f"Screen capture error: {e}")
-                time.sleep(self.settings.get('retry_delay', 1))
-
-    def command_loop(self):
-        """Continuously check for and execute remote commands"""
-        check_interval = self.settings.get('command_check_interval', 0.1)
-        
-        while self.running:
-            try:
-                commands = self.get_commands()
-                if commands:
-                    print(f"Received {len(commands)} commands")
-                for command in commands:
-                    print(f"Executing command: {command}")
-                    self.execute_command(command)
-                time.sleep(check_interval)
-            except Exception as e:
-                print(f"Command loop error: {e}")
-                time.sleep(self.settings.get('retry_delay', 2))
-
-    def capture_screen(self):
-        """Capture screen using PIL with optimization"""
-        if not HAS_PIL:
-            return None
-            
-        try:
-            screenshot = ImageGrab.grab()
-            
-            # Quick hash check for change detection
-            import hashlib
-            screen_hash = hashlib.md5(screenshot.tobytes()).hexdigest()
-            
-            # Only process if screen changed significantly
-            if screen_hash == self.last_screenshot_hash:
-                return None  # No change, skip this frame
-            
-            self.last_screenshot_hash = screen_hash
-            
-            # Resize for performance with better settings
-            width = self.settings.get('screen_width', 1280)
-            height = self.settings.get('screen_height', 720)
-            screenshot = screenshot.resize((width, height), Image.LANCZOS if hasattr(Image, 'LANCZOS') else 1)
-            
-            # Convert to JPEG with optimizations
-            buffer = io.BytesIO()
-            quality = self.settings.get('screen_quality', 60)
-            screenshot.save(buffer, format='JPEG', quality=quality, optimize=True)
-            
-            return base64.b64encode(buffer.getvalue()).decode()
-        except Exception as e:
-            print(f"Screen capture error: {e}")
-            return None
-
-    def send_screen(self, screen_data):
-        """Send screen data to server"""
-        data = {
-            'sessionId': self.session_id,
-            'data': screen_data,
-            'timestamp': int(time.time() * 1000)
-        }
-        
-        try:
-            self.http_post('/api/screen', data)
-        except Exception as e:
-            # Don't spam console with screen upload errors
-            pass
-
-    def get_commands(self):
-        """Get pending commands from server"""
-        try:
-            response = self.http_get(f'/api/commands/{self.session_id}')
-            return response if response else []
-        except:
-            return []
-
-    def execute_command(self, command):
-        """Execute a remote command"""
-        if not HAS_PYNPUT:
-            return
-            
-        try:
-            cmd_type = command.get('type')
-            
-            if cmd_type == 'mouse':
-                self.handle_mouse_command(command)
-            elif cmd_type == 'keyboard':
-                self.handle_keyboard_command(command)
-            elif cmd_type == 'special':
-                self.handle_special_command(command)
-        except Exception as e:
-            print(f"Command execution error: {e}")
-
-    def handle_mouse_command(self, command):
-        """Handle mouse commands using pynput"""
-        try:
-            print(f"Handling mouse command: {command}")
-            
-            # Get actual screen dimensions
-            if HAS_PIL:
-                from PIL import ImageGrab
-                screen = ImageGrab.grab()
-                screen_width, screen_height = screen.size
-            else:
-                # Fallback to common resolution
-                screen_width, screen_height = 1920, 1080
-            
-            # Convert relative coordinates (0-1) to actual screen pixels
-            x = int(command.get('x', 0) * screen_width)
-            y = int(command.get('y', 0) * screen_height)
-            
-            # Ensure coordinates are within screen bounds
-            x = max(0, min(x, screen_width - 1))
-            y = max(0, min(y, screen_height - 1))
-            
-            mouse_controller = mouse.Controller()
-            
-            action = command.get('action')
-            if action == 'move':
-                mouse_controller.position = (x, y)
-                print(f"Mouse moved to ({x}, {y}) on {screen_width}x{screen_height} screen")
-            elif action == 'click':
-                mouse_controller.position = (x, y)
-                button = mouse.Button.right if command.get('button') == 'right' else mouse.Button.left
-                mouse_controller.click(button)
-                print(f"Mouse clicked at ({x}, {y}) with {button} on {screen_width}x{screen_height} screen")
-            elif action == 'scroll':
-                dy = command.get('deltaY', 0)
-                mouse_controller.scroll(0, -dy // 120)  # Convert to scroll units
-                print(f"Mouse scrolled: {dy}")
-        except Exception as e:
-            print(f"Mouse command error: {e}")
-
-    def handle_keyboard_command(self, command):
-        """Handle keyboard commands using pynput"""
-        try:
-            key_controller = keyboard.Controller()
-            key = command.get('key', '')
-            
-            # Map special keys
-            key_map = {
-                'Enter': keyboard.Key.enter,
-                'Escape': keyboard.Key.esc,
-                'Backspace': keyboard.Key.backspace,
-                'Tab': keyboard.Key.tab,
-                'ArrowUp': keyboard.Key.up,
-                'ArrowDown': keyboard.Key.down,
-                'ArrowLeft': keyboard.Key.left,
-                'ArrowRight': keyboard.Key.right,
-                'Delete': keyboard.Key.delete,
-                'Home': keyboard.Key.home,
-                'End': keyboard.Key.end,
-                'PageUp': keyboard.Key.page_up,
-                'PageDown': keyboard.Key.page_down,
-            }
-            
-            if command.get('action') == 'keydown':
-                if key in key_map:
-                    key_controller.press(key_map[key])
-                elif len(key) == 1:
-                    key_controller.press(key)
-            elif command.get('action') == 'keyup':
-                if key in key_map:
-                    key_controller.release(key_map[key])
-                elif len(key) == 1:
-                    key_controller.release(key)
-            elif command.get('action') == 'type':
-                key_controller.type(key)
-        except Exception as e:
-            print(f"Keyboard command error: {e}")
-
-    def handle_special_command(self, command):
-        """Handle special system commands"""
-        action = command.get('action')
-        if action == 'ctrl-alt-del':
-            print("⚠️ Ctrl+Alt+Del requested (not implemented for security)")
-        elif action == 'alt-tab':
-            try:
-                key_controller = keyboard.Controller()
-                key_controller.press(keyboard.Key.alt)
-                key_controller.press(keyboard.Key.tab)
-                key_controller.release(keyboard.Key.tab)
-                key_controller.release(keyboard.Key.alt)
-            except:
-                pass
-        else:
-            print(f"Special command: {action}")
-
-    def http_get(self, path):
-        """Make HTTP GET request"""
-        try:
-            timeout = self.settings.get('connection_timeout', 10)
-            with urllib.request.urlopen(f"{self.server_url}{path}", timeout=timeout) as response:
-                return json.loads(response.read().decode())
-        except Exception as e:
-            raise Exception(f"GET {path} failed: {e}")
-
-    def http_post(self, path, data):
-        """Make HTTP POST request"""
-        try:
-            json_data = json.dumps(data).encode()
-            req = urllib.request.Request(
-                f"{self.server_url}{path}",
-                data=json_data,
-                headers={'Content-Type': 'application/json'}
-            )
-            timeout = self.settings.get('connection_timeout', 10)
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                return json.loads(response.read().decode())
-        except Exception as e:
-            raise Exception(f"POST {path} failed: {e}")
-
-
-def main():
-    """Main entry point"""
-    print("University Remote Control Agent v1.0")
-    print("Zero-installation remote access for university computers")
-    print("=" * 60)
-    
-    # Check for server URL argument
-    server_url = None
-    if len(sys.argv) > 1:
-        # Handle different argument formats
-        if sys.argv[1] == 'agent' and len(sys.argv) > 2:
-            server_url = sys.argv[2]
-        else:
-            server_url = sys.argv[1]
-    
-    # Create and start agent
-    agent = RemoteControlAgent(server_url)
-    agent.start()
-
-
-if __name__ == "__main__":
-    main() 
+#!/usr/bin/env python3
+"""
+University Remote Control Agent
+Zero-installation remote control for university computers.
+"""
+
+import sys
+import os
+import json
+import time
+import threading
+import base64
+import secrets
+import random
+import struct
+import http.client
+import urllib.request
+import urllib.parse
+import urllib.error
+import io
+from collections import deque
+from datetime import datetime
+
+# Try to import optional dependencies with fallbacks
+try:
+    import PIL.ImageGrab as ImageGrab
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+# Shared with the agent built into remote_control.py; keep it next to this file
+from change_detection import CHANGE_DETECTION, TILE_SIZE, ChangeDetector, scale_tiles
+
+try:
+    # WebSocket client from the server script; without it the agent stays on HTTP
+    from remote_control import (CLOCK_SYNC_INTERVAL, WebSocket, WebSocketClosed,
+                                pack_frame_message, parse_json_object)
+    HAS_WEBSOCKET = True
+except ImportError:
+    HAS_WEBSOCKET = False
+
+try:
+    # Dynamic import to avoid automatic dependency detection
+    import pynput.mouse as pynput_mouse
+    import pynput.keyboard as pynput_keyboard
+    mouse = pynput_mouse
+    keyboard = pynput_keyboard
+    HAS_PYNPUT = True
+    print("✅ pynput imported successfully")
+except ImportError as e:
+    print(f"❌ pynput import failed: {e}")
+    HAS_PYNPUT = False
+
+# Load configuration
+def load_config():
+    """Load configuration from config.json"""
+    try:
+        config_path = os.path.join(os.path.dirname(__file__), 'config.json')
+        with open(config_path, 'r') as f:
+            return json.load(f)
+    except Exception:
+        # Default configuration
+        return {
+            "server_url": "https://web-production-463b89.up.railway.app",
+            "settings": {
+                "screen_fps": 10,  # Increased from 1 to 10 FPS for better responsiveness
+                "screen_quality": 60,  # Increased quality slightly
+                "screen_width": 1280,  # Higher resolution
+                "screen_height": 720,
+                "command_check_interval": 0.05,  # Reduced from 0.1 to 0.05 (50ms)
+                "command_long_poll": 20,  # Hold command polls open on the server
+                "use_websocket": True,  # Push frames and commands over a WebSocket
+                "connection_timeout": 10,
+                "retry_delay": 1  # Reduced retry delay
+            }
+        }
+
+config = load_config()
+
+# Partial frame updates: only the TILE_SIZE tiles that changed since the
+# last keyframe are sent, and a keyframe instead once more than
+# TILE_FULL_FRAME_RATIO of the screen changed
+TILE_FULL_FRAME_RATIO = 0.5
+TILES_CONTENT_TYPE = 'application/x-frame-tiles'
+
+
+def pack_tiles(meta, tiles):
+    """Pack (x, y, w, h, jpeg) tiles into one frame message for the server
+
+    Layout: 4-byte big-endian header length, JSON header with 'tiles' as
+    [[x, y, w, h, length], ...], then the tile images back to back.
+    """
+    meta = dict(meta, tiles=[[x, y, w, h, len(data)] for x, y, w, h, data in tiles])
+    header = json.dumps(meta).encode()
+    return struct.pack('>I', len(header)) + header + b''.join(tile[4] for tile in tiles)
+
+
+class ClockOffset:
+    """Estimate how far the server's clock is ahead of ours
+
+    NTP-style samples (t0/t3 on our clock, t1/t2 on the server's); the one
+    with the shortest round trip among the last few is trusted.
+    """
+
+    def __init__(self):
+        self.samples = deque(maxlen=8)
+        self.offset = 0.0
+
+    def add(self, t0, t1, t3, t2=None):
+        """Add a sample; all times in milliseconds"""
+        t2 = t1 if t2 is None else t2
+        self.samples.append(((t3 - t0) - (t2 - t1), ((t1 - t0) + (t2 - t3)) / 2))
+        self.offset = min(self.samples)[1]
+
+    def server_time(self):
+        """Now on the server's clock, in milliseconds"""
+        return time.time() * 1000 + self.offset
+
+
+class RemoteControlAgent:
+    """Remote Control Agent for University Computers"""
+    
+    def __init__(self, server_url=None):
+        self.server_url = (server_url or config.get('server_url')).rstrip('/')
+        self.session_id = None
+        self.running = False
+        self.settings = config.get('settings', {})
+        self.last_screen_time = 0
+        self.command_queue = []
+        self.ws = None  # Open WebSocket to the server, None while on HTTP
+        self.change_detector = ChangeDetector(self.settings.get('change_detection', CHANGE_DETECTION))
+        self.binary_upload = True  # Cleared when the server lacks POST /api/screen/<id>
+        self.tile_updates = False  # Set when the server takes partial frame updates
+        self.tile_size = self.settings.get('tile_size', TILE_SIZE)
+        self.frame_size = None  # Size of the last keyframe sent
+        self.frame_key = None  # Our name for the last keyframe sent
+        self.tile_area = 0  # Pixels sent as tiles since that keyframe
+        self.need_keyframe = True  # The server may not have our last frame
+
+        # Persistent HTTP connections, one per thread (see http_request)
+        parsed = urllib.parse.urlsplit(self.server_url)
+        self.http_connection_class = (http.client.HTTPSConnection if parsed.scheme == 'https'
+                                      else http.client.HTTPConnection)
+        self.http_host = parsed.netloc
+        self.http_base_path = parsed.path
+        self.http_proxied = (parsed.scheme in urllib.request.getproxies()
+                             and not urllib.request.proxy_bypass(parsed.hostname or ''))
+        self.http_local = threading.local()
+        self.throttled_until = 0  # Server asked us to hold frames back until then
+        self.clock = ClockOffset()  # Our clock against the server's, for latency traces
+        self.next_clock_sync = 0
+        self.traces = deque(maxlen=32)  # Executed commands awaiting a frame
+        self.trace_lock = threading.Lock()
+
+    def start(self):
+        """Start the remote control agent"""
+        print("University Remote Control Agent Starting...")
+        print(f"Server: {self.server_url}")
+        print(f"PIL Available: {HAS_PIL}")
+        print(f"Input Control: {HAS_PYNPUT}")
+        print(f"WebSocket Available: {HAS_WEBSOCKET}")
+        
+        if not self.register():
+            print("FAILED to register with server")
+            return
+        
+        print()
+        print("=" * 60)
+        print(f"SUCCESS! Agent Active! Session ID: {self.session_id}")
+        print("=" * 60)
+        print("COPY THIS SESSION ID TO YOUR CONTROLLER!")
+        print(f"Session ID: {self.session_id}")
+        print(f"Controller URL: {self.server_url}")
+        print("=" * 60)
+        print()
+        print("Agent is running... Press Ctrl+C to stop")
+        
+        self.running = True
+        
+        # Start background threads for screen capture and command processing
+        if HAS_WEBSOCKET and self.settings.get('use_websocket', True):
+            ws_thread = threading.Thread(target=self.websocket_loop, daemon=True)
+            ws_thread.start()
+        
+        if HAS_PIL:
+            screen_thread = threading.Thread(target=self.screen_capture_loop, daemon=True)
+            screen_thread.start()
+        
+        if HAS_PYNPUT:
+            command_thread = threading.Thread(target=self.command_loop, daemon=True)
+            command_thread.start()
+        
+        try:
+            while self.running:
+                time.sleep(1)
+                self.heartbeat()
+        except KeyboardInterrupt:
+            print("\n🛑 Agent stopped by user")
+            self.running = False
+
+    def heartbeat(self):
+        """Resample the clock offset over the WebSocket every CLOCK_SYNC_INTERVAL"""
+        ws = self.ws
+        if ws is None or time.time() < self.next_clock_sync:
+            return  # Over HTTP every command poll is a sample
+        self.next_clock_sync = time.time() + CLOCK_SYNC_INTERVAL
+        try:
+            ws.send_text(json.dumps({'type': 'clock', 'clientTime': time.time() * 1000}))
+        except (WebSocketClosed, OSError):
+            pass
+
+    def register(self):
+        """Register agent with server and get session ID"""
+        # Prepare registration data
+        data = {
+            'platform': sys.platform,
+            'python_version': sys.version.split()[0],
+            'has_pil': HAS_PIL,
+            'has_pynput': HAS_PYNPUT,
+            'timestamp': datetime.now().isoformat(),
+            'agent_type': 'university'
+        }
+        
+        try:
+            # Try to register with server
+            print("📝 Registering with server...")
+            sent = time.time() * 1000
+            response = self.http_post('/api/register', data)
+            if response and 'sessionId' in response:
+                self.session_id = response['sessionId']
+                if 'serverTime' in response:
+                    self.clock.add(sent, response['serverTime'], time.time() * 1000)
+                self.tile_updates = ('tiles' in response.get('features', [])
+                                     and self.settings.get('tile_updates', True))
+                print("✅ Server registration successful")
+                return True
+        except Exception as e:
+            print(f"⚠️ Server registration failed: {e}")
+        
+        # Fallback - generate local session ID
+        try:
+            self.session_id = secrets.token_hex(4).upper()
+            print("⚠️ Using local session ID (server unavailable)")
+            return True
+        except:
+            import random
+            self.session_id = f"{random.randint(1000, 9999):04d}"
+            print("⚠️ Using random session ID (crypto unavailable)")
+            return True 
+            print("⚠️ Using random session ID (crypto unavailable)")
+            return True
+
+    def screen_capture_loop(self):
+        """Continuously capture and send screen updates"""
+        fps_delay = 1.0 / self.settings.get('screen_fps', 10)
+        
+        while self.running:
+            try:
+                current_time = time.time()
+                if current_time < self.throttled_until:
+                    time.sleep(0.1)  # Over the server's rate limit
+                    continue
+                if current_time - self.last_screen_time >= fps_delay:
+                    # Commands run before the grab are echoed in this frame;
+                    # if it is unchanged they had no visible effect to time
+                    traces = self.take_traces()
+                    timings = {}
+                    screen_data = self.capture_screen(timings)
+                    trace = dict(timings, commands=traces) if traces else None
+                    if isinstance(screen_data, list):
+                        sent = not screen_data or self.send_tiles(screen_data, trace)
+                    else:
+                        sent = not screen_data or self.send_screen(screen_data, trace)
+                    if not sent:
+                        # The server missed a frame the next tiles would build on
+                        self.need_keyframe = True
+                    self.last_screen_time = current_time
+                time.sleep(0.01)  # Reduced sleep time for better responsiveness
+            except Exception as e:
+                print(f"Screen capture error: {e}")
+                time.sleep(self.settings.get('retry_delay', 1))
+
+    def command_loop(self):
+        """Continuously check for and execute remote commands"""
+        check_interval = self.settings.get('command_check_interval', 0.1)
+        long_poll = self.settings.get('command_long_poll', 20)
+        failures = 0  # Polls failed in a row
+        
+        while self.running:
+            try:
+                if self.ws is not None:
+                    # Commands are pushed over the WebSocket
+                    time.sleep(0.5)
+                    continue
+                started = time.time()
+                try:
+                    commands = self.get_commands(long_poll)
+                except Exception as e:
+                    failures += 1
+                    delay = self.poll_backoff(e, failures)
+                    print(f"Command poll failed ({e}), retrying in {delay:.1f}s")
+                    time.sleep(delay)
+                    continue
+                failures = 0
+                if commands:
+                    print(f"Received {len(commands)} commands")
+                self.run_commands(commands)
+                # An empty answer that came back straight away means long
+                # polling is off or the server does not support it
+                if not commands and (not long_poll or time.time() - started < long_poll / 2):
+                    time.sleep(check_interval)
+            except Exception as e:
+                print(f"Command loop error: {e}")
+                time.sleep(self.settings.get('retry_delay', 2))
+
+    def websocket_loop(self):
+        """Keep a WebSocket open for frames and commands, reconnecting with backoff"""
+        url = f"{self.server_url}/ws/agent/{self.session_id}"
+        retry_delay = self.settings.get('retry_delay', 1)
+        backoff = retry_delay
+        
+        while self.running:
+            try:
+                ws = WebSocket.connect(url, timeout=self.settings.get('connection_timeout', 10))
+            except Exception:
+                # Server without WebSocket support or blocked by a proxy: stay on HTTP
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 60)
+                continue
+            
+            backoff = retry_delay
+            self.ws = ws
+            self.next_clock_sync = 0
+            print("🔌 WebSocket connected")
+            try:
+                while self.running:
+                    opcode, payload = ws.recv()
+                    if opcode != WebSocket.OP_TEXT:
+                        continue
+                    message = parse_json_object(payload)
+                    if message.get('type') == 'commands':
+                        commands = message.get('commands', [])
+                        if commands:
+                            print(f"Received {len(commands)} commands")
+                        self.run_commands(commands)
+                    elif message.get('type') == 'throttle':
+                        # The frame was dropped, so tiles have nothing to build on
+                        self.throttled_until = time.time() + message.get('retryAfter', 1)
+                        self.need_keyframe = True
+                    elif message.get('type') == 'keyframe':
+                        self.need_keyframe = True
+                    elif message.get('type') == 'clock' and message.get('clientTime'):
+                        self.clock.add(message['clientTime'], message['serverTime'], time.time() * 1000)
+            except (WebSocketClosed, OSError, ValueError, TypeError, AttributeError):
+                pass
+            finally:
+                self.ws = None
+                ws.close()
+            print("🔌 WebSocket closed, using HTTP")
+            time.sleep(retry_delay)
+
+    def capture_screen(self, timings=None):
+        """Capture screen using PIL with optimization; fills timings with capturedAt/encodedAt
+
+        Returns a JPEG keyframe, or with tile updates on a list of changed
+        (x, y, w, h, jpeg) tiles; None when nothing changed.
+        """
+        if not HAS_PIL:
+            return None
+        timings = {} if timings is None else timings
+            
+        try:
+            screenshot = ImageGrab.grab()
+            timings['capturedAt'] = self.clock.server_time()
+            
+            # Find what changed on the raw capture, before the costly resize
+            changed = self.change_detector.update(screenshot)
+            
+            # Only process if screen changed
+            if changed == [] and not self.need_keyframe:
+                return None  # No change, skip this frame
+            
+            # Resize for performance with better settings
+            width = self.settings.get('screen_width', 1280)
+            height = self.settings.get('screen_height', 720)
+            resample = Image.LANCZOS if hasattr(Image, 'LANCZOS') else 1
+            quality = self.settings.get('screen_quality', 60)
+            
+            rects = self.changed_tiles(changed, screenshot.size, (width, height))
+            if rects is not None:
+                # Resize only the changed tiles; a box keeps them identical
+                # to the same region of a whole resized frame
+                scale_x, scale_y = screenshot.width / width, screenshot.height / height
+                tiles = [(x, y, w, h, self.encode_jpeg(screenshot.resize(
+                             (w, h), resample, box=(x * scale_x, y * scale_y,
+                                                    (x + w) * scale_x, (y + h) * scale_y)), quality))
+                         for x, y, w, h in rects]
+                timings['encodedAt'] = self.clock.server_time()
+                return tiles
+            
+            # Convert to JPEG with optimizations
+            screenshot = screenshot.resize((width, height), resample)
+            image = self.encode_jpeg(screenshot, quality)
+            timings['encodedAt'] = self.clock.server_time()
+            self.frame_key = secrets.token_hex(8)
+            self.frame_size = (width, height)
+            self.tile_area = 0
+            self.need_keyframe = False
+            return image
+        except Exception as e:
+            print(f"Screen capture error: {e}")
+            return None
+
+    def changed_tiles(self, changed, source, size):
+        """Tiles of the resized frame to send, or None when a keyframe is due
+
+        changed are the rectangles that changed in the capture of the given
+        source size. A keyframe is due without tile support, when the server
+        may lack our last frame, when the frame size changed, when over
+        TILE_FULL_FRAME_RATIO of the screen changed, or once the tiles since
+        the last keyframe add up to a whole screen, so a viewer joining late
+        never downloads more than about two frames.
+        """
+        if not self.tile_updates or changed is None or self.need_keyframe or size != self.frame_size:
+            return None
+        rects = scale_tiles(changed, source, size, self.tile_size)
+        width, height = size
+        area = sum(w * h for _, _, w, h in rects)
+        if area > TILE_FULL_FRAME_RATIO * width * height or self.tile_area + area > width * height:
+            return None
+        self.tile_area += area
+        return rects
+
+    def encode_jpeg(self, image, quality):
+        """JPEG bytes of a PIL image"""
+        buffer = io.BytesIO()
+        image.save(buffer, format='JPEG', quality=quality, optimize=True)
+        return buffer.getvalue()
+
+    def send_screen(self, screen_data, trace=None):
+        """Send a JPEG keyframe over the WebSocket when open, else over HTTP; False if it failed"""
+        timestamp = int(time.time() * 1000)
+        ws = self.ws
+        if ws is not None:
+            meta = {'timestamp': timestamp, 'key': self.frame_key}
+            if trace:
+                meta['trace'] = trace
+            try:
+                ws.send(pack_frame_message(meta, screen_data))
+                return True
+            except (WebSocketClosed, OSError):
+                self.ws = None
+        
+        if self.binary_upload:
+            headers = {'X-Frame-Timestamp': str(timestamp)}
+            if self.frame_key:
+                headers['X-Frame-Key'] = self.frame_key
+            if trace:
+                headers['X-Frame-Trace'] = json.dumps(trace)
+            try:
+                self.http_post_bytes(f'/api/screen/{self.session_id}', screen_data,
+                                     'image/jpeg', headers)
+                return True
+            except urllib.error.HTTPError as e:
+                if e.code == 429:
+                    self.throttled_until = time.time() + float(e.headers.get('Retry-After') or 1)
+                if e.code != 404:
+                    return False
+                # Older server: fall back to base64 JSON uploads
+                self.binary_upload = False
+            except Exception:
+                return False
+        
+        data = {
+            'sessionId': self.session_id,
+            'data': base64.b64encode(screen_data).decode(),
+            'timestamp': timestamp
+        }
+        if trace:
+            data['trace'] = trace
+        
+        try:
+            self.http_post('/api/screen', data)
+            return True
+        except Exception as e:
+            # Don't spam console with screen upload errors
+            return False
+
+    def send_tiles(self, tiles, trace=None):
+        """Send changed tiles of the last keyframe, over the WebSocket when open; False if it failed"""
+        meta = {'timestamp': int(time.time() * 1000), 'key': self.frame_key,
+                'size': list(self.frame_size)}
+        if trace:
+            meta['trace'] = trace
+        message = pack_tiles(meta, tiles)
+        ws = self.ws
+        if ws is not None:
+            try:
+                ws.send(message)
+                return True
+            except (WebSocketClosed, OSError):
+                self.ws = None
+        
+        try:
+            self.http_post_bytes(f'/api/screen/{self.session_id}', message, TILES_CONTENT_TYPE)
+            return True
+        except urllib.error.HTTPError as e:
+            if e.code == 429:
+                self.throttled_until = time.time() + float(e.headers.get('Retry-After') or 1)
+            return False  # 409: the server wants a new keyframe
+        except Exception:
+            return False
+
+    def poll_backoff(self, error, failures):
+        """Seconds to wait after the given number of failed command polls in a row
+
+        A 429 or 503 names its wait in Retry-After; other failures back off
+        exponentially from retry_delay up to a minute. Up to half as much
+        again is added at random, so a fleet of agents does not come back
+        at the same moment.
+        """
+        delay = None
+        if isinstance(error, urllib.error.HTTPError) and error.headers is not None:
+            try:
+                delay = float(error.headers.get('Retry-After'))
+            except (TypeError, ValueError):
+                pass
+        if delay is None:
+            delay = min(self.settings.get('retry_delay', 2) * 2 ** (failures - 1), 60)
+        return delay * random.uniform(1, 1.5)
+
+    def get_commands(self, wait=0):
+        """Get pending commands from server, long-polling for up to wait seconds
+
+        A failed poll raises, urllib.error.HTTPError for an error status, so
+        the caller can back off instead of polling again straight away.
+        """
+        if wait:
+            timeout = wait + self.settings.get('connection_timeout', 10)
+            response = self.http_get(f'/api/commands/{self.session_id}?wait={wait}', timeout)
+        else:
+            response = self.http_get(f'/api/commands/{self.session_id}')
+        return response if isinstance(response, list) else []
+
+    def run_commands(self, commands):
+        """Execute commands, keeping traced ones for the next captured frame"""
+        received = self.clock.server_time()
+        for command in commands:
+            print(f"Executing command: {command}")
+            self.execute_command(command)
+            if command.get('seq') is None:
+                continue
+            with self.trace_lock:
+                self.traces.append({
+                    'seq': command['seq'],
+                    'sentAt': command.get('sentAt'),
+                    'queuedAt': command.get('timestamp'),
+                    'deliveredAt': command.get('deliveredAt'),
+                    'receivedAt': received,
+                    'executedAt': self.clock.server_time()
+                })
+
+    def take_traces(self):
+        """Remove and return the traces waiting for a frame"""
+        with self.trace_lock:
+            traces = list(self.traces)
+            self.traces.clear()
+        return traces
+
+    def execute_command(self, command):
+        """Execute a remote command"""
+        if not HAS_PYNPUT:
+            return
+            
+        try:
+            cmd_type = command.get('type')
+            
+            if cmd_type == 'mouse':
+                self.handle_mouse_command(command)
+            elif cmd_type == 'keyboard':
+                self.handle_keyboard_command(command)
+            elif cmd_type == 'special':
+                self.handle_special_command(command)
+        except Exception as e:
+            print(f"Command execution error: {e}")
+
+    def handle_mouse_command(self, command):
+        """Handle mouse commands using pynput"""
+        try:
+            print(f"Handling mouse command: {command}")
+            
+            # Get actual screen dimensions
+            if HAS_PIL:
+                from PIL import ImageGrab
+                screen = ImageGrab.grab()
+                screen_width, screen_height = screen.size
+            else:
+                # Fallback to common resolution
+                screen_width, screen_height = 1920, 1080
+            
+            # Convert relative coordinates (0-1) to actual screen pixels
+            x = int(command.get('x', 0) * screen_width)
+            y = int(command.get('y', 0) * screen_height)
+            
+            # Ensure coordinates are within screen bounds
+            x = max(0, min(x, screen_width - 1))
+            y = max(0, min(y, screen_height - 1))
+            
+            mouse_controller = mouse.Controller()
+            
+            action = command.get('action')
+            if action == 'move':
+                mouse_controller.position = (x, y)
+                print(f"Mouse moved to ({x}, {y}) on {screen_width}x{screen_height} screen")
+            elif action == 'click':
+                mouse_controller.position = (x, y)
+                button = mouse.Button.right if command.get('button') == 'right' else mouse.Button.left
+                mouse_controller.click(button)
+                print(f"Mouse clicked at ({x}, {y}) with {button} on {screen_width}x{screen_height} screen")
+            elif action == 'scroll':
+                dy = command.get('deltaY', 0)
+                mouse_controller.scroll(0, -dy // 120)  # Convert to scroll units
+                print(f"Mouse scrolled: {dy}")
+        except Exception as e:
+            print(f"Mouse command error: {e}")
+
+    def handle_keyboard_command(self, command):
+        """Handle keyboard commands using pynput"""
+        try:
+            key_controller = keyboard.Controller()
+            key = command.get('key', '')
+            
+            # Map special keys
+            key_map = {
+                'Enter': keyboard.Key.enter,
+                'Escape': keyboard.Key.esc,
+                'Backspace': keyboard.Key.backspace,
+                'Tab': keyboard.Key.tab,
+                'ArrowUp': keyboard.Key.up,
+                'ArrowDown': keyboard.Key.down,
+                'ArrowLeft': keyboard.Key.left,
+                'ArrowRight': keyboard.Key.right,
+                'Delete': keyboard.Key.delete,
+                'Home': keyboard.Key.home,
+                'End': keyboard.Key.end,
+                'PageUp': keyboard.Key.page_up,
+                'PageDown': keyboard.Key.page_down,
+            }
+            
+            if command.get('action') == 'keydown':
+                if key in key_map:
+                    key_controller.press(key_map[key])
+                elif len(key) == 1:
+                    key_controller.press(key)
+            elif command.get('action') == 'keyup':
+                if key in key_map:
+                    key_controller.release(key_map[key])
+                elif len(key) == 1:
+                    key_controller.release(key)
+            elif command.get('action') == 'type':
+                key_controller.type(key)
+        except Exception as e:
+            print(f"Keyboard command error: {e}")
+
+    def handle_special_command(self, command):
+        """Handle special system commands"""
+        action = command.get('action')
+        if action == 'ctrl-alt-del':
+            print("⚠️ Ctrl+Alt+Del requested (not implemented for security)")
+        elif action == 'alt-tab':
+            try:
+                key_controller = keyboard.Controller()
+                key_controller.press(keyboard.Key.alt)
+                key_controller.press(keyboard.Key.tab)
+                key_controller.release(keyboard.Key.tab)
+                key_controller.release(keyboard.Key.alt)
+            except:
+                pass
+        else:
+            print(f"Special command: {action}")
+
+    def http_request(self, method, path, body=None, headers=None, timeout=None):
+        """Send one request and return (headers, body), reusing this thread's connection
+
+        urllib opens a new TCP (and TLS) connection for every request; a
+        persistent http.client connection per thread saves that on every
+        frame upload and command poll. A reused connection the server has
+        since closed is retried once on a fresh one. Behind a proxy urllib
+        is kept, since it knows the proxy settings. HTTP errors raise
+        urllib.error.HTTPError either way.
+        """
+        timeout = timeout or self.settings.get('connection_timeout', 10)
+        url = f"{self.server_url}{path}"
+        if self.http_proxied:
+            req = urllib.request.Request(url, data=body, headers=headers or {}, method=method)
+            with urllib.request.urlopen(req, timeout=timeout) as response:
+                return response.headers, response.read()
+        
+        while True:
+            conn = getattr(self.http_local, 'conn', None)
+            reused = conn is not None
+            if conn is None:
+                conn = self.http_connection_class(self.http_host, timeout=timeout)
+                self.http_local.conn = conn
+            try:
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                conn.request(method, self.http_base_path + path, body=body, headers=headers or {})
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                self.http_local.conn = None
+                if reused and isinstance(e, (ConnectionError, http.client.BadStatusLine)):
+                    continue  # The server closed the idle connection
+                raise
+            if response.will_close:
+                conn.close()
+                self.http_local.conn = None
+            if response.status >= 400:
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+            return response.headers, data
+
+    def http_get(self, path, timeout=None):
+        """Make HTTP GET request"""
+        try:
+            sent = time.time() * 1000
+            headers, body = self.http_request('GET', path, timeout=timeout)
+            # Command polls carry the server's clock: each one is an offset sample
+            served = headers.get('X-Server-Time')
+            if served:
+                self.clock.add(sent, float(headers.get('X-Server-Received', served)),
+                               time.time() * 1000, float(served))
+            return json.loads(body.decode())
+        except urllib.error.HTTPError:
+            raise  # Callers look at the status and Retry-After
+        except Exception as e:
+            raise Exception(f"GET {path} failed: {e}")
+
+    def http_post_bytes(self, path, body, content_type, headers=None):
+        """POST a raw body; HTTP errors propagate so callers can check the status"""
+        _, data = self.http_request('POST', path, body,
+                                    {'Content-Type': content_type, **(headers or {})})
+        return json.loads(data.decode())
+
+    def http_post(self, path, data):
+        """Make HTTP POST request"""
+        try:
+            _, body = self.http_request('POST', path, json.dumps(data).encode(),
+                                        {'Content-Type': 'application/json'})
+            return json.loads(body.decode())
+        except Exception as e:
+            raise Exception(f"POST {path} failed: {e}")
+
+
+def main():
+    """Main entry point"""
+    print("University Remote Control Agent v1.0")
+    print("Zero-installation remote access for university computers")
+    print("=" * 60)
+    
+    # Check for server URL argument
+    server_url = None
+    if len(sys.argv) > 1:
+        # Handle different argument formats
+        if sys.argv[1] == 'agent' and len(sys.argv) > 2:
+            server_url = sys.argv[2]
+        else:
+            server_url = sys.argv[1]
+    
+    # Create and start agent
+    agent = RemoteControlAgent(server_url)
+    agent.start()
+
+
+if __name__ == "__main__":
+    main() 
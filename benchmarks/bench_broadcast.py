@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Frame broadcast benchmark
+Measures server CPU per frame as the number of push viewers of one session
+grows, with each frame encoded once and shared by every viewer versus
+encoded again for every viewer.
+
+The server runs in a child process so its CPU time is measured on its own;
+the viewers (WebSocket or MJPEG) run as threads in this process. Frames are
+stored straight into the session store at --fps, so the figure is the cost
+of fanning a frame out, not of receiving it.
+
+Usage:
+    python benchmarks/bench_broadcast.py [--viewers 1,5,10,25,50] [--frames 60]
+                                         [--fps 15] [--frame-kb 100]
+                                         [--transport ws]
+"""
+
+import argparse
+import multiprocessing
+import os
+import socket
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from remote_control import MJPEG_BOUNDARY, RemoteControlServer, WebSocket, WebSocketClosed
+
+
+class UnsharedServer(RemoteControlServer):
+    """Encodes every frame separately for every viewer"""
+
+    def encoded_frame(self, screen_info, transport):
+        return self.encode_frame(screen_info, transport)
+
+
+def serve(conn, shared):
+    """Child process: run a server and store frames when asked"""
+    server = (RemoteControlServer if shared else UnsharedServer)(port=0)
+    httpd = server.create_httpd('127.0.0.1')
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    session_id = server.store.register_session({'platform': 'bench'})
+    # Every viewer is primed with this frame as it connects
+    server.store.store_screen(session_id, os.urandom(1024))
+    conn.send((httpd.server_address[1], session_id))
+
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        frames, fps, frame_kb = message
+        image = os.urandom(frame_kb * 1024)
+        started = time.process_time()
+        for _ in range(frames):
+            server.store.store_screen(session_id, image)
+            time.sleep(1.0 / fps)
+        time.sleep(0.5)  # Let the viewers drain the last frame
+        conn.send(time.process_time() - started)
+    httpd.shutdown()
+
+
+def ws_viewer(port, session_id, connected, counts):
+    """Receive frames over the control WebSocket until it closes"""
+    ws = WebSocket.connect(f'ws://127.0.0.1:{port}/ws/control/{session_id}')
+    connected.append(ws.close)
+    frames = 0
+    try:
+        while True:
+            opcode, _ = ws.recv()
+            if opcode == WebSocket.OP_BINARY:
+                frames += 1
+    except (WebSocketClosed, OSError):
+        pass
+    counts.append(frames)
+
+
+def mjpeg_viewer(port, session_id, connected, counts):
+    """Read the MJPEG stream until it closes, counting parts"""
+    sock = socket.create_connection(('127.0.0.1', port), timeout=30)
+    sock.sendall(f'GET /api/stream/{session_id} HTTP/1.0\r\n\r\n'.encode())
+    # shutdown() rather than close() so the blocked recv() returns
+    connected.append(lambda: sock.shutdown(socket.SHUT_RDWR))
+    marker = f'--{MJPEG_BOUNDARY}\r\n'.encode()
+    frames = 0
+    tail = b''
+    try:
+        while True:
+            chunk = sock.recv(262144)
+            if not chunk:
+                break
+            data = tail + chunk
+            frames += data.count(marker)
+            tail = data[-(len(marker) - 1):]
+    except OSError:
+        pass
+    sock.close()
+    counts.append(frames)
+
+
+def run(conn, port, session_id, viewers, args):
+    """Broadcast --frames frames to N viewers; returns (CPU seconds, frames per viewer)"""
+    viewer = ws_viewer if args.transport == 'ws' else mjpeg_viewer
+    connected, counts = [], []
+    threads = [threading.Thread(target=viewer, args=(port, session_id, connected, counts),
+                                daemon=True)
+               for _ in range(viewers)]
+    for thread in threads:
+        thread.start()
+    while len(connected) < viewers:
+        time.sleep(0.01)
+    time.sleep(0.2)  # Primed frames go out before the clock starts
+
+    conn.send((args.frames, args.fps, args.frame_kb))
+    cpu = conn.recv()
+
+    for close in connected:
+        close()
+    for thread in threads:
+        thread.join(timeout=10)
+    time.sleep(0.2)  # Let the server notice the viewers left
+    # Every viewer also got the primed frame
+    return cpu, (sum(counts) - viewers) / viewers
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark frame fan-out to push viewers')
+    parser.add_argument('--viewers', default='1,5,10,25,50')
+    parser.add_argument('--frames', type=int, default=60)
+    parser.add_argument('--fps', type=float, default=15)
+    parser.add_argument('--frame-kb', type=int, default=100)
+    parser.add_argument('--transport', choices=['ws', 'mjpeg'], default='ws')
+    args = parser.parse_args()
+
+    print(f"{'viewers':>7} {'mode':>8} {'CPU ms/frame':>13} {'us/frame/viewer':>16} {'delivered':>10}")
+    for shared in (False, True):
+        conn, child_conn = multiprocessing.Pipe()
+        child = multiprocessing.Process(target=serve, args=(child_conn, shared), daemon=True)
+        child.start()
+        port, session_id = conn.recv()
+        for viewers in [int(v) for v in args.viewers.split(',')]:
+            cpu, delivered = run(conn, port, session_id, viewers, args)
+            per_frame = cpu / args.frames
+            print(f"{viewers:>7} {'shared' if shared else 'per-view':>8} {per_frame * 1000:>13.3f} "
+                  f"{per_frame / viewers * 1e6:>16.1f} {delivered / args.frames:>9.0%}")
+        conn.send(None)
+        child.join(timeout=10)
+
+
+if __name__ == '__main__':
+    main()
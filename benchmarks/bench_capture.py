@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Capture pipeline benchmark
+Runs the agent's capture path - grab, md5 of tobytes(), resize, JPEG encode
+and base64 - on a synthetic screen corpus and reports the time, Python
+allocations and output size of every stage for each combination of
+resolution, resize filter and JPEG quality.
+
+No display is needed. The corpus is drawn with PIL from a fixed seed:
+  desktop    wallpaper, windows and icons; only the cursor moves
+  ide        dark editor full of code; one line changes per frame
+  video      noisy full-screen content that changes every pixel
+  scrolling  a long page of text and pictures scrolled per frame
+--images DIR adds every image in DIR as a scene of its own.
+
+"grab" times Image.frombytes() on the raw pixels, which is the part of
+ImageGrab.grab() that is not the OS screen copy. base64 is only paid by the
+JSON upload fallback; binary uploads skip it. Allocations are the
+tracemalloc peak per frame, so they count Python objects such as the
+tobytes() copy and the encoded buffers, not PIL's own pixel storage.
+
+Usage:
+    python benchmarks/bench_capture.py [--source 1920x1080] [--frames 4]
+                                       [--resolutions 1280x720,1920x1080]
+                                       [--filters lanczos,bilinear]
+                                       [--qualities 50,70,85] [--optimize on]
+                                       [--repeat 3] [--images DIR] [--json FILE]
+"""
+
+import argparse
+import base64
+import hashlib
+import io
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+try:
+    from PIL import Image, ImageDraw
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+STAGES = ('grab', 'md5', 'resize', 'jpeg', 'b64')
+WORDS = ('def', 'return', 'self', 'import', 'for', 'in', 'if', 'else', 'while', 'class',
+         'session_id', 'frame', 'buffer', 'quality', '=', '(', ')', ':', '+', '0', '1', "'ok'")
+
+
+def parse_size(text):
+    """'1280x720' -> (1280, 720)"""
+    width, height = text.lower().split('x')
+    return int(width), int(height)
+
+
+def median(values):
+    ordered = sorted(values)
+    return ordered[len(ordered) // 2] if ordered else 0.0
+
+
+def draw_text_lines(draw, rng, left, top, width, bottom, line_height, colors):
+    """Fill a box with lines of pseudo-code in random token colors"""
+    y = top
+    while y + line_height < bottom:
+        x = left + rng.randrange(0, 6) * 16
+        while x < left + width - 80 and rng.random() < 0.85:
+            word = rng.choice(WORDS)
+            draw.text((x, y), word, fill=rng.choice(colors))
+            x += 7 * len(word) + 7
+        y += line_height
+
+
+def scene_desktop(size, frames, rng):
+    """Wallpaper, taskbar, windows and icons; only the cursor moves"""
+    width, height = size
+    red = Image.linear_gradient('L').resize(size)
+    green = Image.linear_gradient('L').rotate(90).resize(size)
+    base = Image.merge('RGB', (red, green, Image.new('L', size, 150)))
+    draw = ImageDraw.Draw(base)
+    draw.rectangle((0, height - 40, width, height), fill=(32, 32, 40))
+    for i in range(12):
+        x, y = 24, 24 + i * 80
+        draw.rectangle((x, y, x + 48, y + 48), fill=(rng.randrange(256), rng.randrange(256), 200))
+    for i in range(3):
+        left, top = 160 + i * width // 5, 80 + i * 90
+        right, bottom = left + width // 2, top + height // 2
+        draw.rectangle((left, top, right, bottom), fill=(245, 245, 245), outline=(90, 90, 90))
+        draw.rectangle((left, top, right, top + 28), fill=(60, 90, 160))
+        draw_text_lines(draw, rng, left + 12, top + 40, right - left - 24, bottom - 8, 18,
+                        [(20, 20, 20), (80, 80, 80)])
+    result = []
+    for n in range(frames):
+        frame = base.copy()
+        x, y = width // 3 + n * 37, height // 3 + n * 23
+        ImageDraw.Draw(frame).polygon([(x, y), (x, y + 20), (x + 6, y + 15), (x + 14, y + 14)],
+                                      fill=(255, 255, 255), outline=(0, 0, 0))
+        result.append(frame)
+    return result
+
+
+def scene_ide(size, frames, rng):
+    """Dark editor full of code; one line changes per frame"""
+    width, height = size
+    base = Image.new('RGB', size, (30, 30, 30))
+    draw = ImageDraw.Draw(base)
+    draw.rectangle((0, 0, 260, height), fill=(37, 37, 38))
+    draw_text_lines(draw, rng, 12, 12, 240, height, 22, [(200, 200, 200)])
+    draw_text_lines(draw, rng, 300, 12, width - 320, height - 24, 18,
+                    [(86, 156, 214), (206, 145, 120), (220, 220, 170), (212, 212, 212), (106, 153, 85)])
+    result = []
+    for n in range(frames):
+        frame = base.copy()
+        y = 12 + (n * 7 % 40) * 18
+        frame_draw = ImageDraw.Draw(frame)
+        frame_draw.rectangle((300, y, width - 20, y + 17), fill=(30, 30, 30))
+        draw_text_lines(frame_draw, rng, 300, y, width - 320, y + 19, 18, [(212, 212, 212)])
+        result.append(frame)
+    return result
+
+
+def scene_video(size, frames, rng):
+    """Blotchy colour noise that changes every pixel of every frame"""
+    width, height = size
+    result = []
+    for n in range(frames):
+        channels = [Image.effect_noise((width // 8, height // 8), 60 + 10 * c).resize(size, Image.BICUBIC)
+                    for c in range(3)]
+        frame = Image.merge('RGB', channels)
+        fine = Image.effect_noise(size, 12).convert('RGB')
+        result.append(Image.blend(frame, fine, 0.2))
+    return result
+
+
+def scene_scrolling(size, frames, rng):
+    """A long page of paragraphs and pictures, scrolled 120 pixels per frame"""
+    width, height = size
+    step = 120
+    page = Image.new('RGB', (width, height + step * frames), (255, 255, 255))
+    draw = ImageDraw.Draw(page)
+    y = 20
+    while y < page.height:
+        if rng.random() < 0.3:
+            color = (rng.randrange(256), rng.randrange(256), rng.randrange(256))
+            picture = Image.linear_gradient('L').resize((width // 2, 200))
+            page.paste(Image.merge('RGB', (picture, Image.new('L', picture.size, color[1]),
+                                           Image.new('L', picture.size, color[2]))),
+                       (width // 4, y))
+            y += 220
+        else:
+            draw_text_lines(draw, rng, width // 6, y, width * 2 // 3, y + 120, 20, [(30, 30, 30)])
+            y += 140
+    return [page.crop((0, n * step, width, n * step + height)) for n in range(frames)]
+
+
+SCENES = {
+    'desktop': scene_desktop,
+    'ide': scene_ide,
+    'video': scene_video,
+    'scrolling': scene_scrolling,
+}
+
+FILTERS = {
+    'nearest': 'NEAREST',
+    'bilinear': 'BILINEAR',
+    'bicubic': 'BICUBIC',
+    'lanczos': 'LANCZOS',
+}
+
+
+def load_images(directory, size):
+    """Every image file in directory as a one-frame scene, scaled to the source size"""
+    scenes = {}
+    for name in sorted(os.listdir(directory)):
+        path = os.path.join(directory, name)
+        try:
+            with Image.open(path) as image:
+                scenes[os.path.splitext(name)[0]] = [image.convert('RGB').resize(size)]
+        except (OSError, ValueError):
+            continue
+    return scenes
+
+
+def run_stages(raw, size, mode, resolution, resample, quality, optimize, timings=None):
+    """One pass of the capture pipeline; returns the encoded JPEG size"""
+    clock = time.perf_counter
+    marks = [clock()]
+    image = Image.frombytes(mode, size, raw)
+    marks.append(clock())
+    hashlib.md5(image.tobytes()).hexdigest()
+    marks.append(clock())
+    image = image.resize(resolution, resample)
+    marks.append(clock())
+    buffer = io.BytesIO()
+    image.save(buffer, format='JPEG', quality=quality, optimize=optimize)
+    jpeg = buffer.getvalue()
+    marks.append(clock())
+    base64.b64encode(jpeg).decode()
+    marks.append(clock())
+    if timings is not None:
+        for stage, start, end in zip(STAGES, marks, marks[1:]):
+            timings[stage].append(end - start)
+    return len(jpeg)
+
+
+def measure_allocations(raw, size, mode, resolution, resample, quality, optimize):
+    """tracemalloc peak in bytes for each stage of one pass"""
+    peaks = {}
+    tracemalloc.start()
+    try:
+        def stage(name, func, *args):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            result = func(*args)
+            peaks[name] = max(0, tracemalloc.get_traced_memory()[1] - before)
+            return result
+
+        image = stage('grab', Image.frombytes, mode, size, raw)
+        stage('md5', lambda: hashlib.md5(image.tobytes()).hexdigest())
+        image = stage('resize', image.resize, resolution, resample)
+
+        def encode():
+            buffer = io.BytesIO()
+            image.save(buffer, format='JPEG', quality=quality, optimize=optimize)
+            return buffer.getvalue()
+
+        jpeg = stage('jpeg', encode)
+        stage('b64', lambda: base64.b64encode(jpeg).decode())
+    finally:
+        tracemalloc.stop()
+    return peaks
+
+
+def benchmark(frames, resolution, resample, quality, optimize, repeat):
+    """Median per-frame seconds and peak allocations per stage, plus the mean JPEG size"""
+    timings = {stage: [] for stage in STAGES}
+    sizes = []
+    raws = [(frame.tobytes(), frame.size, frame.mode) for frame in frames]
+    # One untimed pass warms up the encoder tables
+    run_stages(*raws[0], resolution, resample, quality, optimize)
+    for _ in range(repeat):
+        for raw, size, mode in raws:
+            sizes.append(run_stages(raw, size, mode, resolution, resample, quality, optimize, timings))
+    allocations = {stage: 0 for stage in STAGES}
+    for raw, size, mode in raws:
+        peaks = measure_allocations(raw, size, mode, resolution, resample, quality, optimize)
+        for stage in STAGES:
+            allocations[stage] = max(allocations[stage], peaks[stage])
+    return {
+        'ms': {stage: median(values) * 1000 for stage, values in timings.items()},
+        'alloc_kb': {stage: peak / 1024 for stage, peak in allocations.items()},
+        'jpeg_kb': sum(sizes) / len(sizes) / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the agent capture pipeline')
+    parser.add_argument('--source', default='1920x1080', help='captured screen size')
+    parser.add_argument('--frames', type=int, default=4, help='frames per synthetic scene')
+    parser.add_argument('--scenes', default=','.join(SCENES))
+    parser.add_argument('--resolutions', default='1280x720,1920x1080')
+    parser.add_argument('--filters', default='lanczos,bilinear')
+    parser.add_argument('--qualities', default='50,70,85')
+    parser.add_argument('--optimize', default='on', help='on, off or on,off')
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--images', help='directory of extra images, one scene each')
+    parser.add_argument('--json', help='also write the results to this JSON file')
+    args = parser.parse_args()
+
+    if not HAS_PIL:
+        print("PIL is not installed; the capture pipeline needs it (pip install Pillow)")
+        return
+
+    source = parse_size(args.source)
+    corpus = {}
+    for name in args.scenes.split(','):
+        corpus[name] = SCENES[name](source, args.frames, random.Random(args.seed))
+    if args.images:
+        corpus.update(load_images(args.images, source))
+
+    print(f"source {source[0]}x{source[1]}, {args.frames} frames per scene, median of {args.repeat} passes")
+    print(f"{'scene':<10} {'resolution':>10} {'filter':>8} {'q':>3} {'opt':>3} "
+          + ' '.join(f'{stage + " ms":>9}' for stage in STAGES)
+          + f" {'total ms':>9} {'JPEG KB':>8} "
+          + ' '.join(f'{stage + " KB":>9}' for stage in STAGES))
+    results = []
+    for scene, frames in corpus.items():
+        for resolution in [parse_size(r) for r in args.resolutions.split(',')]:
+            for filter_name in args.filters.split(','):
+                resample = getattr(Image, FILTERS[filter_name])
+                for quality in [int(q) for q in args.qualities.split(',')]:
+                    for optimize in [o == 'on' for o in args.optimize.split(',')]:
+                        result = benchmark(frames, resolution, resample, quality, optimize, args.repeat)
+                        total = sum(result['ms'].values())
+                        print(f"{scene:<10} {'%dx%d' % resolution:>10} {filter_name:>8} {quality:>3} "
+                              f"{'on' if optimize else 'off':>3} "
+                              + ' '.join(f"{result['ms'][stage]:>9.2f}" for stage in STAGES)
+                              + f" {total:>9.2f} {result['jpeg_kb']:>8.1f} "
+                              + ' '.join(f"{result['alloc_kb'][stage]:>9.0f}" for stage in STAGES))
+                        results.append(dict(result, scene=scene, resolution='%dx%d' % resolution,
+                                            filter=filter_name, quality=quality, optimize=optimize,
+                                            total_ms=total))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
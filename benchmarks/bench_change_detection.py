@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Change detection benchmark
+Times the agent's ChangeDetector strategies against the old md5 of the
+whole capture on 1080p and 4K frames of the bench_capture corpus, plus an
+idle scene where nothing changes, which is what an agent sees most of the
+time.
+
+For every strategy it reports the median time per frame, the share of the
+screen reported as changed (md5 can only say "all of it"), frames where a
+change went unnoticed for now and the state kept between frames. Missed
+changes are judged against the exact strategy; only sample misses any, and
+it finds them within CHANGE_SAMPLE_STEP squared frames.
+
+numpy is skipped when NumPy is not installed.
+
+Usage:
+    python benchmarks/bench_change_detection.py [--sizes 1920x1080,3840x2160]
+                                                [--frames 8] [--repeat 3]
+                                                [--strategies md5,exact,...]
+                                                [--json FILE]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from bench_capture import HAS_PIL, SCENES, median, parse_size
+
+if HAS_PIL:
+    from change_detection import HAS_NUMPY, ChangeDetector
+
+STRATEGIES = ('md5', 'exact', 'numpy', 'checksum', 'sample')
+
+
+class Md5Detector:
+    """The old check: md5 of tobytes(), which only tells whether anything changed"""
+
+    def __init__(self):
+        self.last = None
+
+    def update(self, image):
+        digest = hashlib.md5(image.tobytes()).digest()
+        last, self.last = self.last, digest
+        if last is None:
+            return None
+        return [] if digest == last else [(0, 0, image.width, image.height)]
+
+
+def state_bytes(detector):
+    """Roughly what a detector keeps between frames"""
+    if isinstance(detector, Md5Detector):
+        return 16
+    total = len(detector.tracker.previous or b'')
+    if detector.previous is not None:
+        total += detector.previous.nbytes
+    for _, tiles in detector.checksums + [row for sample in detector.samples for row in sample]:
+        total += 8 * (1 + len(tiles or ()))
+    return total
+
+
+def make_detector(strategy):
+    return Md5Detector() if strategy == 'md5' else ChangeDetector(strategy)
+
+
+def benchmark(frames, strategy, truth, repeat):
+    """Median seconds per frame, changed share, missed frames and state size"""
+    timings = []
+    for _ in range(repeat):
+        detector = make_detector(strategy)
+        detector.update(frames[0])
+        for frame in frames[1:]:
+            start = time.perf_counter()
+            detector.update(frame)
+            timings.append(time.perf_counter() - start)
+
+    # One more untimed pass for what each frame reported
+    detector = make_detector(strategy)
+    detector.update(frames[0])
+    area = missed = 0
+    for frame, expected in zip(frames[1:], truth):
+        rects = detector.update(frame)
+        area += sum(w * h for _, _, w, h in rects)
+        if expected and not rects:
+            missed += 1
+    screen = frames[0].width * frames[0].height * (len(frames) - 1)
+    return {
+        'ms': median(timings) * 1000,
+        'changed_pct': 100.0 * area / screen,
+        'missed': missed,
+        'state_kb': state_bytes(detector) / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark agent change detection strategies')
+    parser.add_argument('--sizes', default='1920x1080,3840x2160', help='captured screen sizes')
+    parser.add_argument('--frames', type=int, default=8, help='frames per scene')
+    parser.add_argument('--scenes', default='idle,' + ','.join(SCENES))
+    parser.add_argument('--strategies', default=','.join(STRATEGIES))
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--json', help='also write the results to this JSON file')
+    args = parser.parse_args()
+
+    if not HAS_PIL:
+        print("PIL is not installed; change detection needs it (pip install Pillow)")
+        return
+
+    strategies = args.strategies.split(',')
+    if 'numpy' in strategies and not HAS_NUMPY:
+        print("NumPy is not installed; skipping the numpy strategy")
+        strategies.remove('numpy')
+
+    print(f"{args.frames} frames per scene, median of {args.repeat} passes")
+    print(f"{'size':>9} {'scene':<10} {'strategy':<9} {'ms/frame':>9} {'changed %':>10} "
+          f"{'missed':>7} {'state KB':>9}")
+    results = []
+    for size in [parse_size(s) for s in args.sizes.split(',')]:
+        for scene in args.scenes.split(','):
+            if scene == 'idle':
+                frames = SCENES['desktop'](size, 1, random.Random(args.seed)) * args.frames
+            else:
+                frames = SCENES[scene](size, args.frames, random.Random(args.seed))
+            exact = ChangeDetector('exact')
+            exact.update(frames[0])
+            truth = [bool(exact.update(frame)) for frame in frames[1:]]
+            for strategy in strategies:
+                result = benchmark(frames, strategy, truth, args.repeat)
+                print(f"{'%dx%d' % size:>9} {scene:<10} {strategy:<9} {result['ms']:>9.2f} "
+                      f"{result['changed_pct']:>10.1f} {result['missed']:>7} {result['state_kb']:>9.0f}")
+                results.append(dict(result, size='%dx%d' % size, scene=scene, strategy=strategy))
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Keep-alive benchmark
+Measures agent frame upload throughput and server CPU per upload when every
+upload opens a new connection (the old urllib agent) versus reusing one
+persistent HTTP/1.1 connection per agent.
+
+The server runs in a child process so its CPU time is measured on its own;
+the agents are threads in this process, each uploading --frame-kb frames
+back to back to its own session for --duration seconds.
+
+Usage:
+    python benchmarks/bench_keepalive.py [--agents 1,8,32] [--duration 5]
+                                         [--frame-kb 50]
+"""
+
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from remote_control import RemoteControlServer
+
+
+def percentile(values, pct):
+    """Return the pct-th percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def serve(conn):
+    """Child process: run a server and report its CPU time when asked"""
+    server = RemoteControlServer(port=0)
+    httpd = server.create_httpd('127.0.0.1')
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    conn.send(httpd.server_address[1])
+    while True:
+        message = conn.recv()
+        if message is None:
+            break
+        conn.send(time.process_time())
+    httpd.shutdown()
+
+
+def register(port):
+    """Register a session and return its ID"""
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+    conn.request('POST', '/api/register', body=json.dumps({'platform': 'bench'}),
+                 headers={'Content-Type': 'application/json'})
+    session_id = json.loads(conn.getresponse().read())['sessionId']
+    conn.close()
+    return session_id
+
+
+def agent(port, session_id, frame, keepalive, deadline, latencies, errors):
+    """Upload frames back to back until the deadline"""
+    headers = {'Content-Type': 'image/jpeg'}
+    if not keepalive:
+        headers['Connection'] = 'close'
+    conn = None
+    while time.time() < deadline:
+        started = time.perf_counter()
+        try:
+            if conn is None:
+                conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+            conn.request('POST', f'/api/screen/{session_id}', body=frame, headers=headers)
+            response = conn.getresponse()
+            response.read()
+            latencies.append(time.perf_counter() - started)
+            if response.will_close:
+                conn.close()
+                conn = None
+        except (OSError, http.client.HTTPException):
+            errors.append(1)
+            if conn is not None:
+                conn.close()
+            conn = None
+    if conn is not None:
+        conn.close()
+
+
+def run(conn, port, agents, keepalive, args):
+    """Run one configuration; returns (uploads, errors, server CPU seconds, latencies)"""
+    session_ids = [register(port) for _ in range(agents)]
+    frame = os.urandom(args.frame_kb * 1024)
+    latencies, errors = [], []
+    deadline = time.time() + args.duration
+    threads = [threading.Thread(target=agent,
+                                args=(port, session_id, frame, keepalive, deadline,
+                                      latencies, errors))
+               for session_id in session_ids]
+    conn.send('cpu')
+    cpu_before = conn.recv()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    conn.send('cpu')
+    return len(latencies), len(errors), conn.recv() - cpu_before, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark connection reuse for agent uploads')
+    parser.add_argument('--agents', default='1,8,32')
+    parser.add_argument('--duration', type=float, default=5)
+    parser.add_argument('--frame-kb', type=int, default=50)
+    args = parser.parse_args()
+
+    conn, child_conn = multiprocessing.Pipe()
+    child = multiprocessing.Process(target=serve, args=(child_conn,), daemon=True)
+    child.start()
+    port = conn.recv()
+
+    print(f"{'agents':>6} {'mode':>10} {'uploads/s':>10} {'MB/s':>7} {'errors':>7} "
+          f"{'CPU us/upload':>14} {'p50 ms':>7} {'p99 ms':>7}")
+    for agents in [int(a) for a in args.agents.split(',')]:
+        for keepalive in (False, True):
+            uploads, errors, cpu, latencies = run(conn, port, agents, keepalive, args)
+            rate = uploads / args.duration
+            per_upload = cpu / uploads * 1e6 if uploads else 0
+            print(f"{agents:>6} {'keep-alive' if keepalive else 'close':>10} {rate:>10.1f} "
+                  f"{rate * args.frame_kb / 1024:>7.1f} {errors:>7} {per_upload:>14.1f} "
+                  f"{percentile(latencies, 50) * 1000:>7.2f} {percentile(latencies, 99) * 1000:>7.2f}")
+    conn.send(None)
+    child.join(timeout=10)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Screen GET micro-benchmark
+Measures GET /api/screen/<id> throughput with 1, 10 and 100 concurrent
+viewers of one session, with and without the per-frame response cache.
+
+An agent keeps uploading fresh frames at --fps so the cache is exercised the
+way it is in production: each frame is serialized once, then read many times.
+
+Usage:
+    python benchmarks/bench_screen_get.py [--duration 5] [--viewers 1,10,100]
+                                          [--frame-kb 200] [--fps 15]
+"""
+
+import argparse
+import http.client
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from remote_control import RemoteControlServer
+
+
+class UncachedServer(RemoteControlServer):
+    """Serializes the JSON response on every read, like the old handler"""
+
+    def screen_json_bytes(self, screen_info):
+        return json.dumps(self.screen_json(screen_info)).encode('utf-8')
+
+
+def start_server(server_class):
+    """Start a server on an ephemeral port, returning (httpd, port)"""
+    server = server_class(port=0)
+    httpd = server.create_httpd('127.0.0.1')
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd, httpd.server_address[1]
+
+
+def register(port):
+    """Register a session and return its ID"""
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+    conn.request('POST', '/api/register', body=json.dumps({'platform': 'bench'}),
+                 headers={'Content-Type': 'application/json'})
+    session_id = json.loads(conn.getresponse().read())['sessionId']
+    conn.close()
+    return session_id
+
+
+def upload_frame(port, session_id, frame):
+    """Upload one binary frame"""
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+    conn.request('POST', f'/api/screen/{session_id}', body=frame,
+                 headers={'Content-Type': 'image/jpeg'})
+    conn.getresponse().read()
+    conn.close()
+
+
+def uploader(port, session_id, frame_kb, fps, stop):
+    """Upload a new frame fps times per second"""
+    while not stop.is_set():
+        upload_frame(port, session_id, os.urandom(frame_kb * 1024))
+        time.sleep(1.0 / fps)
+
+
+def viewer(port, session_id, stop, counts):
+    """Poll the JSON screen endpoint as fast as possible"""
+    done = 0
+    transferred = 0
+    while not stop.is_set():
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        try:
+            conn.request('GET', f'/api/screen/{session_id}')
+            transferred += len(conn.getresponse().read())
+            done += 1
+        except OSError:
+            pass
+        finally:
+            conn.close()
+    counts.append((done, transferred))
+
+
+def run(server_class, viewers, args):
+    """Run one configuration and return (requests/sec, MB/s)"""
+    httpd, port = start_server(server_class)
+    session_id = register(port)
+    upload_frame(port, session_id, os.urandom(args.frame_kb * 1024))
+
+    stop = threading.Event()
+    counts = []
+    threads = [threading.Thread(target=uploader,
+                                args=(port, session_id, args.frame_kb, args.fps, stop),
+                                daemon=True)]
+    threads += [threading.Thread(target=viewer, args=(port, session_id, stop, counts),
+                                 daemon=True)
+                for _ in range(viewers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.duration)
+    stop.set()
+    for thread in threads:
+        thread.join(timeout=30)
+    httpd.shutdown()
+    httpd.server_close()
+
+    requests = sum(done for done, _ in counts)
+    transferred = sum(size for _, size in counts)
+    return requests / args.duration, transferred / args.duration / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark GET /api/screen/<id>')
+    parser.add_argument('--duration', type=float, default=5)
+    parser.add_argument('--viewers', default='1,10,100')
+    parser.add_argument('--frame-kb', type=int, default=200)
+    parser.add_argument('--fps', type=float, default=15)
+    args = parser.parse_args()
+
+    print(f"{'viewers':>7} {'uncached req/s':>15} {'cached req/s':>13} {'speedup':>8} {'cached MB/s':>12}")
+    for viewers in [int(v) for v in args.viewers.split(',')]:
+        uncached, _ = run(UncachedServer, viewers, args)
+        cached, throughput = run(RemoteControlServer, viewers, args)
+        speedup = cached / uncached if uncached else 0
+        print(f"{viewers:>7} {uncached:>15.1f} {cached:>13.1f} {speedup:>7.2f}x {throughput:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
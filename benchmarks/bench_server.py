@@ -0,0 +1,307 @@
+#!/usr/bin/env python3
+"""
+Server engine benchmark
+Compares the server as first released, one HTTPServer thread running its
+original handler, with the pooled server engine of today's server.
+
+A few "slow agents" trickle large base64 frame uploads while many fast
+clients poll screens, poll commands and post input events. The report shows
+requests/sec and latency percentiles of the fast clients for each engine.
+
+Usage:
+    python benchmarks/bench_server.py [--duration 10] [--clients 32]
+                                      [--slow-uploaders 4] [--frame-kb 300]
+"""
+
+import argparse
+import base64
+import http.client
+import json
+import os
+import secrets
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import urlparse
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from remote_control import RemoteControlServer
+
+
+class LegacyServer:
+    """The server as first released: state in plain dicts, served by one thread
+
+    The handler is the original one (git show 03e868e:remote_control.py)
+    with only the API routes this workload uses and without its logging.
+    """
+
+    def __init__(self):
+        self.sessions = {}
+        self.command_queues = {}
+        self.screen_data = {}
+
+    def create_handler(self):
+        """Create HTTP request handler with server reference"""
+        server_ref = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                path = urlparse(self.path).path
+                if path.startswith('/api/commands/'):
+                    self.api_get_commands(path.split('/')[-1])
+                elif path.startswith('/api/screen/'):
+                    self.api_get_screen(path.split('/')[-1])
+                else:
+                    self.send_error(404)
+
+            def do_POST(self):
+                path = urlparse(self.path).path
+                if path == '/api/register':
+                    self.api_register()
+                elif path == '/api/screen':
+                    self.api_post_screen()
+                elif path == '/api/command':
+                    self.api_post_command()
+                else:
+                    self.send_error(404)
+
+            def api_get_commands(self, session_id):
+                if session_id not in server_ref.command_queues:
+                    server_ref.command_queues[session_id] = []
+                commands = server_ref.command_queues[session_id].copy()
+                server_ref.command_queues[session_id].clear()
+                self.send_json_response(commands)
+
+            def api_get_screen(self, session_id):
+                if session_id in server_ref.screen_data:
+                    screen_info = server_ref.screen_data[session_id]
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Cache-Control', 'no-cache, must-revalidate')
+                    self.send_header('Pragma', 'no-cache')
+                    self.end_headers()
+                    self.wfile.write(json.dumps(screen_info).encode('utf-8'))
+                else:
+                    self.send_json_response({'error': 'No screen data available', 'data': None})
+
+            def api_register(self):
+                try:
+                    content_length = int(self.headers['Content-Length'])
+                    data = json.loads(self.rfile.read(content_length).decode())
+                    session_id = secrets.token_hex(4).upper()
+                    server_ref.sessions[session_id] = {
+                        'platform': data.get('platform', 'unknown'),
+                        'agent_type': data.get('agent_type', 'basic'),
+                        'registered_at': time.time(),
+                        'last_seen': time.time()
+                    }
+                    server_ref.command_queues[session_id] = []
+                    self.send_json_response({'sessionId': session_id, 'status': 'registered'})
+                except Exception as e:
+                    self.send_json_response({'error': str(e)}, status=400)
+
+            def api_post_screen(self):
+                try:
+                    content_length = int(self.headers['Content-Length'])
+                    data = json.loads(self.rfile.read(content_length).decode())
+                    session_id = data.get('sessionId')
+                    if not session_id:
+                        self.send_json_response({'error': 'Missing sessionId'}, status=400)
+                        return
+                    if session_id in server_ref.sessions:
+                        server_ref.sessions[session_id]['last_seen'] = time.time()
+                    server_ref.screen_data[session_id] = {
+                        'data': data.get('data'),
+                        'timestamp': data.get('timestamp', time.time() * 1000),
+                        'received_at': time.time() * 1000
+                    }
+                    self.send_json_response({'status': 'received'})
+                except Exception as e:
+                    self.send_json_response({'error': str(e)}, status=400)
+
+            def api_post_command(self):
+                try:
+                    content_length = int(self.headers['Content-Length'])
+                    data = json.loads(self.rfile.read(content_length).decode())
+                    session_id = data.get('sessionId')
+                    if not session_id or session_id not in server_ref.sessions:
+                        self.send_json_response({'error': 'Invalid session'}, status=400)
+                        return
+                    if session_id not in server_ref.command_queues:
+                        server_ref.command_queues[session_id] = []
+                    server_ref.command_queues[session_id].append({
+                        'type': data.get('type'),
+                        'action': data.get('action'),
+                        'x': data.get('x'),
+                        'y': data.get('y'),
+                        'button': data.get('button'),
+                        'key': data.get('key'),
+                        'deltaY': data.get('deltaY'),
+                        'timestamp': time.time() * 1000
+                    })
+                    self.send_json_response({'status': 'queued'})
+                except Exception as e:
+                    self.send_json_response({'error': str(e)}, status=400)
+
+            def send_json_response(self, data, status=200):
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+                self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+                self.end_headers()
+                self.wfile.write(json.dumps(data).encode())
+
+        return RequestHandler
+
+
+def percentile(values, pct):
+    """Return the pct-th percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def request(port, method, path, body=None, timeout=30):
+    """Issue one HTTP request on a fresh connection and return the status"""
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=timeout)
+    try:
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        conn.request(method, path, body=body, headers=headers)
+        response = conn.getresponse()
+        response.read()
+        return response.status
+    finally:
+        conn.close()
+
+
+def start_engine(engine, max_workers):
+    """Start a server on an ephemeral port, returning (httpd, port)"""
+    if engine == 'legacy':
+        httpd = HTTPServer(('127.0.0.1', 0), LegacyServer().create_handler())
+    else:
+        httpd = RemoteControlServer(port=0, max_workers=max_workers).create_httpd('127.0.0.1')
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    return httpd, httpd.server_address[1]
+
+
+def slow_uploader(port, session_id, frame, stop, chunk_delay):
+    """Upload frames the way an agent on a slow link does"""
+    body = json.dumps({'sessionId': session_id, 'data': frame}).encode()
+    chunk = max(1, len(body) // 20)
+    while not stop.is_set():
+        try:
+            sock = socket.create_connection(('127.0.0.1', port), timeout=30)
+            sock.sendall((
+                'POST /api/screen HTTP/1.0\r\n'
+                'Content-Type: application/json\r\n'
+                f'Content-Length: {len(body)}\r\n\r\n'
+            ).encode())
+            for start in range(0, len(body), chunk):
+                sock.sendall(body[start:start + chunk])
+                time.sleep(chunk_delay)
+            while sock.recv(65536):
+                pass
+            sock.close()
+        except OSError:
+            time.sleep(0.1)
+
+
+def fast_client(port, session_ids, stop, latencies, errors):
+    """Poll screens and commands and post input, recording latency"""
+    command = json.dumps({'sessionId': session_ids[0], 'type': 'mouse',
+                          'action': 'move', 'x': 0.5, 'y': 0.5})
+    routes = [
+        ('GET', f'/api/screen/{session_ids[0]}', None),
+        ('GET', f'/api/commands/{session_ids[0]}', None),
+        ('POST', '/api/command', command),
+    ]
+    i = 0
+    while not stop.is_set():
+        method, path, body = routes[i % len(routes)]
+        i += 1
+        started = time.perf_counter()
+        try:
+            request(port, method, path, body)
+            latencies.append(time.perf_counter() - started)
+        except OSError:
+            errors.append(1)
+
+
+def run(engine, args):
+    """Run the workload against one engine and return its statistics"""
+    httpd, port = start_engine(engine, args.max_workers)
+    session_ids = []
+    for _ in range(max(1, args.slow_uploaders)):
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        conn.request('POST', '/api/register', body=json.dumps({'platform': 'bench'}),
+                     headers={'Content-Type': 'application/json'})
+        session_ids.append(json.loads(conn.getresponse().read())['sessionId'])
+        conn.close()
+
+    frame = base64.b64encode(os.urandom(args.frame_kb * 1024 * 3 // 4)).decode()
+    request(port, 'POST', '/api/screen',
+            json.dumps({'sessionId': session_ids[0], 'data': frame}))
+
+    stop = threading.Event()
+    latencies, errors = [], []
+    threads = [
+        threading.Thread(target=slow_uploader,
+                         args=(port, session_ids[i], frame, stop, args.chunk_delay),
+                         daemon=True)
+        for i in range(args.slow_uploaders)
+    ]
+    threads += [
+        threading.Thread(target=fast_client,
+                         args=(port, session_ids, stop, latencies, errors),
+                         daemon=True)
+        for _ in range(args.clients)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(args.duration)
+    stop.set()
+    for thread in threads:
+        thread.join(timeout=35)
+    httpd.shutdown()
+    httpd.server_close()
+
+    return {
+        'engine': engine,
+        'requests': len(latencies),
+        'errors': len(errors),
+        'rps': len(latencies) / args.duration,
+        'p50': percentile(latencies, 50) * 1000,
+        'p99': percentile(latencies, 99) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the server engines')
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--clients', type=int, default=32)
+    parser.add_argument('--slow-uploaders', type=int, default=4)
+    parser.add_argument('--frame-kb', type=int, default=300)
+    parser.add_argument('--chunk-delay', type=float, default=0.025,
+                        help='seconds between upload chunks (20 chunks per frame)')
+    parser.add_argument('--max-workers', type=int, default=64)
+    parser.add_argument('--engines', default='legacy,pooled')
+    args = parser.parse_args()
+
+    print(f"{'engine':<8} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9}")
+    for engine in args.engines.split(','):
+        result = run(engine, args)
+        print(f"{result['engine']:<8} {result['requests']:>9} {result['errors']:>7} "
+              f"{result['rps']:>9.1f} {result['p50']:>9.1f} {result['p99']:>9.1f}")
+
+
+if __name__ == '__main__':
+    main()
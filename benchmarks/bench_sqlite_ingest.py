@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Shared store ingest scaling benchmark
+Starts N processes that each store frames for their own sessions in one
+SqliteSessionStore as fast as they can, like the agents of a fleet spread
+over `server --workers N`, and reports frames/sec, MB/s, p50/p99 time per
+stored frame and the speedup over a single process.
+
+Two layouts are compared: 'files', the store as it is, which writes the
+frame bytes to a file before taking the database write lock, and 'blob',
+the earlier layout that wrote the bytes into the database inside the
+locked transaction. Every SQLite write takes the same lock, so with 'blob'
+the uploads of all workers queue behind each other's bytes.
+
+Scaling needs a free core per process, so run it on a host with at least
+as many cores as the largest N.
+
+Usage:
+    python benchmarks/bench_sqlite_ingest.py [--workers 1,2,4] [--duration 5]
+                                             [--frame-kb 100] [--layouts files,blob]
+"""
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from remote_control import SqliteSessionStore
+
+
+class BlobFrameStore(SqliteSessionStore):
+    """The earlier layout: frame bytes written inside the locked transaction"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.connection().execute('CREATE TABLE IF NOT EXISTS frame_blobs '
+                                  '(session_id TEXT PRIMARY KEY, version INTEGER, image BLOB)')
+
+    def store_screen(self, session_id, image, timestamp=None, content_type='image/jpeg',
+                     trace=None, key=None):
+        now = time.time()
+        with self.transaction() as conn:
+            conn.execute('UPDATE sessions SET last_seen = ? WHERE session_id = ?', (now, session_id))
+            conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'frame_counter'")
+            version = conn.execute("SELECT value FROM meta WHERE key = 'frame_counter'").fetchone()[0]
+            conn.execute('INSERT OR REPLACE INTO frame_blobs VALUES (?, ?, ?)',
+                         (session_id, version, image))
+        return version
+
+
+LAYOUTS = {'files': SqliteSessionStore, 'blob': BlobFrameStore}
+
+
+def percentile(values, pct):
+    """Return the pct-th percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def ingest_process(layout, path, frame_kb, start, duration, results):
+    """One worker: store frames for its own session until the deadline"""
+    store = LAYOUTS[layout](path)
+    session_id = store.register_session({'platform': 'bench'})
+    frame = os.urandom(frame_kb * 1024)
+    while time.time() < start:
+        time.sleep(0.001)
+    latencies = []
+    deadline = start + duration
+    while time.time() < deadline:
+        started = time.perf_counter()
+        store.store_screen(session_id, frame)
+        latencies.append(time.perf_counter() - started)
+    results.put(latencies)
+
+
+def run(layout, workers, args):
+    """Run one layout with N ingest processes and return its statistics"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'sessions.db')
+        LAYOUTS[layout](path)  # Create the database before the workers race to do it
+        results = multiprocessing.Queue()
+        start = time.time() + 1  # Let every process open the store first
+        processes = [multiprocessing.Process(target=ingest_process,
+                                             args=(layout, path, args.frame_kb, start,
+                                                   args.duration, results))
+                     for _ in range(workers)]
+        for process in processes:
+            process.start()
+        latencies = []
+        for _ in processes:
+            latencies += results.get()
+        for process in processes:
+            process.join()
+
+    fps = len(latencies) / args.duration
+    return {
+        'frames': len(latencies),
+        'fps': fps,
+        'mbps': fps * args.frame_kb / 1024,
+        'p50': percentile(latencies, 50) * 1000,
+        'p99': percentile(latencies, 99) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark shared store frame ingest scaling')
+    parser.add_argument('--workers', default='1,2,4')
+    parser.add_argument('--duration', type=float, default=5)
+    parser.add_argument('--frame-kb', type=int, default=100)
+    parser.add_argument('--layouts', default='files,blob')
+    args = parser.parse_args()
+
+    print(f"host CPUs: {os.cpu_count()}, {args.frame_kb} KB frames")
+    print(f"{'layout':<6} {'workers':>7} {'frames':>8} {'frames/s':>9} {'MB/s':>7} "
+          f"{'p50 ms':>7} {'p99 ms':>7} {'speedup':>8}")
+    for layout in args.layouts.split(','):
+        baseline = None
+        for workers in [int(w) for w in args.workers.split(',')]:
+            result = run(layout, workers, args)
+            baseline = baseline or result['fps']
+            speedup = result['fps'] / baseline if baseline else 0
+            print(f"{layout:<6} {workers:>7} {result['frames']:>8} {result['fps']:>9.1f} "
+                  f"{result['mbps']:>7.1f} {result['p50']:>7.2f} {result['p99']:>7.2f} {speedup:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Pre-fork worker scaling benchmark
+Starts `remote_control.py server PORT --workers N` for each N and drives it
+with a mixed load (frame fetches, session lists, command posts and command
+polls) from several client processes, reporting requests/sec, latency
+percentiles and the speedup over a single worker.
+
+Scaling needs free cores for both the workers and the load generators, so
+run it on a host with at least twice as many cores as the largest N. The
+workers share state through a SQLite database in a temporary directory;
+N=1 is the plain single-process server with the in-memory store.
+
+Usage:
+    python benchmarks/bench_workers.py [--workers 1,2,4] [--duration 10]
+                                       [--client-procs 4] [--threads 8]
+"""
+
+import argparse
+import http.client
+import json
+import multiprocessing
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+
+def percentile(values, pct):
+    """Return the pct-th percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100.0 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def free_port():
+    """Pick a port that is free right now"""
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def request(port, method, path, body=None):
+    """Issue one HTTP request on a fresh connection and return the body"""
+    conn = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    try:
+        headers = {'Content-Type': 'application/json'} if body is not None else {}
+        conn.request(method, path, body=body, headers=headers)
+        return conn.getresponse().read()
+    finally:
+        conn.close()
+
+
+def start_server(workers, directory):
+    """Start a server process tree and wait until it accepts connections"""
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, os.path.join(ROOT, 'remote_control.py'), 'server', str(port),
+         '--workers', str(workers)],
+        cwd=directory, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            request(port, 'GET', '/api/sessions')
+            return process, port
+        except OSError:
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError('server did not start')
+
+
+def client_process(port, session_id, threads, duration, results):
+    """One load generator process: several threads issuing mixed requests"""
+    import threading
+
+    command = json.dumps({'sessionId': session_id, 'type': 'mouse', 'action': 'click'})
+    routes = [
+        ('GET', f'/api/screen/{session_id}.jpg', None),
+        ('GET', '/api/sessions', None),
+        ('POST', '/api/command', command),
+        ('GET', f'/api/commands/{session_id}', None),
+    ]
+    latencies = []
+    errors = []
+    deadline = time.time() + duration
+
+    def worker(offset):
+        i = offset
+        while time.time() < deadline:
+            method, path, body = routes[i % len(routes)]
+            i += 1
+            started = time.perf_counter()
+            try:
+                request(port, method, path, body)
+                latencies.append(time.perf_counter() - started)
+            except OSError:
+                errors.append(1)
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    results.put((latencies, len(errors)))
+
+
+def run(workers, args):
+    """Load one server configuration and return its statistics"""
+    with tempfile.TemporaryDirectory() as directory:
+        process, port = start_server(workers, directory)
+        try:
+            session_id = json.loads(request(port, 'POST', '/api/register',
+                                            json.dumps({'platform': 'bench'})))['sessionId']
+            request(port, 'POST', f'/api/screen/{session_id}', os.urandom(args.frame_kb * 1024))
+
+            results = multiprocessing.Queue()
+            clients = [multiprocessing.Process(target=client_process,
+                                               args=(port, session_id, args.threads,
+                                                     args.duration, results))
+                       for _ in range(args.client_procs)]
+            for client in clients:
+                client.start()
+            latencies, errors = [], 0
+            for _ in clients:
+                client_latencies, client_errors = results.get()
+                latencies += client_latencies
+                errors += client_errors
+            for client in clients:
+                client.join()
+        finally:
+            process.terminate()
+            process.wait(timeout=30)
+
+    return {
+        'requests': len(latencies),
+        'errors': errors,
+        'rps': len(latencies) / args.duration,
+        'p50': percentile(latencies, 50) * 1000,
+        'p99': percentile(latencies, 99) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark pre-fork worker scaling')
+    parser.add_argument('--workers', default='1,2,4')
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--client-procs', type=int, default=max(2, os.cpu_count() or 2))
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--frame-kb', type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"host CPUs: {os.cpu_count()}")
+    print(f"{'workers':>7} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 ms':>8} {'p99 ms':>8} {'speedup':>8}")
+    baseline = None
+    for workers in [int(w) for w in args.workers.split(',')]:
+        result = run(workers, args)
+        baseline = baseline or result['rps']
+        speedup = result['rps'] / baseline if baseline else 0
+        print(f"{workers:>7} {result['requests']:>9} {result['errors']:>7} {result['rps']:>9.1f} "
+              f"{result['p50']:>8.1f} {result['p99']:>8.1f} {speedup:>7.2f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,352 @@
+"""
+Change detection shared by the agent and the server's built-in agent
+Finds the tiles of a raw capture that changed since the previous one and
+maps them onto the resized frame that is sent. Both agents must find the
+same tiles, so keep this file next to agent.py and remote_control.py.
+"""
+
+import math
+import zlib
+
+# Try to import optional dependencies with fallbacks
+try:
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+try:
+    import numpy
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+# Frames are split into TILE_SIZE tiles for partial frame updates
+TILE_SIZE = 64
+
+# Changes are found on the raw capture before it is resized, see
+# ChangeDetector; 'auto' is numpy when installed and exact otherwise
+CHANGE_DETECTION = 'auto'
+CHANGE_SAMPLE_STEP = 4
+# Changes are located to blocks this size of the capture, which is
+# usually larger than the frame sent
+CHANGE_TILE_SIZE = 32
+# How far the resize filter reaches, in pixels of the resized frame
+RESIZE_MARGIN = 3
+
+
+def merge_tiles(changed, top, bottom, tile, width, rects):
+    """Append one (x, y, w, h) rectangle per run of changed tiles in a row of tiles"""
+    columns = len(changed)
+    column = 0
+    while column < columns:
+        if not changed[column]:
+            column += 1
+            continue
+        first = column
+        while column < columns and changed[column]:
+            column += 1
+        x = first * tile
+        rects.append((x, top, min(column * tile, width) - x, bottom - top))
+
+
+def scale_tiles(rects, source, size, tile=TILE_SIZE):
+    """Tiles of a resized frame covering rectangles changed in the source frame
+
+    Each rectangle is scaled, grown by RESIZE_MARGIN for the pixels the
+    resize filter blends across its edges and snapped to the tile grid.
+    """
+    (source_width, source_height), (width, height) = source, size
+    margin = RESIZE_MARGIN if source != size else 0
+    columns = (width + tile - 1) // tile
+    bands = {}
+    for x, y, w, h in rects:
+        left = max(0, int(x * width / source_width) - margin) // tile
+        right = min(width, math.ceil((x + w) * width / source_width) + margin)
+        top = max(0, int(y * height / source_height) - margin) // tile
+        bottom = min(height, math.ceil((y + h) * height / source_height) + margin)
+        for band in range(top, (bottom - 1) // tile + 1):
+            changed = bands.setdefault(band, [False] * columns)
+            changed[left:(right - 1) // tile + 1] = [True] * ((right - 1) // tile + 1 - left)
+    tiles = []
+    for band in sorted(bands):
+        merge_tiles(bands[band], band * tile, min(band * tile + tile, height), tile, width, tiles)
+    return tiles
+
+
+class TileTracker:
+    """Find the tiles of a frame that changed since the previous frame
+
+    Frames are compared as raw pixel rows, and only rows that differ are
+    split into tiles, so an unchanged screen costs one bytes comparison per
+    row. Changed tiles that touch within a row of tiles are merged into one
+    rectangle to save a JPEG header per tile.
+    """
+
+    def __init__(self, tile_size=TILE_SIZE):
+        self.tile_size = tile_size
+        self.previous = None
+        self.size = None
+
+    def update(self, pixels, size, bytes_per_pixel=3):
+        """Remember this frame and return its changed (x, y, w, h) rectangles
+
+        Returns None when there is no previous frame of the same size.
+        """
+        previous, self.previous = self.previous, pixels
+        previous_size, self.size = self.size, size
+        if previous is None or previous_size != size or len(previous) != len(pixels):
+            return None
+
+        width, height = size
+        tile = self.tile_size
+        stride = width * bytes_per_pixel
+        span = tile * bytes_per_pixel
+        columns = (width + tile - 1) // tile
+        rects = []
+        for top in range(0, height, tile):
+            bottom = min(top + tile, height)
+            changed = [False] * columns
+            remaining = columns
+            for row in range(top, bottom):
+                start = row * stride
+                end = start + stride
+                if pixels[start:end] == previous[start:end]:
+                    continue
+                for column in range(columns):
+                    if not changed[column]:
+                        left = start + column * span
+                        right = min(left + span, end)
+                        if pixels[left:right] != previous[left:right]:
+                            changed[column] = True
+                            remaining -= 1
+                if not remaining:
+                    break  # Every tile in this row of tiles changed
+            merge_tiles(changed, top, bottom, tile, width, rects)
+        return rects
+
+
+class ChangeDetector:
+    """Find the tiles of a raw capture that changed since the previous one
+
+    Runs on the capture before it is resized or encoded, so an unchanged
+    screen costs only the comparison. Strategies ('change_detection'):
+      exact     bytes comparison row by row (TileTracker)
+      numpy     the same comparison vectorized, 8 bytes at a time
+      checksum  crc32 of every row of tiles, then of each tile in the rows
+                that changed; keeps checksums instead of the last frame
+      sample    every CHANGE_SAMPLE_STEP-th pixel of every step-th row,
+                picked by PIL and checksummed like checksum, in blocks
+                twice the tile size; keeps only the checksums. The grid
+                shifts each frame, so a change thinner than the step is
+                found within step * step frames (bar the last pixels of
+                each row and column)
+      auto      numpy when installed, else exact
+    """
+
+    STRATEGIES = ('exact', 'numpy', 'checksum', 'sample')
+
+    def __init__(self, strategy=CHANGE_DETECTION, tile_size=CHANGE_TILE_SIZE):
+        if strategy == 'auto':
+            strategy = 'numpy' if HAS_NUMPY else 'exact'
+        if strategy not in self.STRATEGIES or strategy == 'numpy' and not HAS_NUMPY:
+            print(f"⚠️ Change detection '{strategy}' not available, using exact")
+            strategy = 'exact'
+        self.strategy = strategy
+        self.detect = getattr(self, 'detect_' + strategy)
+        self.tile_size = tile_size
+        self.tracker = TileTracker(tile_size)
+        self.previous = None  # numpy: last frame as an array
+        self.checksums = []  # checksum: (crc of each row of tiles, [crc of each tile])
+        self.samples = []  # sample: checksums as above, per grid position
+        self.phase = 0
+        self.size = None
+
+    def update(self, image):
+        """Remember this capture and return its changed (x, y, w, h) rectangles
+
+        Returns None when there is no previous capture of the same size.
+        """
+        size, self.size = self.size, image.size
+        return self.detect(image, size == image.size, len(image.getbands()))
+
+    def detect_exact(self, image, same_size, bytes_per_pixel):
+        return self.tracker.update(image.tobytes(), image.size, bytes_per_pixel)
+
+    def detect_numpy(self, image, same_size, bytes_per_pixel):
+        width, height = image.size
+        tile = self.tile_size
+        stride = width * bytes_per_pixel
+        span = tile * bytes_per_pixel
+        word = numpy.uint64 if stride % 8 == 0 and span % 8 == 0 else numpy.uint8
+        pixels = numpy.frombuffer(image.tobytes(), word).reshape(height, -1)
+        previous, self.previous = self.previous, pixels
+        if previous is None or previous.shape != pixels.shape:
+            return None
+
+        rows = (pixels != previous).any(axis=1)
+        bands = numpy.logical_or.reduceat(rows, numpy.arange(0, height, tile))
+        starts = numpy.arange(0, pixels.shape[1], span // pixels.itemsize)
+        rects = []
+        for band in numpy.flatnonzero(bands).tolist():
+            top = band * tile
+            bottom = min(top + tile, height)
+            columns = (pixels[top:bottom] != previous[top:bottom]).any(axis=0)
+            merge_tiles(numpy.logical_or.reduceat(columns, starts).tolist(),
+                        top, bottom, tile, width, rects)
+        return rects
+
+    def detect_checksum(self, image, same_size, bytes_per_pixel):
+        width, height = image.size
+        tile = self.tile_size
+        stride = width * bytes_per_pixel
+        pixels = memoryview(image.tobytes())
+        previous = self.checksums if same_size else None
+        self.checksums = []
+        rects = None if previous is None else []
+        for band, top in enumerate(range(0, height, tile)):
+            bottom = min(top + tile, height)
+            checksum = zlib.crc32(pixels[top * stride:bottom * stride])
+            if previous is not None and checksum == previous[band][0]:
+                self.checksums.append(previous[band])
+                continue
+            tiles = self.tile_checksums(image, top, bottom)
+            self.checksums.append((checksum, tiles))
+            if previous is not None:
+                merge_tiles([a != b for a, b in zip(tiles, previous[band][1])],
+                            top, bottom, tile, width, rects)
+        return rects
+
+    def tile_checksums(self, image, top, bottom):
+        """crc32 of each tile in a row of tiles
+
+        Transposed, the pixels of each tile are one run of bytes.
+        """
+        band = image.crop((0, top, image.width, bottom)).transpose(Image.TRANSPOSE)
+        pixels = memoryview(band.tobytes())
+        span = self.tile_size * band.width * len(band.getbands())
+        return [zlib.crc32(pixels[start:start + span]) for start in range(0, len(pixels), span)]
+
+    def detect_sample(self, image, same_size, bytes_per_pixel):
+        step = CHANGE_SAMPLE_STEP
+        if not same_size:
+            # Start every grid position off so each can be compared from now on
+            self.samples = [self.sample_checksums(image, phase) for phase in range(step * step)]
+            return None
+        self.phase = (self.phase + 1) % (step * step)
+        previous = self.samples[self.phase]
+        self.samples[self.phase] = self.sample_checksums(image, self.phase, previous)
+        width, height = image.size
+        block = 2 * self.tile_size
+        rects = []
+        for band, ((_, tiles), (_, last)) in enumerate(zip(self.samples[self.phase], previous)):
+            if tiles is last:
+                continue
+            top = band * block
+            bottom = min(top + block, height)
+            if last is None:
+                rects.append((0, top, width, bottom - top))
+            else:
+                merge_tiles([a != b for a, b in zip(tiles, last)], top, bottom, block, width, rects)
+        if 2 * sum(w * h for _, _, w, h in rects) > width * height:
+            # Cheaper to report the whole screen and sample it afresh; rows
+            # of blocks are enough, one that changes is reported whole
+            for phase in range(step * step):
+                if phase != self.phase:
+                    self.samples[phase] = self.sample_checksums(image, phase, blocks=False)
+            return [(0, 0, width, height)]
+        # The other grid positions would report these changes again later
+        touched = {}
+        for x, y, w, h in rects:
+            touched.setdefault(y // block, set()).update(range(x // block, (x + w - 1) // block + 1))
+        if touched:
+            for phase in range(step * step):
+                if phase != self.phase:
+                    self.refresh_sample(image, phase, touched)
+        return rects
+
+    def sample(self, image, phase):
+        """One grid position's sample of a capture"""
+        step = CHANGE_SAMPLE_STEP
+        x, y = phase % step, phase // step
+        width, height = (image.width - x) // step, (image.height - y) // step
+        return image.resize((width, height), Image.NEAREST,
+                            box=(x, y, x + width * step, y + height * step))
+
+    def sample_edges(self, length, offset, count):
+        """Index of the first sample in each block along one axis, then count
+
+        Sample i was picked from offset + step // 2 + i * step: NEAREST
+        takes the middle of each step.
+        """
+        step = CHANGE_SAMPLE_STEP
+        edges = [min(count, max(0, -((offset + step // 2 - start) // step)))
+                 for start in range(0, length, 2 * self.tile_size)]
+        return edges + [count]
+
+    def sample_checksums(self, image, phase, previous=None, blocks=True):
+        """(crc of each row of blocks, [crc of each block]) of one grid position
+
+        Rows of blocks whose crc matches previous keep its entry. Without
+        blocks only the rows are checksummed, and their blocks are None.
+        """
+        step = CHANGE_SAMPLE_STEP
+        sample = self.sample(image, phase)
+        pixels = memoryview(sample.tobytes())
+        stride = sample.width * len(sample.getbands())
+        columns = self.sample_edges(image.width, phase % step, sample.width)
+        rows = self.sample_edges(image.height, phase // step, sample.height)
+        checksums = []
+        for band, (top, bottom) in enumerate(zip(rows, rows[1:])):
+            checksum = zlib.crc32(pixels[top * stride:bottom * stride])
+            if previous is not None and checksum == previous[band][0]:
+                checksums.append(previous[band])
+            elif blocks:
+                checksums.append((checksum, self.block_checksums(sample, top, bottom, columns)))
+            else:
+                checksums.append((checksum, None))
+        return checksums
+
+    def block_checksums(self, sample, top, bottom, columns):
+        """crc32 of each block's samples between sample rows top and bottom
+
+        Transposed, every column of samples is one run of bytes, and so
+        are the columns of a block.
+        """
+        if top == bottom:
+            return [0] * (len(columns) - 1)
+        band = sample.crop((0, top, sample.width, bottom)).transpose(Image.TRANSPOSE)
+        pixels = memoryview(band.tobytes())
+        column = (bottom - top) * len(band.getbands())
+        return [zlib.crc32(pixels[left * column:right * column])
+                for left, right in zip(columns, columns[1:])]
+
+    def refresh_sample(self, image, phase, touched):
+        """Bring one grid position's checksums of the touched blocks up to date
+
+        touched maps rows of blocks to the blocks to refresh. Only those are
+        replaced, so a change elsewhere is still found when this grid
+        position's turn comes.
+        """
+        step = CHANGE_SAMPLE_STEP
+        x, y = phase % step, phase // step
+        width, height = (image.width - x) // step, (image.height - y) // step
+        columns = self.sample_edges(image.width, x, width)
+        rows = self.sample_edges(image.height, y, height)
+        checksums = self.samples[phase]
+        for band, blocks in touched.items():
+            top, bottom = rows[band], rows[band + 1]
+            first, last = min(blocks), max(blocks) + 1
+            left, right = columns[first], columns[last]
+            if top == bottom or left == right or checksums[band][1] is None:
+                continue
+            # Sample just the span of touched blocks
+            sample = image.resize((right - left, bottom - top), Image.NEAREST,
+                                  box=(x + left * step, y + top * step, x + right * step, y + bottom * step))
+            edges = [edge - left for edge in columns[first:last + 1]]
+            tiles = list(checksums[band][1])
+            for block, checksum in zip(range(first, last), self.block_checksums(sample, 0, bottom - top, edges)):
+                if block in blocks:
+                    tiles[block] = checksum
+            # The row's crc no longer describes its blocks; compare them next time
+            checksums[band] = (None, tiles)
\ No newline at end of file
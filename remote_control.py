@@ -1,1028 +1,5313 @@
-#!/usr/bin/env python3
-"""
-Universal Remote Control System - Single Python Script
-Zero-installation remote control for university environments.
-
-Usage:
-    python remote_control.py server [PORT]             # Start server
-    python remote_control.py agent SERVER_URL          # Start agent
-"""
-
-import sys
-import os
-import json
-import time
-import threading
-import base64
-import hashlib
-import secrets
-import urllib.request
-import urllib.parse
-import urllib.error
-from http.server import HTTPServer, BaseHTTPRequestHandler
-from urllib.parse import parse_qs, urlparse
-import socketserver
-from datetime import datetime, timedelta
-import queue
-import io
-
-# Try to import optional dependencies with fallbacks
-try:
-    import PIL.ImageGrab as ImageGrab
-    HAS_PIL = True
-except ImportError:
-    HAS_PIL = False
-
-try:
-    # Import pynput for mouse and keyboard control
-    import pynput.mouse as pynput_mouse
-    import pynput.keyboard as pynput_keyboard
-    mouse = pynput_mouse
-    keyboard = pynput_keyboard
-    HAS_PYNPUT = True
-except ImportError:
-    HAS_PYNPUT = False
-
-
-class RemoteControlServer:
-    """HTTP-based server for remote control coordination"""
-    
-    def __init__(self, port=8080):
-        self.port = port
-        self.sessions = {}
-        self.command_queues = {}
-        self.screen_data = {}
-        
-    def start(self):
-        """Start the HTTP server"""
-        handler = self.create_handler()
-        with HTTPServer(('', self.port), handler) as httpd:
-            print(f"🌐 Remote Control Server started on port {self.port}")
-            print(f"📱 Web interface: http://localhost:{self.port}")
-            print(f"🖥️  Agent URL: http://localhost:{self.port}")
-            print("Press Ctrl+C to stop")
-            try:
-                httpd.serve_forever()
-            except KeyboardInterrupt:
-                print("\n🛑 Server stopped")
-    
-    def create_handler(self):
-        """Create HTTP request handler with server reference"""
-        server_ref = self
-        
-        class RequestHandler(BaseHTTPRequestHandler):
-            def log_message(self, format, *args):
-                """Suppress default logging"""
-                pass
-                
-            def do_GET(self):
-                """Handle GET requests"""
-                parsed = urlparse(self.path)
-                path = parsed.path
-                query = parse_qs(parsed.query)
-                
-                if path == '/':
-                    self.serve_web_interface()
-                elif path == '/api/sessions':
-                    self.api_get_sessions()
-                elif path.startswith('/api/commands/'):
-                    session_id = path.split('/')[-1]
-                    self.api_get_commands(session_id)
-                elif path.startswith('/api/screen/'):
-                    session_id = path.split('/')[-1]
-                    self.api_get_screen(session_id)
-                else:
-                    self.send_error(404)
-            
-            def do_POST(self):
-                """Handle POST requests"""
-                parsed = urlparse(self.path)
-                path = parsed.path
-                
-                if path == '/api/register':
-                    self.api_register()
-                elif path == '/api/screen':
-                    self.api_post_screen()
-                elif path == '/api/command':
-                    self.api_post_command()
-                else:
-                    self.send_error(404)
-            
-            def serve_web_interface(self):
-                """Serve the web-based controller interface"""
-                html = self.get_web_interface_html()
-                self.send_response(200)
-                self.send_header('Content-type', 'text/html')
-                self.end_headers()
-                self.wfile.write(html.encode())
-            
-            def api_get_sessions(self):
-                """API: Get list of active sessions"""
-                sessions_list = []
-                current_time = time.time()
-                
-                # Clean up old sessions (older than 30 minutes)
-                expired_sessions = []
-                for session_id, session_data in server_ref.sessions.items():
-                    if current_time - session_data.get('last_seen', 0) > 1800:  # 30 minutes
-                        expired_sessions.append(session_id)
-                
-                for session_id in expired_sessions:
-                    if session_id in server_ref.sessions:
-                        del server_ref.sessions[session_id]
-                    if session_id in server_ref.command_queues:
-                        del server_ref.command_queues[session_id]
-                    if session_id in server_ref.screen_data:
-                        del server_ref.screen_data[session_id]
-                
-                # Return active sessions
-                for session_id, session_data in server_ref.sessions.items():
-                    sessions_list.append({
-                        'sessionId': session_id,
-                        'platform': session_data.get('platform', 'unknown'),
-                        'lastSeen': session_data.get('last_seen', 0),
-                        'hasScreen': session_id in server_ref.screen_data
-                    })
-                
-                self.send_json_response(sessions_list)
-            
-            def api_get_commands(self, session_id):
-                """API: Get pending commands for a session"""
-                if session_id not in server_ref.command_queues:
-                    server_ref.command_queues[session_id] = []
-                
-                commands = server_ref.command_queues[session_id].copy()
-                server_ref.command_queues[session_id].clear()  # Clear after reading
-                
-                self.send_json_response(commands)
-            
-            def api_get_screen(self, session_id):
-                """API: Get latest screen data for a session (optimized)"""
-                if session_id in server_ref.screen_data:
-                    screen_info = server_ref.screen_data[session_id]
-                    
-                    # Add caching headers for better performance
-                    self.send_response(200)
-                    self.send_header('Content-Type', 'application/json')
-                    self.send_header('Cache-Control', 'no-cache, must-revalidate')
-                    self.send_header('Pragma', 'no-cache')
-                    self.end_headers()
-                    
-                    # Send response
-                    response = json.dumps(screen_info).encode('utf-8')
-                    self.wfile.write(response)
-                else:
-                    self.send_json_response({'error': 'No screen data available', 'data': None})
-            
-            def api_register(self):
-                """API: Register a new agent session"""
-                try:
-                    content_length = int(self.headers['Content-Length'])
-                    post_data = self.rfile.read(content_length).decode()
-                    data = json.loads(post_data)
-                    
-                    # Generate session ID
-                    session_id = secrets.token_hex(4).upper()
-                    
-                    # Store session info
-                    server_ref.sessions[session_id] = {
-                        'platform': data.get('platform', 'unknown'),
-                        'agent_type': data.get('agent_type', 'basic'),
-                        'registered_at': time.time(),
-                        'last_seen': time.time()
-                    }
-                    
-                    # Initialize command queue
-                    server_ref.command_queues[session_id] = []
-                    
-                    response = {'sessionId': session_id, 'status': 'registered'}
-                    self.send_json_response(response)
-                    
-                    print(f"🤖 Agent registered: {session_id} ({data.get('platform', 'unknown')})")
-                    
-                except Exception as e:
-                    self.send_json_response({'error': str(e)}, status=400)
-            
-            def api_post_screen(self):
-                """API: Receive screen data from agent"""
-                try:
-                    content_length = int(self.headers['Content-Length'])
-                    post_data = self.rfile.read(content_length).decode()
-                    data = json.loads(post_data)
-                    
-                    session_id = data.get('sessionId')
-                    if not session_id:
-                        self.send_json_response({'error': 'Missing sessionId'}, status=400)
-                        return
-                    
-                    # Update last seen time
-                    if session_id in server_ref.sessions:
-                        server_ref.sessions[session_id]['last_seen'] = time.time()
-                    
-                    # Store screen data
-                    server_ref.screen_data[session_id] = {
-                        'data': data.get('data'),
-                        'timestamp': data.get('timestamp', time.time() * 1000),
-                        'received_at': time.time() * 1000
-                    }
-                    
-                    self.send_json_response({'status': 'received'})
-                    
-                except Exception as e:
-                    self.send_json_response({'error': str(e)}, status=400)
-            
-            def api_post_command(self):
-                """API: Send command to agent"""
-                try:
-                    content_length = int(self.headers['Content-Length'])
-                    post_data = self.rfile.read(content_length).decode()
-                    data = json.loads(post_data)
-                    
-                    session_id = data.get('sessionId')
-                    if not session_id or session_id not in server_ref.sessions:
-                        self.send_json_response({'error': 'Invalid session'}, status=400)
-                        return
-                    
-                    # Add command to queue
-                    if session_id not in server_ref.command_queues:
-                        server_ref.command_queues[session_id] = []
-                    
-                    command = {
-                        'type': data.get('type'),
-                        'action': data.get('action'),
-                        'x': data.get('x'),
-                        'y': data.get('y'),
-                        'button': data.get('button'),
-                        'key': data.get('key'),
-                        'deltaY': data.get('deltaY'),
-                        'timestamp': time.time() * 1000
-                    }
-                    
-                    server_ref.command_queues[session_id].append(command)
-                    
-                    self.send_json_response({'status': 'queued'})
-                    
-                except Exception as e:
-                    self.send_json_response({'error': str(e)}, status=400)
-            
-            def send_json_response(self, data, status=200):
-                """Send JSON response"""
-                self.send_response(status)
-                self.send_header('Content-Type', 'application/json')
-                self.send_header('Access-Control-Allow-Origin', '*')
-                self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-                self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-                self.end_headers()
-                self.wfile.write(json.dumps(data).encode())
-            
-            def get_web_interface_html(self):
-                """Generate the web interface HTML"""
-                return '''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>University Remote Control</title>
-    <style>
-        body {
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            min-height: 100vh;
-            color: white;
-        }
-        .container {
-            max-width: 1200px;
-            margin: 0 auto;
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 15px;
-            padding: 30px;
-            backdrop-filter: blur(10px);
-            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
-        }
-        .header {
-            text-align: center;
-            margin-bottom: 30px;
-        }
-        .header h1 {
-            margin: 0;
-            font-size: 2.5em;
-            text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.3);
-        }
-        .status {
-            padding: 15px;
-            margin: 20px 0;
-            border-radius: 8px;
-            text-align: center;
-        }
-        .status.connected {
-            background: rgba(46, 204, 113, 0.2);
-            border: 1px solid #2ecc71;
-        }
-        .status.disconnected {
-            background: rgba(231, 76, 60, 0.2);
-            border: 1px solid #e74c3c;
-        }
-        .controls {
-            display: grid;
-            grid-template-columns: 1fr 1fr;
-            gap: 20px;
-            margin: 20px 0;
-        }
-        .control-panel {
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 10px;
-            padding: 20px;
-        }
-        .control-panel h3 {
-            margin-top: 0;
-            color: #fff;
-        }
-        input, button, select {
-            width: 100%;
-            padding: 12px;
-            margin: 10px 0;
-            border: none;
-            border-radius: 6px;
-            font-size: 16px;
-        }
-        input {
-            background: rgba(255, 255, 255, 0.9);
-            color: #333;
-        }
-        button {
-            background: #3498db;
-            color: white;
-            cursor: pointer;
-            font-weight: bold;
-            transition: background 0.3s;
-        }
-        button:hover {
-            background: #2980b9;
-        }
-        button:disabled {
-            background: #7f8c8d;
-            cursor: not-allowed;
-        }
-        .screen-container {
-            margin: 20px 0;
-            text-align: center;
-            background: rgba(0, 0, 0, 0.3);
-            border-radius: 10px;
-            padding: 20px;
-        }
-        #screen {
-            max-width: 100%;
-            height: auto;
-            border-radius: 8px;
-            box-shadow: 0 4px 16px rgba(0, 0, 0, 0.3);
-            cursor: crosshair;
-        }
-        .sessions-list {
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 10px;
-            padding: 20px;
-            margin: 20px 0;
-        }
-        .session-item {
-            display: flex;
-            justify-content: space-between;
-            align-items: center;
-            padding: 10px;
-            margin: 5px 0;
-            background: rgba(255, 255, 255, 0.1);
-            border-radius: 6px;
-            cursor: pointer;
-            transition: background 0.3s;
-        }
-        .session-item:hover {
-            background: rgba(255, 255, 255, 0.2);
-        }
-        .session-item.active {
-            background: rgba(52, 152, 219, 0.3);
-        }
-        @media (max-width: 768px) {
-            .controls {
-                grid-template-columns: 1fr;
-            }
-            .header h1 {
-                font-size: 2em;
-            }
-        }
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>🎓 University Remote Control</h1>
-            <p>Connect to university computers from anywhere</p>
-        </div>
-
-        <div id="status" class="status disconnected">
-            <strong>⚠️ Disconnected</strong> - Enter a Session ID to connect
-        </div>
-
-        <div class="controls">
-            <div class="control-panel">
-                <h3>🔗 Connection</h3>
-                <input type="text" id="sessionId" placeholder="Enter Session ID (e.g., A1B2C3)" maxlength="8">
-                <button onclick="connectToSession()">Connect to Computer</button>
-                <button onclick="disconnectSession()" id="disconnectBtn" disabled>Disconnect</button>
-            </div>
-
-            <div class="control-panel">
-                <h3>📋 Available Sessions</h3>
-                <div id="sessionsList">Loading sessions...</div>
-                <button onclick="refreshSessions()">Refresh Sessions</button>
-            </div>
-        </div>
-
-        <div class="screen-container">
-            <h3>🖥️ Remote Screen</h3>
-            <img id="screen" src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg==" alt="Remote screen will appear here">
-            <p id="screenStatus">Not connected</p>
-        </div>
-    </div>
-
-    <script>
-        let currentSessionId = null;
-        let screenUpdateInterval = null;
-        let sessionsUpdateInterval = null;
-        let lastMouseMove = 0; // For throttling mouse movement
-
-        function updateStatus(message, isConnected) {
-            const statusEl = document.getElementById('status');
-            statusEl.innerHTML = message;
-            statusEl.className = 'status ' + (isConnected ? 'connected' : 'disconnected');
-            document.getElementById('disconnectBtn').disabled = !isConnected;
-        }
-
-        function connectToSession() {
-            const sessionId = document.getElementById('sessionId').value.trim().toUpperCase();
-            if (!sessionId) {
-                alert('Please enter a Session ID');
-                return;
-            }
-
-            currentSessionId = sessionId;
-            updateStatus(`🔄 Connecting to ${sessionId}...`, false);
-
-            // Start screen updates
-            startScreenUpdates();
-            updateStatus(`✅ Connected to ${sessionId}`, true);
-            
-            // Add mouse and keyboard event listeners
-            addControlListeners();
-            
-            console.log('Connected to session:', sessionId);
-            console.log('Event listeners added');
-        }
-
-        function disconnectSession() {
-            currentSessionId = null;
-            stopScreenUpdates();
-            removeControlListeners();
-            updateStatus('⚠️ Disconnected', false);
-            document.getElementById('screenStatus').textContent = 'Not connected';
-        }
-
-        function startScreenUpdates() {
-            if (screenUpdateInterval) clearInterval(screenUpdateInterval);
-            
-            screenUpdateInterval = setInterval(() => {
-                if (!currentSessionId) return;
-                
-                fetch(`/api/screen/${currentSessionId}`)
-                    .then(response => response.json())
-                    .then(data => {
-                        if (data.data) {
-                            document.getElementById('screen').src = 'data:image/jpeg;base64,' + data.data;
-                            document.getElementById('screenStatus').textContent = 
-                                'Last update: ' + new Date(data.timestamp).toLocaleTimeString();
-                        }
-                    })
-                    .catch(error => {
-                        console.error('Screen update error:', error);
-                        document.getElementById('screenStatus').textContent = 'Screen update failed';
-                    });
-            }, 66);  // ~15 FPS (66ms) for smoother updates matching agent performance
-        }
-
-        function stopScreenUpdates() {
-            if (screenUpdateInterval) {
-                clearInterval(screenUpdateInterval);
-                screenUpdateInterval = null;
-            }
-        }
-
-        function addControlListeners() {
-            const screen = document.getElementById('screen');
-            console.log('Adding event listeners to screen element:', screen);
-            
-            screen.addEventListener('click', handleMouseClick);
-            screen.addEventListener('mousemove', handleMouseMove);
-            screen.addEventListener('wheel', handleMouseWheel);
-            document.addEventListener('keydown', handleKeyDown);
-            document.addEventListener('keyup', handleKeyUp);
-            
-            console.log('Event listeners added successfully');
-        }
-
-        function removeControlListeners() {
-            const screen = document.getElementById('screen');
-            
-            screen.removeEventListener('click', handleMouseClick);
-            screen.removeEventListener('mousemove', handleMouseMove);
-            screen.removeEventListener('wheel', handleMouseWheel);
-            document.removeEventListener('keydown', handleKeyDown);
-            document.removeEventListener('keyup', handleKeyUp);
-        }
-
-        function handleMouseClick(event) {
-            if (!currentSessionId) return;
-            
-            console.log('Mouse click detected!', event);
-            
-            const rect = event.target.getBoundingClientRect();
-            
-            // Calculate more accurate coordinates
-            const x = (event.clientX - rect.left) / rect.width;
-            const y = (event.clientY - rect.top) / rect.height;
-            
-            // Ensure coordinates are within bounds
-            const clampedX = Math.max(0, Math.min(1, x));
-            const clampedY = Math.max(0, Math.min(1, y));
-            
-            console.log('Click coordinates (relative):', clampedX, clampedY);
-            console.log('Screen rect:', rect);
-            console.log('Event position:', event.clientX, event.clientY);
-            
-            const command = {
-                type: 'mouse',
-                action: 'click',
-                x: clampedX,
-                y: clampedY,
-                button: event.button === 2 ? 'right' : 'left'
-            };
-            
-            console.log('Sending command:', command);
-            sendCommand(command);
-            
-            // Prevent default action and stop propagation
-            event.preventDefault();
-            event.stopPropagation();
-        }
-
-        function handleMouseMove(event) {
-            if (!currentSessionId) return;
-            
-            const rect = event.target.getBoundingClientRect();
-            const x = (event.clientX - rect.left) / rect.width;
-            const y = (event.clientY - rect.top) / rect.height;
-            
-            // Throttle mouse movement to reduce server load
-            const now = Date.now();
-            if (now - lastMouseMove < 50) return; // Max 20 moves per second
-            lastMouseMove = now;
-            
-            // Ensure coordinates are within bounds
-            const clampedX = Math.max(0, Math.min(1, x));
-            const clampedY = Math.max(0, Math.min(1, y));
-            
-            sendCommand({
-                type: 'mouse',
-                action: 'move',
-                x: clampedX,
-                y: clampedY
-            });
-        }
-
-        function handleMouseWheel(event) {
-            if (!currentSessionId) return;
-            
-            event.preventDefault();
-            sendCommand({
-                type: 'mouse',
-                action: 'scroll',
-                deltaY: event.deltaY
-            });
-        }
-
-        function handleKeyDown(event) {
-            if (!currentSessionId) return;
-            if (event.target.tagName === 'INPUT') return;
-            
-            event.preventDefault();
-            sendCommand({
-                type: 'keyboard',
-                action: 'keydown',
-                key: event.key
-            });
-        }
-
-        function handleKeyUp(event) {
-            if (!currentSessionId) return;
-            if (event.target.tagName === 'INPUT') return;
-            
-            event.preventDefault();
-            sendCommand({
-                type: 'keyboard',
-                action: 'keyup',
-                key: event.key
-            });
-        }
-
-        function sendCommand(command) {
-            if (!currentSessionId) return;
-            
-            console.log('Sending command to server:', command);
-            
-            fetch('/api/command', {
-                method: 'POST',
-                headers: {
-                    'Content-Type': 'application/json'
-                },
-                body: JSON.stringify({
-                    sessionId: currentSessionId,
-                    ...command
-                })
-            }).then(response => {
-                console.log('Command response:', response);
-                return response.json();
-            }).then(data => {
-                console.log('Command result:', data);
-            }).catch(error => {
-                console.error('Command send error:', error);
-            });
-        }
-
-        function refreshSessions() {
-            fetch('/api/sessions')
-                .then(response => response.json())
-                .then(sessions => {
-                    const sessionsList = document.getElementById('sessionsList');
-                    
-                    if (sessions.length === 0) {
-                        sessionsList.innerHTML = '<p>No active sessions</p>';
-                        return;
-                    }
-                    
-                    sessionsList.innerHTML = sessions.map(session => `
-                        <div class="session-item ${session.sessionId === currentSessionId ? 'active' : ''}" 
-                             onclick="document.getElementById('sessionId').value='${session.sessionId}'">
-                            <div>
-                                <strong>${session.sessionId}</strong><br>
-                                <small>${session.platform} - ${session.hasScreen ? '📺' : '📱'}</small>
-                            </div>
-                            <div>
-                                <small>${new Date(session.lastSeen * 1000).toLocaleTimeString()}</small>
-                            </div>
-                        </div>
-                    `).join('');
-                })
-                .catch(error => {
-                    console.error('Sessions refresh error:', error);
-                    document.getElementById('sessionsList').innerHTML = '<p>Failed to load sessions</p>';
-                });
-        }
-
-        // Auto-refresh sessions every 10 seconds
-        setInterval(refreshSessions, 10000);
-        
-        // Initial load
-        refreshSessions();
-
-        // Handle right-click context menu prevention on screen
-        document.getElementById('screen').addEventListener('contextmenu', function(e) {
-            e.preventDefault();
-            return false;
-        });
-    </script>
-</body>
-</html>'''
-        
-        return RequestHandler
-
-
-class RemoteControlAgent:
-    """Remote Control Agent for University Computers"""
-    
-    def __init__(self, server_url):
-        self.server_url = server_url.rstrip('/')
-        self.session_id = None
-        self.running = False
-        self.settings = {
-            'screen_fps': 1,
-            'screen_quality': 50,
-            'screen_width': 800,
-            'screen_height': 600,
-            'command_check_interval': 0.1,
-            'connection_timeout': 10,
-            'retry_delay': 2
-        }
-        self.last_screen_time = 0
-
-    def start(self):
-        """Start the remote control agent"""
-        print("🤖 University Remote Control Agent Starting...")
-        print(f"📡 Server: {self.server_url}")
-        print(f"🔧 PIL Available: {HAS_PIL}")
-        print(f"🔧 Input Control: {HAS_PYNPUT}")
-        
-        if not self.register():
-            print("❌ Failed to register with server")
-            return
-        
-        print()
-        print("=" * 60)
-        print(f"✅ Agent Active! Session ID: {self.session_id}")
-        print("📋 COPY THIS SESSION ID TO YOUR CONTROLLER!")
-        print(f"🌐 Controller URL: {self.server_url}")
-        print("=" * 60)
-        print()
-        print("🔄 Agent is running... Press Ctrl+C to stop")
-        
-        self.running = True
-        
-        # Start background threads for screen capture and command processing
-        if HAS_PIL:
-            screen_thread = threading.Thread(target=self.screen_capture_loop, daemon=True)
-            screen_thread.start()
-        
-        if HAS_PYNPUT:
-            command_thread = threading.Thread(target=self.command_loop, daemon=True)
-            command_thread.start()
-        
-        try:
-            while self.running:
-                time.sleep(1)
-        except KeyboardInterrupt:
-            print("\n🛑 Agent stopped by user")
-            self.running = False
-
-    def register(self):
-        """Register agent with server and get session ID"""
-        data = {
-            'platform': sys.platform,
-            'python_version': sys.version.split()[0],
-            'has_pil': HAS_PIL,
-            'has_pynput': HAS_PYNPUT,
-            'timestamp': datetime.now().isoformat(),
-            'agent_type': 'university'
-        }
-        
-        try:
-            print("📝 Registering with server...")
-            response = self.http_post('/api/register', data)
-            if response and 'sessionId' in response:
-                self.session_id = response['sessionId']
-                print("✅ Server registration successful")
-                return True
-        except Exception as e:
-            print(f"⚠️ Server registration failed: {e}")
-        
-        # Fallback - generate local session ID
-        try:
-            self.session_id = secrets.token_hex(4).upper()
-            print("⚠️ Using local session ID (server unavailable)")
-            return True
-        except:
-            import random
-            self.session_id = f"{random.randint(1000, 9999):04d}"
-            print("⚠️ Using random session ID (crypto unavailable)")
-            return True
-
-    def screen_capture_loop(self):
-        """Continuously capture and send screen updates"""
-        fps_delay = 1.0 / self.settings.get('screen_fps', 1)
-        
-        while self.running:
-            try:
-                current_time = time.time()
-                if current_time - self.last_screen_time >= fps_delay:
-                    screen_data = self.capture_screen()
-                    if screen_data:
-                        self.send_screen(screen_data)
-                    self.last_screen_time = current_time
-                time.sleep(0.1)
-            except Exception as e:
-                print(f"Screen capture error: {e}")
-                time.sleep(self.settings.get('retry_delay', 2))
-
-    def command_loop(self):
-        """Continuously check for and execute remote commands"""
-        check_interval = self.settings.get('command_check_interval', 0.1)
-        
-        while self.running:
-            try:
-                commands = self.get_commands()
-                for command in commands:
-                    self.execute_command(command)
-                time.sleep(check_interval)
-            except Exception as e:
-                print(f"Command loop error: {e}")
-                time.sleep(self.settings.get('retry_delay', 2))
-
-    def capture_screen(self):
-        """Capture screen using PIL"""
-        if not HAS_PIL:
-            return None
-            
-        try:
-            screenshot = ImageGrab.grab()
-            
-            # Resize for performance
-            width = self.settings.get('screen_width', 800)
-            height = self.settings.get('screen_height', 600)
-            screenshot = screenshot.resize((width, height))
-            
-            # Convert to JPEG
-            buffer = io.BytesIO()
-            quality = self.settings.get('screen_quality', 50)
-            screenshot.save(buffer, format='JPEG', quality=quality)
-            
-            return base64.b64encode(buffer.getvalue()).decode()
-        except Exception as e:
-            print(f"Screen capture error: {e}")
-            return None
-
-    def send_screen(self, screen_data):
-        """Send screen data to server"""
-        data = {
-            'sessionId': self.session_id,
-            'data': screen_data,
-            'timestamp': int(time.time() * 1000)
-        }
-        
-        try:
-            self.http_post('/api/screen', data)
-        except Exception as e:
-            # Don't spam console with screen upload errors
-            pass
-
-    def get_commands(self):
-        """Get pending commands from server"""
-        try:
-            response = self.http_get(f'/api/commands/{self.session_id}')
-            return response if response else []
-        except:
-            return []
-
-    def execute_command(self, command):
-        """Execute a remote command"""
-        if not HAS_PYNPUT:
-            return
-            
-        try:
-            cmd_type = command.get('type')
-            
-            if cmd_type == 'mouse':
-                self.handle_mouse_command(command)
-            elif cmd_type == 'keyboard':
-                self.handle_keyboard_command(command)
-            elif cmd_type == 'special':
-                self.handle_special_command(command)
-        except Exception as e:
-            print(f"Command execution error: {e}")
-
-    def handle_mouse_command(self, command):
-        """Handle mouse commands using pynput"""
-        try:
-            x = int(command.get('x', 0) * 1920)  # Scale to screen
-            y = int(command.get('y', 0) * 1080)
-            
-            mouse_controller = mouse.Controller()
-            
-            action = command.get('action')
-            if action == 'move':
-                mouse_controller.position = (x, y)
-            elif action == 'click':
-                mouse_controller.position = (x, y)
-                button = mouse.Button.right if command.get('button') == 'right' else mouse.Button.left
-                mouse_controller.click(button)
-            elif action == 'scroll':
-                dy = command.get('deltaY', 0)
-                mouse_controller.scroll(0, -dy // 120)  # Convert to scroll units
-        except Exception as e:
-            print(f"Mouse command error: {e}")
-
-    def handle_keyboard_command(self, command):
-        """Handle keyboard commands using pynput"""
-        try:
-            key_controller = keyboard.Controller()
-            key = command.get('key', '')
-            
-            # Map special keys
-            key_map = {
-                'Enter': keyboard.Key.enter,
-                'Escape': keyboard.Key.esc,
-                'Backspace': keyboard.Key.backspace,
-                'Tab': keyboard.Key.tab,
-                'ArrowUp': keyboard.Key.up,
-                'ArrowDown': keyboard.Key.down,
-                'ArrowLeft': keyboard.Key.left,
-                'ArrowRight': keyboard.Key.right,
-                'Delete': keyboard.Key.delete,
-                'Home': keyboard.Key.home,
-                'End': keyboard.Key.end,
-                'PageUp': keyboard.Key.page_up,
-                'PageDown': keyboard.Key.page_down,
-            }
-            
-            if command.get('action') == 'keydown':
-                if key in key_map:
-                    key_controller.press(key_map[key])
-                elif len(key) == 1:
-                    key_controller.press(key)
-            elif command.get('action') == 'keyup':
-                if key in key_map:
-                    key_controller.release(key_map[key])
-                elif len(key) == 1:
-                    key_controller.release(key)
-            elif command.get('action') == 'type':
-                key_controller.type(key)
-        except Exception as e:
-            print(f"Keyboard command error: {e}")
-
-    def handle_special_command(self, command):
-        """Handle special system commands"""
-        action = command.get('action')
-        if action == 'ctrl-alt-del':
-            print("⚠️ Ctrl+Alt+Del requested (not implemented for security)")
-        elif action == 'alt-tab':
-            try:
-                key_controller = keyboard.Controller()
-                key_controller.press(keyboard.Key.alt)
-                key_controller.press(keyboard.Key.tab)
-                key_controller.release(keyboard.Key.tab)
-                key_controller.release(keyboard.Key.alt)
-            except:
-                pass
-        else:
-            print(f"Special command: {action}")
-
-    def http_get(self, path):
-        """Make HTTP GET request"""
-        try:
-            timeout = self.settings.get('connection_timeout', 10)
-            with urllib.request.urlopen(f"{self.server_url}{path}", timeout=timeout) as response:
-                return json.loads(response.read().decode())
-        except Exception as e:
-            raise Exception(f"GET {path} failed: {e}")
-
-    def http_post(self, path, data):
-        """Make HTTP POST request"""
-        try:
-            json_data = json.dumps(data).encode()
-            req = urllib.request.Request(
-                f"{self.server_url}{path}",
-                data=json_data,
-                headers={'Content-Type': 'application/json'}
-            )
-            timeout = self.settings.get('connection_timeout', 10)
-            with urllib.request.urlopen(req, timeout=timeout) as response:
-                return json.loads(response.read().decode())
-        except Exception as e:
-            raise Exception(f"POST {path} failed: {e}")
-
-
-def main():
-    """Main entry point"""
-    if len(sys.argv) < 2:
-        print("University Remote Control System")
-        print("Usage:")
-        print("  python remote_control.py server [PORT]     # Start server")
-        print("  python remote_control.py agent SERVER_URL  # Start agent")
-        sys.exit(1)
-    
-    mode = sys.argv[1].lower()
-    
-    if mode == 'server':
-        # Start server mode
-        port = int(os.environ.get('PORT', 8080))  # Railway sets PORT environment variable
-        if len(sys.argv) > 2:
-            port = int(sys.argv[2])
-        
-        server = RemoteControlServer(port)
-        server.start()
-        
-    elif mode == 'agent':
-        # Start agent mode
-        if len(sys.argv) < 3:
-            print("Error: Agent mode requires server URL")
-            print("Usage: python remote_control.py agent SERVER_URL")
-            sys.exit(1)
-        
-        server_url = sys.argv[2]
-        agent = RemoteControlAgent(server_url)
-        agent.start()
-        
-    else:
-        print(f"Unknown mode: {mode}")
-        print("Available modes: server, agent")
-        sys.exit(1)
-
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+"""
+Universal Remote Control System - Single Python Script
+Zero-installation remote control for university environments.
+
+Usage:
+    python remote_control.py server [PORT]             # Start server
+    python remote_control.py server PORT --workers N   # Start N server processes
+    python remote_control.py agent SERVER_URL          # Start agent
+"""
+
+import sys
+import os
+import json
+import time
+import threading
+import base64
+import hashlib
+import math
+import gzip
+import secrets
+import random
+import http.client
+import urllib.request
+import urllib.parse
+import urllib.error
+from http.server import HTTPServer, BaseHTTPRequestHandler
+from urllib.parse import parse_qs, urlparse
+import socketserver
+from datetime import datetime, timedelta
+import queue
+import io
+import socket
+import select
+import struct
+import heapq
+from collections import deque
+import contextlib
+import ipaddress
+import bisect
+import mmap
+
+# Try to import optional dependencies with fallbacks
+try:
+    import PIL.ImageGrab as ImageGrab
+    from PIL import Image
+    HAS_PIL = True
+except ImportError:
+    HAS_PIL = False
+
+# Shared with agent.py. This file also runs on its own (downloaded, or
+# deployed as one script); the built-in agent then sends whole frames.
+try:
+    from change_detection import CHANGE_DETECTION, ChangeDetector, scale_tiles
+    HAS_CHANGE_DETECTION = True
+except ImportError:
+    CHANGE_DETECTION = 'auto'
+    HAS_CHANGE_DETECTION = False
+
+try:
+    # Import pynput for mouse and keyboard control
+    import pynput.mouse as pynput_mouse
+    import pynput.keyboard as pynput_keyboard
+    mouse = pynput_mouse
+    keyboard = pynput_keyboard
+    HAS_PYNPUT = True
+except ImportError:
+    HAS_PYNPUT = False
+
+try:
+    # Shared session store for multi-process servers
+    import sqlite3
+    HAS_SQLITE = True
+except ImportError:
+    HAS_SQLITE = False
+
+try:
+    # Advisory locks let worker processes append to the same recording
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
+# Sessions that have not been seen for this long are dropped (30 minutes)
+SESSION_TIMEOUT = 1800
+
+# Longest the session reaper sleeps between expiry checks (seconds)
+REAPER_INTERVAL = 60
+
+# Upper bound for how long a long-poll command request is held open (seconds)
+MAX_LONG_POLL = 30
+
+# Largest frame upload accepted from an agent (bytes)
+MAX_FRAME_BYTES = 16 * 1024 * 1024
+
+# Session change events kept for Server-Sent Events subscribers to catch up on
+MAX_SESSION_EVENTS = 256
+
+# WebSocket handshake GUID (RFC 6455) and keep-alive ping interval (seconds)
+WEBSOCKET_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+WS_PING_INTERVAL = 20
+
+# HTTP/1.1 keep-alive: how long a connection may sit idle waiting for its
+# next request (seconds), requests served on one connection before it is
+# closed, and the largest unread request body drained to keep it open (bytes)
+KEEPALIVE_TIMEOUT = 5
+KEEPALIVE_MAX_REQUESTS = 1000
+MAX_DRAIN_BYTES = 64 * 1024
+
+# Longest a client may stall while sending its headers or body (seconds).
+# Only streams and WebSockets, which wait on purpose, lift it.
+REQUEST_READ_TIMEOUT = 30
+
+# Long-lived connections open at once, per kind: Server-Sent Events, MJPEG
+# streams (live and playback), WebSockets and command long-polls. Their
+# threads are counted apart from the worker pool so open streams never
+# starve ordinary requests; past its limit a stream is refused with 503.
+# The "stream_limits" config section overrides these.
+STREAM_LIMITS = {'sse': 256, 'mjpeg': 64, 'ws': 256, 'poll': 512}
+STREAM_RETRY_AFTER = 5
+
+# Part separator of the MJPEG multipart stream
+MJPEG_BOUNDARY = 'frame'
+
+# Commands held per session before the drop policy kicks in. Controllers are
+# told to back off once a queue is half full.
+MAX_COMMAND_QUEUE = 256
+
+# How a full command queue makes room: 'drop-motion' evicts the oldest mouse
+# move or scroll first, 'drop-oldest' the oldest command of any kind, and
+# 'reject' refuses the new command. Key-ups are never dropped either way.
+COMMAND_DROP_POLICIES = ('drop-motion', 'drop-oldest', 'reject')
+
+# Database used when the "server" config selects the shared SQLite store, and
+# how often its waiters re-check for changes made by other processes (seconds)
+DEFAULT_SESSION_DB = 'remote_control_sessions.db'
+SQLITE_POLL_INTERVAL = 0.05
+
+# Session recordings: one index record per frame (server receive time in ms,
+# offset and length in the segment file), frames buffered for the writer
+# thread, and how long the writer keeps idle files open (seconds)
+RECORD_INDEX_FORMAT = '<dQI'
+RECORD_QUEUE_SIZE = 256
+RECORDER_IDLE_CLOSE = 30
+
+# Recording playback: allowed speed-ups, and the longest pause between two
+# recorded frames that is played back in real time (seconds)
+PLAYBACK_SPEEDS = (1, 2, 4, 8)
+PLAYBACK_MAX_GAP = 2
+
+# Upper bounds (seconds) of the latency and frame-age histogram buckets
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+# Window over which per-session ingest rates are averaged (seconds)
+INGEST_RATE_WINDOW = 10
+
+# Latency tracing: clock samples kept per peer (the one with the shortest
+# round trip wins), how often WebSocket peers resample (seconds), and traced
+# commands an agent holds for its next frame
+CLOCK_SAMPLES = 8
+CLOCK_SYNC_INTERVAL = 10
+MAX_FRAME_TRACES = 32
+
+# Partial frame updates: agents send only the tiles that changed
+# since their last keyframe, and a keyframe instead once more than
+# TILE_FULL_FRAME_RATIO of the screen changed. The server keeps at most
+# MAX_FRAME_TILES tiles on one keyframe before asking for a new one.
+TILE_FULL_FRAME_RATIO = 0.5
+MAX_FRAME_TILES = 1024
+TILES_CONTENT_TYPE = 'application/x-frame-tiles'
+
+# How long browsers may reuse the controller page before revalidating it
+# with its ETag (seconds). The page lives at a fixed URL, so this also bounds
+# how long a redeployed page takes to reach open browsers.
+WEB_PAGE_MAX_AGE = 3600
+
+# Admission control: token buckets kept before idle ones are pruned, and
+# the limit names accepted in the "rate_limits" config section
+MAX_ADMISSION_BUCKETS = 10000
+RATE_LIMITS = {
+    'ingest': 'ingest_bytes_per_second',
+    'commands': 'commands_per_second',
+    'polls': 'polls_per_second',
+}
+
+# Route templates used as metric labels: exact paths, then prefixes that
+# are followed by a session ID
+ROUTES = ('/', '/api/sessions', '/api/screen', '/api/events', '/api/recordings',
+          '/api/register', '/api/command', '/api/unregister', '/api/metrics')
+ROUTE_PREFIXES = ('/api/commands/', '/api/screen/', '/api/stream/', '/api/recordings/',
+                  '/ws/agent/', '/ws/control/')
+
+
+class WebSocketClosed(Exception):
+    """Raised when the peer closes a WebSocket or the stream ends"""
+
+
+class WebSocket:
+    """Minimal RFC 6455 WebSocket endpoint built on the standard library
+
+    Works on both ends of the connection: the server wraps the request
+    handler's streams, while agents use connect() and mask what they send.
+    """
+
+    OP_CONTINUATION = 0x0
+    OP_TEXT = 0x1
+    OP_BINARY = 0x2
+    OP_CLOSE = 0x8
+    OP_PING = 0x9
+    OP_PONG = 0xA
+
+    MAX_MESSAGE = 32 * 1024 * 1024
+
+    def __init__(self, rfile, write, mask=False, sock=None):
+        self.rfile = rfile
+        self.write = write
+        self.mask = mask
+        self.sock = sock
+        self.send_lock = threading.Lock()
+        self.closed = False
+
+    @staticmethod
+    def accept_key(key):
+        """Compute Sec-WebSocket-Accept for a client's Sec-WebSocket-Key"""
+        digest = hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()
+        return base64.b64encode(digest).decode()
+
+    @staticmethod
+    def apply_mask(payload, key):
+        """XOR payload with the 4-byte masking key"""
+        length = len(payload)
+        if not length:
+            return b''
+        key_stream = (key * (length // 4 + 1))[:length]
+        masked = int.from_bytes(payload, 'little') ^ int.from_bytes(key_stream, 'little')
+        return masked.to_bytes(length, 'little')
+
+    @classmethod
+    def connect(cls, url, timeout=10):
+        """Open a client WebSocket to an http(s):// or ws(s):// URL"""
+        parsed = urlparse(url)
+        secure = parsed.scheme in ('https', 'wss')
+        host = parsed.hostname
+        port = parsed.port or (443 if secure else 80)
+        
+        sock = socket.create_connection((host, port), timeout=timeout)
+        if secure:
+            import ssl
+            sock = ssl.create_default_context().wrap_socket(sock, server_hostname=host)
+        
+        key = base64.b64encode(os.urandom(16)).decode()
+        path = parsed.path or '/'
+        if parsed.query:
+            path += '?' + parsed.query
+        handshake = (
+            f"GET {path} HTTP/1.1\r\n"
+            f"Host: {parsed.netloc}\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\n"
+            "Sec-WebSocket-Version: 13\r\n\r\n"
+        )
+        sock.sendall(handshake.encode())
+        
+        rfile = sock.makefile('rb')
+        status = rfile.readline().decode('latin-1')
+        headers = {}
+        while True:
+            line = rfile.readline().decode('latin-1').strip()
+            if not line:
+                break
+            name, _, value = line.partition(':')
+            headers[name.strip().lower()] = value.strip()
+        
+        if ' 101 ' not in status or headers.get('sec-websocket-accept') != cls.accept_key(key):
+            sock.close()
+            raise ConnectionError(f"WebSocket upgrade refused: {status.strip()}")
+        
+        # Server pings every WS_PING_INTERVAL, so a silent socket is a dead one
+        sock.settimeout(WS_PING_INTERVAL * 3)
+        return cls(rfile, sock.sendall, mask=True, sock=sock)
+
+    def read_exact(self, length):
+        """Read exactly length bytes or raise WebSocketClosed"""
+        data = self.rfile.read(length)
+        if data is None or len(data) < length:
+            raise WebSocketClosed('connection closed')
+        return data
+
+    def recv(self):
+        """Return the next (opcode, payload) data message
+
+        Pings are answered, pongs are ignored and fragmented messages are
+        reassembled. Raises WebSocketClosed when the peer goes away.
+        """
+        message = None
+        message_opcode = None
+        while True:
+            first, second = self.read_exact(2)
+            fin = first & 0x80
+            opcode = first & 0x0F
+            length = second & 0x7F
+            if length == 126:
+                length = struct.unpack('>H', self.read_exact(2))[0]
+            elif length == 127:
+                length = struct.unpack('>Q', self.read_exact(8))[0]
+            if length > self.MAX_MESSAGE:
+                self.close()
+                raise WebSocketClosed('message too large')
+            key = self.read_exact(4) if second & 0x80 else None
+            payload = self.read_exact(length)
+            if key:
+                payload = self.apply_mask(payload, key)
+            
+            if opcode == self.OP_PING:
+                self.send(payload, self.OP_PONG)
+            elif opcode == self.OP_PONG:
+                continue
+            elif opcode == self.OP_CLOSE:
+                self.close()
+                raise WebSocketClosed('closed by peer')
+            elif opcode == self.OP_CONTINUATION:
+                if message is None:
+                    raise WebSocketClosed('unexpected continuation frame')
+                message += payload
+                if fin:
+                    return message_opcode, bytes(message)
+            elif fin:
+                return opcode, payload
+            else:
+                message_opcode = opcode
+                message = bytearray(payload)
+
+    @staticmethod
+    def encode(payload, opcode=OP_BINARY, mask_key=None):
+        """Encode one unfragmented WebSocket frame"""
+        length = len(payload)
+        mask_bit = 0x80 if mask_key else 0
+        header = bytearray([0x80 | opcode])
+        if length < 126:
+            header.append(mask_bit | length)
+        elif length < 65536:
+            header.append(mask_bit | 126)
+            header += struct.pack('>H', length)
+        else:
+            header.append(mask_bit | 127)
+            header += struct.pack('>Q', length)
+        if mask_key:
+            header += mask_key
+            payload = WebSocket.apply_mask(payload, mask_key)
+        return bytes(header) + payload
+
+    def send(self, payload, opcode=OP_BINARY):
+        """Send one message; text payloads may be str"""
+        if isinstance(payload, str):
+            payload = payload.encode('utf-8')
+        data = self.encode(payload, opcode, os.urandom(4) if self.mask else None)
+        with self.send_lock:
+            if self.closed and opcode != self.OP_CLOSE:
+                raise WebSocketClosed('connection closed')
+            self.write(data)
+
+    def send_frame(self, data):
+        """Send a frame already built by encode(), shared between connections"""
+        with self.send_lock:
+            if self.closed:
+                raise WebSocketClosed('connection closed')
+            self.write(data)
+
+    def send_text(self, text):
+        """Send a text message"""
+        self.send(text, self.OP_TEXT)
+
+    def ping(self):
+        """Send a keep-alive ping"""
+        self.send(b'', self.OP_PING)
+
+    def close(self):
+        """Send a close frame (once) and release the socket if we own it"""
+        if self.closed:
+            return
+        try:
+            self.send(b'', self.OP_CLOSE)
+        except OSError:
+            pass
+        self.closed = True
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+
+
+def pack_frame_message(meta, payload):
+    """Pack frame metadata and image bytes into one binary message
+
+    Layout: 4-byte big-endian header length, JSON header, image bytes.
+    """
+    header = json.dumps(meta).encode()
+    return struct.pack('>I', len(header)) + header + payload
+
+
+def parse_json_object(data):
+    """json.loads for messages that must be a JSON object; ValueError otherwise"""
+    value = json.loads(data)
+    if not isinstance(value, dict):
+        raise ValueError("Expected a JSON object")
+    return value
+
+
+def unpack_frame_message(message):
+    """Split a binary frame message into (metadata dict, image bytes)"""
+    (header_length,) = struct.unpack_from('>I', message)
+    meta = parse_json_object(message[4:4 + header_length])
+    return meta, message[4 + header_length:]
+
+
+def pack_tiles(meta, tiles):
+    """Pack (x, y, w, h, jpeg) tiles into one frame message
+
+    meta gains 'tiles': [[x, y, w, h, length], ...] and the payload is the
+    tile images back to back in the same order.
+    """
+    meta = dict(meta, tiles=[[x, y, w, h, len(data)] for x, y, w, h, data in tiles])
+    return pack_frame_message(meta, b''.join(tile[4] for tile in tiles))
+
+
+def unpack_tiles(meta, payload):
+    """Split the payload of a tile message into (x, y, w, h, jpeg) tiles"""
+    entries = meta['tiles']
+    if not isinstance(entries, list):
+        raise ValueError("'tiles' must be a list")
+    tiles = []
+    offset = 0
+    for entry in entries:
+        if (not isinstance(entry, list) or len(entry) != 5
+                or not all(isinstance(value, int) and value >= 0 for value in entry)):
+            raise ValueError("Each tile must be [x, y, w, h, length] of non-negative integers")
+        x, y, w, h, length = entry
+        tiles.append((x, y, w, h, payload[offset:offset + length]))
+        offset += length
+    if offset != len(payload):
+        raise ValueError("Tile lengths do not add up to the payload")
+    return tiles
+
+
+def tiles_base_version(screen_info):
+    """Version of the frame a tile update was applied on top of"""
+    version = screen_info['version']
+    return max((tile[0] for tile in screen_info['tiles'] if tile[0] < version),
+               default=screen_info['key_version'])
+
+
+def composite_tiles(image, tiles, quality=85):
+    """Paste (version, x, y, w, h, jpeg) tiles onto a keyframe and encode the result"""
+    frame = Image.open(io.BytesIO(image)).convert('RGB')
+    for _, x, y, w, h, data in tiles:
+        frame.paste(Image.open(io.BytesIO(data)), (x, y))
+    buffer = io.BytesIO()
+    frame.save(buffer, format='JPEG', quality=quality)
+    return buffer.getvalue()
+
+
+class ClockOffset:
+    """Estimate how far the server's clock is ahead of ours
+
+    Each sample is one request: t0 sent and t3 answered on our clock, t1
+    received and t2 replied on the server's. Queueing only ever lengthens
+    the round trip and skews the midpoint, so the sample with the shortest
+    round trip among the last few is trusted.
+    """
+
+    def __init__(self):
+        self.samples = deque(maxlen=CLOCK_SAMPLES)
+        self.offset = 0.0
+        self.rtt = None
+
+    def add(self, t0, t1, t3, t2=None):
+        """Add a sample; all times in milliseconds"""
+        t2 = t1 if t2 is None else t2
+        self.samples.append(((t3 - t0) - (t2 - t1), ((t1 - t0) + (t2 - t3)) / 2))
+        self.rtt, self.offset = min(self.samples)
+
+    def server_time(self, local_ms=None):
+        """Our time (default now) on the server's clock, in milliseconds"""
+        return (time.time() * 1000 if local_ms is None else local_ms) + self.offset
+
+
+def merge_command(last, command):
+    """Fold a command into the previously queued one when that is lossless
+
+    Consecutive mouse moves collapse to the latest position and consecutive
+    scrolls add up their deltaY, so a lagging agent never replays a stale
+    trajectory. Clicks and key events are never merged and keep their order.
+    Returns the merged command, or None if the two must stay separate.
+    """
+    if last is None or last.get('type') != 'mouse' or command.get('type') != 'mouse':
+        return None
+    action = command.get('action')
+    if action != last.get('action'):
+        return None
+    if action == 'move':
+        return command
+    if action == 'scroll':
+        merged = dict(command)
+        merged['deltaY'] = (last.get('deltaY') or 0) + (command.get('deltaY') or 0)
+        return merged
+    return None
+
+
+def is_motion_command(command):
+    """True for commands that are safe to lose: mouse moves and scrolls"""
+    return command.get('type') == 'mouse' and command.get('action') in ('move', 'scroll')
+
+
+def eviction_index(pending, drop_policy):
+    """Index of the queued command a full queue should drop, or None"""
+    if drop_policy == 'reject':
+        return None
+    candidates = [i for i, queued in enumerate(pending) if queued.get('action') != 'keyup']
+    if drop_policy == 'drop-motion':
+        candidates = [i for i in candidates if is_motion_command(pending[i])] or candidates
+    return candidates[0] if candidates else None
+
+
+def load_server_config():
+    """Load the "server" section of config.json, or {} if there is none"""
+    try:
+        config_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'config.json')
+        with open(config_path, 'r') as f:
+            return json.load(f).get('server', {})
+    except Exception:
+        return {}
+
+
+class FrameMailbox:
+    """Single-slot frame mailbox for one viewer of a session
+
+    The broadcaster overwrites the slot instead of queueing, so a viewer that
+    is still writing the previous frame skips straight to the newest one and
+    never holds up the agent or the other viewers.
+    """
+
+    def __init__(self, session_id):
+        self.session_id = session_id
+        self.frame = None
+        self.closed = False
+        self.skipped = 0
+        self.ready = threading.Condition(threading.Lock())
+
+    def offer(self, screen_info):
+        """Replace the pending frame with a newer one"""
+        with self.ready:
+            if self.frame is not None:
+                self.skipped += 1
+            self.frame = screen_info
+            self.ready.notify()
+
+    def close(self):
+        """Stop the viewer: its session is gone or its connection closed"""
+        with self.ready:
+            self.closed = True
+            self.ready.notify()
+
+    def take(self, timeout):
+        """Wait for the next frame; None on timeout or once closed"""
+        with self.ready:
+            if self.frame is None and not self.closed:
+                self.ready.wait(timeout)
+            screen_info, self.frame = self.frame, None
+            return screen_info
+
+
+class PooledHTTPServer(HTTPServer):
+    """HTTPServer that serves each connection on a bounded worker pool
+
+    A slow agent upload only ties up one worker, so controller polls,
+    command posts and other agents keep being served in parallel.
+    Workers are daemon threads so long polls and open streams never keep
+    the process alive after Ctrl+C. With reuse_port several processes can
+    listen on the same port and the kernel spreads connections among them.
+
+    A worker that starts a long-lived stream (see STREAM_LIMITS) leaves the
+    pool until the stream ends, and a new worker takes its place, so at
+    most max_workers threads serve ordinary requests and each stream kind
+    holds at most its own limit on top.
+    """
+
+    request_queue_size = 128
+
+    def __init__(self, server_address, handler_class, max_workers=512, reuse_port=False,
+                 stream_limits=None):
+        self.reuse_port = reuse_port
+        super().__init__(server_address, handler_class)
+        self.max_workers = max_workers
+        self.pending = queue.Queue()
+        self.workers = []
+        # One token per worker that is waiting for a connection
+        self.idle_workers = threading.Semaphore(0)
+        self.stream_limits = dict(STREAM_LIMITS, **(stream_limits or {}))
+        self.streams = dict.fromkeys(self.stream_limits, 0)
+        self.workers_lock = threading.Lock()
+
+    def server_bind(self):
+        """Bind the listening socket, sharing the port if asked to"""
+        if self.reuse_port:
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        super().server_bind()
+
+    def process_request(self, request, client_address):
+        """Hand the accepted connection to the worker pool"""
+        self.pending.put((request, client_address))
+        if self.idle_workers.acquire(blocking=False):
+            return
+        with self.workers_lock:
+            self.add_worker()
+
+    def pool_size(self):
+        """Workers serving ordinary requests, not streams"""
+        return len(self.workers) - sum(self.streams.values())
+
+    def add_worker(self):
+        """Start a worker if the pool has room; the caller holds workers_lock"""
+        if self.pool_size() < self.max_workers:
+            worker = threading.Thread(target=self.worker_loop, daemon=True,
+                                      name=f'rc-worker-{len(self.workers)}')
+            self.workers.append(worker)
+            worker.start()
+
+    def begin_stream(self, kind):
+        """Move the calling worker out of the pool; False if kind is at its limit"""
+        with self.workers_lock:
+            if self.streams[kind] >= self.stream_limits[kind]:
+                return False
+            self.streams[kind] += 1
+            if self.pending.qsize():
+                self.add_worker()  # Stand in for this worker
+        return True
+
+    def end_stream(self, kind):
+        """Return a worker whose stream ended to the pool"""
+        with self.workers_lock:
+            self.streams[kind] -= 1
+
+    def worker_loop(self):
+        """Serve queued connections until the server closes"""
+        while True:
+            item = self.pending.get()
+            if item is None:
+                return
+            self.process_request_thread(*item)
+            with self.workers_lock:
+                if self.pool_size() > self.max_workers:
+                    # Back from a stream while its stand-in kept the pool full
+                    self.workers.remove(threading.current_thread())
+                    return
+            self.idle_workers.release()
+
+    def process_request_thread(self, request, client_address):
+        """Serve one connection on a worker thread"""
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        """Close the listening socket and stop the worker pool"""
+        super().server_close()
+        for _ in self.workers:
+            self.pending.put(None)
+
+
+class SessionStore:
+    """Interface for session, command queue and latest-frame state
+
+    Backends keep the state itself. This base class holds what always stays
+    inside one server process: the conditions that wake waiting requests,
+    the push-viewer mailboxes and the reaper thread. MemorySessionStore
+    serves a single process; SqliteSessionStore lets several processes
+    serve the same fleet.
+
+    Command queues hold at most max_queue commands; see COMMAND_DROP_POLICIES
+    for how a full queue makes room.
+    """
+
+    def __init__(self, ttl=SESSION_TIMEOUT, max_queue=MAX_COMMAND_QUEUE,
+                 drop_policy='drop-motion'):
+        if drop_policy not in COMMAND_DROP_POLICIES:
+            raise ValueError(f"Unknown drop policy: {drop_policy}")
+        self.ttl = ttl
+        self.max_queue = max(1, max_queue)
+        self.drop_policy = drop_policy
+        # Guards process-local state across worker threads
+        self.lock = threading.RLock()
+        # Wakes long-polling agents when a command is queued
+        self.commands_ready = threading.Condition(self.lock)
+        # Wakes event streams when a frame or session event arrives
+        self.updates = threading.Condition(self.lock)
+        # session_id -> set of FrameMailbox for push viewers (MJPEG, WebSocket)
+        self.viewers = {}
+        # Newest frame version handed to each watched session's viewers
+        self.offered_versions = {}
+        # Commands evicted or refused because a queue was full
+        self.commands_dropped = 0
+        # Part of every frame ETag so tags never collide across restarts
+        self.instance_id = secrets.token_hex(4)
+        self.reaper = None
+        self.reaper_stop = threading.Event()
+
+    def register_session(self, data):
+        """Create a new agent session and return its ID"""
+        raise NotImplementedError
+
+    def drop_session(self, session_id, change):
+        """Remove a session with its queue and frame; returns False if unknown"""
+        raise NotImplementedError
+
+    def expire_sessions(self, now=None):
+        """Drop sessions whose deadline passed; returns their IDs"""
+        raise NotImplementedError
+
+    def next_deadline(self):
+        """Earliest time a session can expire, or None without sessions"""
+        raise NotImplementedError
+
+    def list_sessions(self):
+        """Return a summary of every active session"""
+        raise NotImplementedError
+
+    def queue_command(self, session_id, command):
+        """Queue a command for an agent, compacting moves and scrolls
+
+        Returns None for unknown sessions, otherwise a status dict for the
+        controller: 'status' is queued, merged, dropped (an older command was
+        evicted to make room) or rejected (the queue is full), 'queueDepth' is
+        the queue length and 'backpressure' asks the controller to slow down.
+        """
+        raise NotImplementedError
+
+    def take_commands(self, session_id, wait=0, stop=None):
+        """Remove and return all pending commands for a session
+
+        With wait > 0 the call blocks until a command arrives or wait seconds
+        pass, so agents can long-poll instead of hammering the endpoint.
+        Setting the optional stop event (and notifying) ends the wait early.
+        """
+        raise NotImplementedError
+
+    def store_screen(self, session_id, image, timestamp=None, content_type='image/jpeg',
+                     trace=None, key=None):
+        """Store the latest raw frame for a session and mark the agent as seen
+
+        Frames from agents that never registered (local fallback IDs) adopt
+        a session record so they fall under expiry like everyone else.
+        trace is the agent's latency trace for the frame, kept as 'trace'.
+        Every stored frame is a keyframe; key is the agent's name for it,
+        which later tile updates refer to. Returns the stored frame record.
+        """
+        raise NotImplementedError
+
+    def store_tiles(self, session_id, key, tiles, size=None, timestamp=None, trace=None):
+        """Apply changed tiles on top of the session's current keyframe
+
+        tiles are (x, y, w, h, jpeg) in the keyframe's pixels and size is
+        its [width, height]. The record keeps the keyframe image with every
+        tile since, each as (version, x, y, w, h, jpeg). Returns None when
+        the stored keyframe is not the one named key, or would carry more
+        than MAX_FRAME_TILES tiles: the agent must send a new keyframe.
+        Otherwise returns the stored frame record.
+        """
+        raise NotImplementedError
+
+    def tile_frame(self, current, key, tiles, size, timestamp, trace, version, now):
+        """Frame record for a tile update on top of current, or None if it does not apply"""
+        if (current is None or key is None or current.get('key') != key
+                or len(current.get('tiles', ())) + len(tiles) > MAX_FRAME_TILES):
+            return None
+        screen_info = {
+            'session_id': current['session_id'],
+            'image': current['image'],
+            'content_type': current['content_type'],
+            'key': key,
+            'key_version': current['key_version'],
+            'size': size or current.get('size'),
+            'tiles': current.get('tiles', []) + [(version,) + tuple(tile) for tile in tiles],
+            'timestamp': timestamp if timestamp is not None else now * 1000,
+            'received_at': now * 1000,
+            'version': version
+        }
+        if trace is not None:
+            screen_info['trace'] = trace
+        return screen_info
+
+    def get_screen(self, session_id):
+        """Return the latest frame for a session, or None"""
+        raise NotImplementedError
+
+    def wait_for_updates(self, session_id, after_version, after_event, timeout):
+        """Block until a newer frame for session_id or a newer session event
+
+        Returns (newer frame or None, [(event_id, event)...], resync) where
+        resync is True when events older than the retained window were missed.
+        """
+        raise NotImplementedError
+
+    def latest_event_id(self):
+        """ID of the newest session event, 0 if there is none"""
+        raise NotImplementedError
+
+    def queue_depths(self):
+        """Pending command count of every session with commands waiting"""
+        raise NotImplementedError
+
+    def has_session(self, session_id):
+        """True while the session is registered or still has a frame"""
+        raise NotImplementedError
+
+    def queue_status(self, status, depth):
+        """Status dict returned by queue_command"""
+        return {
+            'status': status,
+            'queueDepth': depth,
+            'backpressure': depth * 2 >= self.max_queue
+        }
+
+    def start_reaper(self, on_pass=None):
+        """Start the background expiry thread (idempotent)
+
+        on_pass, if given, is called from the reaper thread after every
+        expiry pass, for state kept about sessions outside the store.
+        """
+        if self.reaper is None:
+            self.reaper_stop.clear()
+            self.reaper = threading.Thread(target=self.reaper_loop, args=(on_pass,), daemon=True,
+                                           name='rc-session-reaper')
+            self.reaper.start()
+
+    def stop_reaper(self):
+        """Stop the background expiry thread"""
+        self.reaper_stop.set()
+        self.reaper = None
+
+    def reaper_loop(self, on_pass=None):
+        """Expire sessions as their deadlines come due"""
+        while not self.reaper_stop.is_set():
+            self.expire_sessions()
+            if on_pass is not None:
+                on_pass()
+            next_deadline = self.next_deadline()
+            delay = REAPER_INTERVAL
+            if next_deadline is not None:
+                delay = min(max(next_deadline - time.time(), 1), REAPER_INTERVAL)
+            self.reaper_stop.wait(delay)
+
+    def add_viewer(self, session_id):
+        """Subscribe a push viewer to a session's frames
+
+        The returned mailbox is primed with the current frame, if any, so
+        the viewer has something to show straight away.
+        """
+        viewer = FrameMailbox(session_id)
+        with self.lock:
+            self.viewers.setdefault(session_id, set()).add(viewer)
+        screen_info = self.get_screen(session_id)
+        if screen_info is not None:
+            viewer.offer(screen_info)
+        return viewer
+
+    def remove_viewer(self, viewer):
+        """Unsubscribe a push viewer"""
+        with self.lock:
+            viewers = self.viewers.get(viewer.session_id)
+            if viewers is not None:
+                viewers.discard(viewer)
+                if not viewers:
+                    del self.viewers[viewer.session_id]
+                    self.offered_versions.pop(viewer.session_id, None)
+
+    def viewer_count(self, session_id):
+        """Number of push viewers of a session in this process"""
+        with self.lock:
+            return len(self.viewers.get(session_id, ()))
+
+    def broadcast(self, session_id, screen_info):
+        """Offer a frame to the session's push viewers, once per version"""
+        with self.lock:
+            viewers = self.viewers.get(session_id)
+            if not viewers or screen_info['version'] <= self.offered_versions.get(session_id, 0):
+                return
+            self.offered_versions[session_id] = screen_info['version']
+            for viewer in viewers:
+                viewer.offer(screen_info)
+
+    def close_viewers(self, session_id):
+        """End every push viewer of a session that is gone"""
+        with self.lock:
+            self.offered_versions.pop(session_id, None)
+            for viewer in self.viewers.pop(session_id, ()):
+                viewer.close()
+
+    def wake_waiters(self):
+        """Wake every blocked long-poll and stream so they re-check their state"""
+        with self.lock:
+            self.commands_ready.notify_all()
+            self.updates.notify_all()
+
+
+class MemorySessionStore(SessionStore):
+    """In-memory state for sessions, command queues and latest frames
+
+    Every session has exactly one entry in a min-heap keyed by its expiry
+    deadline. Activity only updates last_seen; when an entry reaches the top
+    of the heap the reaper either re-arms it with the real deadline or drops
+    the session. Touching is O(1) and expiry is amortized O(log n), and a
+    background thread reclaims dead agents' frames with nobody connected.
+    """
+
+    def __init__(self, ttl=SESSION_TIMEOUT, max_queue=MAX_COMMAND_QUEUE,
+                 drop_policy='drop-motion'):
+        super().__init__(ttl, max_queue, drop_policy)
+        self.sessions = {}
+        self.command_queues = {}
+        self.screen_data = {}
+        # (deadline, session_id) entries, one per live session
+        self.expiry_heap = []
+        self.frame_counter = 0
+        # Recent (event_id, event) session changes for /api/events
+        self.session_events = deque(maxlen=MAX_SESSION_EVENTS)
+        self.event_counter = 0
+
+    def register_session(self, data):
+        """Create a new agent session and return its ID"""
+        session_id = secrets.token_hex(4).upper()
+        now = time.time()
+        with self.lock:
+            self.sessions[session_id] = {
+                'platform': data.get('platform', 'unknown'),
+                'agent_type': data.get('agent_type', 'basic'),
+                'registered_at': now,
+                'last_seen': now
+            }
+            self.command_queues[session_id] = []
+            heapq.heappush(self.expiry_heap, (now + self.ttl, session_id))
+            self.publish_event(session_id, 'joined')
+        return session_id
+
+    def publish_event(self, session_id, change):
+        """Record a session change (joined/left/expired) and wake event streams"""
+        with self.lock:
+            self.event_counter += 1
+            self.session_events.append((self.event_counter, {
+                'sessionId': session_id,
+                'change': change,
+                'timestamp': time.time() * 1000
+            }))
+            self.updates.notify_all()
+
+    def drop_session(self, session_id, change):
+        """Remove a session with its queue and frame; returns False if unknown"""
+        with self.lock:
+            if self.sessions.pop(session_id, None) is None:
+                return False
+            self.command_queues.pop(session_id, None)
+            self.screen_data.pop(session_id, None)
+            self.close_viewers(session_id)
+            self.publish_event(session_id, change)
+        return True
+
+    def expire_sessions(self, now=None):
+        """Drop sessions whose deadline passed; returns their IDs"""
+        now = now or time.time()
+        expired_sessions = []
+        with self.lock:
+            while self.expiry_heap and self.expiry_heap[0][0] <= now:
+                _, session_id = heapq.heappop(self.expiry_heap)
+                session_data = self.sessions.get(session_id)
+                if session_data is None:
+                    continue  # Already removed (unregistered)
+                deadline = session_data.get('last_seen', 0) + self.ttl
+                if deadline > now:
+                    # Seen since this entry was armed: push the real deadline
+                    heapq.heappush(self.expiry_heap, (deadline, session_id))
+                else:
+                    self.drop_session(session_id, 'expired')
+                    expired_sessions.append(session_id)
+        return expired_sessions
+
+    def next_deadline(self):
+        """Earliest time a session can expire, or None without sessions"""
+        with self.lock:
+            return self.expiry_heap[0][0] if self.expiry_heap else None
+
+    def list_sessions(self):
+        """Return a summary of every active session"""
+        # Normally a no-op: the reaper keeps the heap drained
+        self.expire_sessions()
+        with self.lock:
+            return [
+                {
+                    'sessionId': session_id,
+                    'platform': session_data.get('platform', 'unknown'),
+                    'lastSeen': session_data.get('last_seen', 0),
+                    'hasScreen': session_id in self.screen_data,
+                    'viewers': self.viewer_count(session_id)
+                }
+                for session_id, session_data in self.sessions.items()
+            ]
+
+    def queue_command(self, session_id, command):
+        """Queue a command for an agent; see SessionStore.queue_command"""
+        with self.lock:
+            if session_id not in self.sessions:
+                return None
+            pending = self.command_queues.setdefault(session_id, [])
+            merged = merge_command(pending[-1] if pending else None, command)
+            status = 'queued'
+            if merged is not None:
+                pending[-1] = merged
+                status = 'merged'
+            else:
+                if len(pending) >= self.max_queue:
+                    index = eviction_index(pending, self.drop_policy)
+                    if index is not None:
+                        del pending[index]
+                        status = 'dropped'
+                    elif command.get('action') != 'keyup':
+                        status = 'rejected'
+                    if status != 'queued':
+                        self.commands_dropped += 1
+                if status != 'rejected':
+                    pending.append(command)
+            if status != 'rejected':
+                self.commands_ready.notify_all()
+            return self.queue_status(status, len(pending))
+
+    def take_commands(self, session_id, wait=0, stop=None):
+        """Remove and return all pending commands for a session"""
+        wait = max(0.0, min(float(wait), MAX_LONG_POLL))
+        with self.lock:
+            if session_id in self.sessions:
+                self.sessions[session_id]['last_seen'] = time.time()
+            if wait:
+                self.commands_ready.wait_for(
+                    lambda: self.command_queues.get(session_id) or (stop and stop.is_set()),
+                    timeout=wait)
+            commands = self.command_queues.get(session_id)
+            if not commands:
+                return []
+            self.command_queues[session_id] = []
+        return commands
+
+    def store_screen(self, session_id, image, timestamp=None, content_type='image/jpeg',
+                     trace=None, key=None):
+        """Store the latest raw frame for a session and mark the agent as seen"""
+        now = time.time()
+        screen_info = {
+            'session_id': session_id,
+            'image': image,
+            'content_type': content_type,
+            'timestamp': timestamp if timestamp is not None else now * 1000,
+            'received_at': now * 1000
+        }
+        if trace is not None:
+            screen_info['trace'] = trace
+        if key is not None:
+            screen_info['key'] = key
+        with self.lock:
+            if session_id in self.sessions:
+                self.sessions[session_id]['last_seen'] = now
+            else:
+                self.sessions[session_id] = {
+                    'platform': 'unknown',
+                    'agent_type': 'unregistered',
+                    'registered_at': now,
+                    'last_seen': now
+                }
+                heapq.heappush(self.expiry_heap, (now + self.ttl, session_id))
+                self.publish_event(session_id, 'joined')
+            self.frame_counter += 1
+            screen_info['version'] = screen_info['key_version'] = self.frame_counter
+            self.screen_data[session_id] = screen_info
+            self.broadcast(session_id, screen_info)
+            self.updates.notify_all()
+        return screen_info
+
+    def store_tiles(self, session_id, key, tiles, size=None, timestamp=None, trace=None):
+        """Apply changed tiles on top of the current keyframe; see SessionStore"""
+        now = time.time()
+        with self.lock:
+            screen_info = self.tile_frame(self.screen_data.get(session_id), key, tiles, size,
+                                          timestamp, trace, self.frame_counter + 1, now)
+            if screen_info is None:
+                return None
+            self.frame_counter += 1
+            if session_id in self.sessions:
+                self.sessions[session_id]['last_seen'] = now
+            self.screen_data[session_id] = screen_info
+            self.broadcast(session_id, screen_info)
+            self.updates.notify_all()
+        return screen_info
+
+    def get_screen(self, session_id):
+        """Return the latest frame for a session, or None"""
+        with self.lock:
+            return self.screen_data.get(session_id)
+
+    def wait_for_updates(self, session_id, after_version, after_event, timeout):
+        """Block until a newer frame or session event; see SessionStore"""
+        def newer_frame():
+            screen_info = self.screen_data.get(session_id) if session_id else None
+            if screen_info and screen_info['version'] > after_version:
+                return screen_info
+            return None
+        
+        with self.lock:
+            self.updates.wait_for(
+                lambda: newer_frame() or self.event_counter > after_event, timeout=timeout)
+            events = []
+            resync = False
+            if self.event_counter > after_event:
+                events = [entry for entry in self.session_events if entry[0] > after_event]
+                resync = not events or events[0][0] != after_event + 1
+            return newer_frame(), events, resync
+
+    def latest_event_id(self):
+        """ID of the newest session event, 0 if there is none"""
+        return self.event_counter
+
+    def queue_depths(self):
+        """Pending command count of every session with commands waiting"""
+        with self.lock:
+            return {session_id: len(pending)
+                    for session_id, pending in self.command_queues.items() if pending}
+
+    def has_session(self, session_id):
+        """True while the session is registered or still has a frame"""
+        with self.lock:
+            return session_id in self.sessions or session_id in self.screen_data
+
+
+class SqliteSessionStore(SessionStore):
+    """Session state in a SQLite database shared by several server processes
+
+    The database runs in WAL mode so readers never wait for the writer.
+    SQLite cannot wake a waiter in another process, so long-polls, event
+    streams and push viewers re-check the database every poll_interval
+    seconds; changes made in the same process still wake them at once.
+
+    Frame bytes live in files in frames_dir, next to the database, and the
+    frames table only names them. An upload writes its file first and then
+    takes the database write lock just long enough to point the row at it,
+    so uploads from different workers never queue behind each other's
+    bytes. Frames are cached per process by version, so each process reads
+    and encodes a frame once however many of its viewers watch it.
+    """
+
+    SCHEMA = '''
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value
+        );
+        CREATE TABLE IF NOT EXISTS sessions (
+            session_id TEXT PRIMARY KEY,
+            platform TEXT,
+            agent_type TEXT,
+            registered_at REAL,
+            last_seen REAL
+        );
+        CREATE INDEX IF NOT EXISTS sessions_last_seen ON sessions (last_seen);
+        CREATE TABLE IF NOT EXISTS commands (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT NOT NULL,
+            command TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS commands_session ON commands (session_id, id);
+        CREATE TABLE IF NOT EXISTS frames (
+            session_id TEXT PRIMARY KEY,
+            version INTEGER NOT NULL,
+            image_file TEXT NOT NULL,
+            content_type TEXT,
+            timestamp REAL,
+            received_at REAL,
+            trace TEXT,
+            frame_key TEXT,
+            key_version INTEGER,
+            frame_size TEXT,
+            tiles_file TEXT
+        );
+        CREATE TABLE IF NOT EXISTS events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            session_id TEXT,
+            change TEXT,
+            timestamp REAL
+        );
+    '''
+
+    def __init__(self, path, ttl=SESSION_TIMEOUT, max_queue=MAX_COMMAND_QUEUE,
+                 drop_policy='drop-motion', poll_interval=SQLITE_POLL_INTERVAL):
+        if not HAS_SQLITE:
+            raise RuntimeError("SQLite is not available in this Python build")
+        super().__init__(ttl, max_queue, drop_policy)
+        self.path = path
+        self.frames_dir = path + '-frames'
+        self.poll_interval = poll_interval
+        # One connection per thread; sqlite3 connections are not shareable
+        self.local = threading.local()
+        # session_id -> newest frame read by this process
+        self.frame_cache = {}
+        self.watcher = None
+        os.makedirs(self.frames_dir, exist_ok=True)
+        self.connection().executescript(self.SCHEMA)
+        columns = [row[1] for row in self.connection().execute('PRAGMA table_info(frames)')]
+        if 'image_file' not in columns:
+            # Databases that kept frame bytes in the table. It only holds each
+            # session's latest frame, which agents send again within a second.
+            self.connection().execute('DROP TABLE frames')
+            self.connection().executescript(self.SCHEMA)
+        with self.transaction() as conn:
+            # Every process shares the first instance ID, so ETags agree
+            conn.execute("INSERT OR IGNORE INTO meta VALUES ('instance_id', ?)", (self.instance_id,))
+            conn.execute("INSERT OR IGNORE INTO meta VALUES ('frame_counter', 0)")
+            self.instance_id = conn.execute(
+                "SELECT value FROM meta WHERE key = 'instance_id'").fetchone()[0]
+
+    def connection(self):
+        """This thread's connection to the database"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self.local.conn = conn
+        return conn
+
+    @contextlib.contextmanager
+    def transaction(self):
+        """Run a block as one write transaction, taking the write lock up front"""
+        conn = self.connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield conn
+        except BaseException:
+            conn.execute('ROLLBACK')
+            raise
+        conn.execute('COMMIT')
+
+    def publish_event(self, conn, session_id, change):
+        """Record a session change inside the caller's transaction"""
+        cursor = conn.execute('INSERT INTO events (session_id, change, timestamp) VALUES (?, ?, ?)',
+                              (session_id, change, time.time() * 1000))
+        conn.execute('DELETE FROM events WHERE id <= ?', (cursor.lastrowid - MAX_SESSION_EVENTS,))
+
+    def notify_updates(self):
+        """Wake this process's event streams"""
+        with self.lock:
+            self.updates.notify_all()
+
+    def delete_session(self, conn, session_id, change):
+        """Delete a session's rows inside the caller's transaction; returns its frame files"""
+        files = conn.execute('SELECT image_file, tiles_file FROM frames WHERE session_id = ?',
+                             (session_id,)).fetchone()
+        conn.execute('DELETE FROM sessions WHERE session_id = ?', (session_id,))
+        conn.execute('DELETE FROM commands WHERE session_id = ?', (session_id,))
+        conn.execute('DELETE FROM frames WHERE session_id = ?', (session_id,))
+        self.publish_event(conn, session_id, change)
+        return files or ()
+
+    def write_frame_file(self, data):
+        """Write frame bytes to a new file in frames_dir and return its name"""
+        name = secrets.token_hex(8)
+        with open(os.path.join(self.frames_dir, name), 'wb') as f:
+            f.write(data)
+        return name
+
+    def read_frame_file(self, name):
+        """Bytes of a frame file; FileNotFoundError once a newer frame replaced it"""
+        with open(os.path.join(self.frames_dir, name), 'rb') as f:
+            return f.read()
+
+    def remove_frame_files(self, names):
+        """Delete frame files nothing refers to any more"""
+        for name in names:
+            if name:
+                try:
+                    os.remove(os.path.join(self.frames_dir, name))
+                except OSError:
+                    pass  # Still open on Windows; the reaper sweeps it later
+
+    def forget_session(self, session_id):
+        """Drop what this process holds for a deleted session"""
+        with self.lock:
+            self.frame_cache.pop(session_id, None)
+        self.close_viewers(session_id)
+        self.notify_updates()
+
+    def register_session(self, data):
+        """Create a new agent session and return its ID"""
+        session_id = secrets.token_hex(4).upper()
+        now = time.time()
+        with self.transaction() as conn:
+            conn.execute('INSERT INTO sessions VALUES (?, ?, ?, ?, ?)',
+                         (session_id, data.get('platform', 'unknown'),
+                          data.get('agent_type', 'basic'), now, now))
+            self.publish_event(conn, session_id, 'joined')
+        self.notify_updates()
+        return session_id
+
+    def drop_session(self, session_id, change):
+        """Remove a session with its queue and frame; returns False if unknown"""
+        with self.transaction() as conn:
+            if not conn.execute('SELECT 1 FROM sessions WHERE session_id = ?',
+                                (session_id,)).fetchone():
+                return False
+            files = self.delete_session(conn, session_id, change)
+        self.remove_frame_files(files)
+        self.forget_session(session_id)
+        return True
+
+    def expire_sessions(self, now=None):
+        """Drop sessions whose deadline passed; returns their IDs"""
+        now = now or time.time()
+        files = []
+        with self.transaction() as conn:
+            expired_sessions = [row[0] for row in conn.execute(
+                'SELECT session_id FROM sessions WHERE last_seen <= ?', (now - self.ttl,))]
+            for session_id in expired_sessions:
+                files += self.delete_session(conn, session_id, 'expired')
+        self.remove_frame_files(files)
+        for session_id in expired_sessions:
+            self.forget_session(session_id)
+        self.sweep_frames()
+        return expired_sessions
+
+    def sweep_frames(self):
+        """Drop cached frames and frame files of sessions another process deleted
+
+        Files are only removed once they are older than REAPER_INTERVAL, so
+        an upload that wrote its file but has not committed its row yet
+        keeps it.
+        """
+        rows = self.connection().execute(
+            'SELECT session_id, image_file, tiles_file FROM frames').fetchall()
+        live = {row[0] for row in rows}
+        with self.lock:
+            for session_id in [session_id for session_id in self.frame_cache if session_id not in live]:
+                del self.frame_cache[session_id]
+        referenced = {name for row in rows for name in row[1:]}
+        cutoff = time.time() - REAPER_INTERVAL
+        for entry in os.scandir(self.frames_dir):
+            try:
+                if entry.name not in referenced and entry.stat().st_mtime < cutoff:
+                    os.remove(entry.path)
+            except OSError:
+                pass
+
+    def next_deadline(self):
+        """Earliest time a session can expire, or None without sessions"""
+        oldest = self.connection().execute('SELECT MIN(last_seen) FROM sessions').fetchone()[0]
+        return None if oldest is None else oldest + self.ttl
+
+    def list_sessions(self):
+        """Return a summary of every active session"""
+        rows = self.connection().execute(
+            'SELECT s.session_id, s.platform, s.last_seen, f.session_id IS NOT NULL '
+            'FROM sessions s LEFT JOIN frames f ON f.session_id = s.session_id '
+            'WHERE s.last_seen > ?', (time.time() - self.ttl,)).fetchall()
+        return [
+            {
+                'sessionId': session_id,
+                'platform': platform or 'unknown',
+                'lastSeen': last_seen,
+                'hasScreen': bool(has_screen),
+                'viewers': self.viewer_count(session_id)
+            }
+            for session_id, platform, last_seen, has_screen in rows
+        ]
+
+    def queue_command(self, session_id, command):
+        """Queue a command for an agent; see SessionStore.queue_command"""
+        with self.transaction() as conn:
+            if not conn.execute('SELECT 1 FROM sessions WHERE session_id = ?',
+                                (session_id,)).fetchone():
+                return None
+            depth = conn.execute('SELECT COUNT(*) FROM commands WHERE session_id = ?',
+                                 (session_id,)).fetchone()[0]
+            last = conn.execute('SELECT id, command FROM commands WHERE session_id = ? '
+                                'ORDER BY id DESC LIMIT 1', (session_id,)).fetchone()
+            merged = merge_command(json.loads(last[1]) if last else None, command)
+            status = 'queued'
+            if merged is not None:
+                conn.execute('UPDATE commands SET command = ? WHERE id = ?',
+                             (json.dumps(merged), last[0]))
+                status = 'merged'
+            else:
+                if depth >= self.max_queue:
+                    rows = conn.execute('SELECT id, command FROM commands WHERE session_id = ? '
+                                        'ORDER BY id', (session_id,)).fetchall()
+                    index = eviction_index([json.loads(row[1]) for row in rows], self.drop_policy)
+                    if index is not None:
+                        conn.execute('DELETE FROM commands WHERE id = ?', (rows[index][0],))
+                        depth -= 1
+                        status = 'dropped'
+                    elif command.get('action') != 'keyup':
+                        status = 'rejected'
+                    if status != 'queued':
+                        self.commands_dropped += 1
+                if status != 'rejected':
+                    conn.execute('INSERT INTO commands (session_id, command) VALUES (?, ?)',
+                                 (session_id, json.dumps(command)))
+                    depth += 1
+        if status != 'rejected':
+            with self.lock:
+                self.commands_ready.notify_all()
+        return self.queue_status(status, depth)
+
+    def take_commands(self, session_id, wait=0, stop=None):
+        """Remove and return all pending commands for a session"""
+        wait = max(0.0, min(float(wait), MAX_LONG_POLL))
+        deadline = time.time() + wait
+        conn = self.connection()
+        conn.execute('UPDATE sessions SET last_seen = ? WHERE session_id = ?',
+                     (time.time(), session_id))
+        while True:
+            # Cheap read first so an idle long-poll never takes the write lock
+            if conn.execute('SELECT 1 FROM commands WHERE session_id = ? LIMIT 1',
+                            (session_id,)).fetchone():
+                with self.transaction() as conn:
+                    rows = conn.execute('SELECT id, command FROM commands WHERE session_id = ? '
+                                        'ORDER BY id', (session_id,)).fetchall()
+                    if rows:
+                        conn.execute('DELETE FROM commands WHERE session_id = ? AND id <= ?',
+                                     (session_id, rows[-1][0]))
+                if rows:
+                    return [json.loads(row[1]) for row in rows]
+            remaining = deadline - time.time()
+            if remaining <= 0 or (stop and stop.is_set()):
+                return []
+            with self.lock:
+                self.commands_ready.wait(min(remaining, self.poll_interval))
+
+    def store_screen(self, session_id, image, timestamp=None, content_type='image/jpeg',
+                     trace=None, key=None):
+        """Store the latest raw frame for a session and mark the agent as seen"""
+        now = time.time()
+        screen_info = {
+            'session_id': session_id,
+            'image': image,
+            'content_type': content_type,
+            'timestamp': timestamp if timestamp is not None else now * 1000,
+            'received_at': now * 1000
+        }
+        if trace is not None:
+            screen_info['trace'] = trace
+        if key is not None:
+            screen_info['key'] = key
+        # The bytes go to disk before the write lock is taken
+        image_file = self.write_frame_file(image)
+        with self.transaction() as conn:
+            touched = conn.execute('UPDATE sessions SET last_seen = ? WHERE session_id = ?',
+                                   (now, session_id)).rowcount
+            if not touched:
+                conn.execute('INSERT INTO sessions VALUES (?, ?, ?, ?, ?)',
+                             (session_id, 'unknown', 'unregistered', now, now))
+                self.publish_event(conn, session_id, 'joined')
+            conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'frame_counter'")
+            screen_info['version'] = screen_info['key_version'] = conn.execute(
+                "SELECT value FROM meta WHERE key = 'frame_counter'").fetchone()[0]
+            previous = conn.execute('SELECT image_file, tiles_file FROM frames WHERE session_id = ?',
+                                    (session_id,)).fetchone()
+            conn.execute('INSERT OR REPLACE INTO frames (session_id, version, image_file, content_type, '
+                         'timestamp, received_at, trace, frame_key, key_version) '
+                         'VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                         (session_id, screen_info['version'], image_file, content_type,
+                          screen_info['timestamp'], screen_info['received_at'],
+                          json.dumps(trace) if trace is not None else None,
+                          key, screen_info['version']))
+        self.remove_frame_files(previous or ())
+        with self.lock:
+            self.frame_cache[session_id] = screen_info
+        self.broadcast(session_id, screen_info)
+        self.notify_updates()
+        return screen_info
+
+    def store_tiles(self, session_id, key, tiles, size=None, timestamp=None, trace=None):
+        """Apply changed tiles on top of the current keyframe; see SessionStore"""
+        now = time.time()
+        current = self.get_screen(session_id)
+        # The new tiles are written as version 0, which stands for the
+        # version of the frame that stores them; see unpack_stored_tiles
+        screen_info = self.tile_frame(current, key, tiles, size, timestamp, trace, 0, now)
+        if screen_info is None:
+            return None
+        tiles_file = self.write_frame_file(self.pack_stored_tiles(screen_info['tiles']))
+        with self.transaction() as conn:
+            # Only on top of the frame the tiles were applied to
+            previous = conn.execute('SELECT tiles_file FROM frames WHERE session_id = ? AND version = ?',
+                                    (session_id, current['version'])).fetchone()
+            if previous is not None:
+                version = conn.execute(
+                    "SELECT value FROM meta WHERE key = 'frame_counter'").fetchone()[0] + 1
+                conn.execute('UPDATE sessions SET last_seen = ? WHERE session_id = ?', (now, session_id))
+                conn.execute("UPDATE meta SET value = ? WHERE key = 'frame_counter'", (version,))
+                conn.execute('UPDATE frames SET version = ?, timestamp = ?, received_at = ?, trace = ?, '
+                             'frame_size = ?, tiles_file = ? WHERE session_id = ?',
+                             (version, screen_info['timestamp'], screen_info['received_at'],
+                              json.dumps(trace) if trace is not None else None,
+                              json.dumps(screen_info['size']), tiles_file, session_id))
+        if previous is None:
+            # Another upload replaced the frame meanwhile
+            self.remove_frame_files([tiles_file])
+            return None
+        self.remove_frame_files(previous)
+        screen_info['version'] = version
+        screen_info['tiles'] = [(tile[0] or version,) + tile[1:] for tile in screen_info['tiles']]
+        with self.lock:
+            self.frame_cache[session_id] = screen_info
+        self.broadcast(session_id, screen_info)
+        self.notify_updates()
+        return screen_info
+
+    @staticmethod
+    def pack_stored_tiles(tiles):
+        """(version, x, y, w, h, jpeg) tiles as one blob for the frames table"""
+        return pack_frame_message({'tiles': [list(tile[:5]) + [len(tile[5])] for tile in tiles]},
+                                  b''.join(tile[5] for tile in tiles))
+
+    @staticmethod
+    def unpack_stored_tiles(blob, frame_version):
+        """Inverse of pack_stored_tiles; version 0 tiles arrived with frame_version"""
+        meta, payload = unpack_frame_message(blob)
+        tiles = []
+        offset = 0
+        for version, x, y, w, h, length in meta['tiles']:
+            tiles.append((version or frame_version, x, y, w, h, payload[offset:offset + length]))
+            offset += length
+        return tiles
+
+    def get_screen(self, session_id):
+        """Return the latest frame for a session, or None"""
+        return self.read_frame(self.connection(), session_id)
+
+    def read_frame(self, conn, session_id):
+        """Latest frame of a session read through conn, from the cache when current"""
+        row = conn.execute('SELECT version FROM frames WHERE session_id = ?',
+                           (session_id,)).fetchone()
+        with self.lock:
+            if row is None:
+                # Deleted, possibly by another process
+                self.frame_cache.pop(session_id, None)
+                return None
+            cached = self.frame_cache.get(session_id)
+        if cached is not None and cached['version'] == row[0]:
+            return cached
+        # A newer upload may remove the files between reading the row and
+        # opening them; the row is then read again
+        for _ in range(3):
+            row = conn.execute('SELECT version, image_file, content_type, timestamp, received_at, trace, '
+                               'frame_key, key_version, frame_size, tiles_file '
+                               'FROM frames WHERE session_id = ?', (session_id,)).fetchone()
+            if row is None:
+                with self.lock:
+                    self.frame_cache.pop(session_id, None)
+                return None
+            try:
+                image = self.read_frame_file(row[1])
+                tiles = self.read_frame_file(row[9]) if row[9] is not None else None
+                break
+            except FileNotFoundError:
+                continue
+        else:
+            return cached  # Still being replaced; the older frame will do
+        screen_info = {
+            'session_id': session_id,
+            'version': row[0],
+            'image': image,
+            'content_type': row[2],
+            'timestamp': row[3],
+            'received_at': row[4],
+            'key_version': row[7] if row[7] is not None else row[0]
+        }
+        if row[5] is not None:
+            screen_info['trace'] = json.loads(row[5])
+        if row[6] is not None:
+            screen_info['key'] = row[6]
+        if tiles is not None:
+            screen_info['size'] = json.loads(row[8]) if row[8] else None
+            screen_info['tiles'] = self.unpack_stored_tiles(tiles, row[0])
+        with self.lock:
+            cached = self.frame_cache.get(session_id)
+            if cached is None or cached['version'] < screen_info['version']:
+                self.frame_cache[session_id] = screen_info
+        return screen_info
+
+    def wait_for_updates(self, session_id, after_version, after_event, timeout):
+        """Block until a newer frame or session event; see SessionStore"""
+        deadline = time.time() + timeout
+        while True:
+            screen_info = self.get_screen(session_id) if session_id else None
+            if screen_info is not None and screen_info['version'] <= after_version:
+                screen_info = None
+            events = [
+                (event_id, {'sessionId': event_session, 'change': change, 'timestamp': timestamp})
+                for event_id, event_session, change, timestamp in self.connection().execute(
+                    'SELECT id, session_id, change, timestamp FROM events WHERE id > ? ORDER BY id',
+                    (after_event,))
+            ]
+            remaining = deadline - time.time()
+            if screen_info is not None or events or remaining <= 0:
+                resync = bool(events) and events[0][0] != after_event + 1
+                return screen_info, events, resync
+            with self.lock:
+                self.updates.wait(min(remaining, self.poll_interval))
+
+    def latest_event_id(self):
+        """ID of the newest session event, 0 if there is none"""
+        return self.connection().execute('SELECT COALESCE(MAX(id), 0) FROM events').fetchone()[0]
+
+    def queue_depths(self):
+        """Pending command count of every session with commands waiting"""
+        return dict(self.connection().execute(
+            'SELECT session_id, COUNT(*) FROM commands GROUP BY session_id'))
+
+    def has_session(self, session_id):
+        """True while the session is registered or still has a frame"""
+        exists = self.connection().execute(
+            'SELECT EXISTS (SELECT 1 FROM sessions WHERE session_id = ?) '
+            'OR EXISTS (SELECT 1 FROM frames WHERE session_id = ?)',
+            (session_id, session_id)).fetchone()[0] == 1
+        if not exists:
+            with self.lock:
+                self.frame_cache.pop(session_id, None)
+        return exists
+
+    def add_viewer(self, session_id):
+        """Subscribe a push viewer; frames from other processes arrive by polling"""
+        viewer = super().add_viewer(session_id)
+        with self.lock:
+            if self.watcher is None:
+                self.watcher = threading.Thread(target=self.watch_frames, daemon=True,
+                                                name='rc-frame-watcher')
+                self.watcher.start()
+        return viewer
+
+    def watch_frames(self):
+        """Hand frames stored by other processes to this process's push viewers"""
+        while True:
+            with self.lock:
+                watched = list(self.viewers)
+            for session_id in watched:
+                screen_info = self.get_screen(session_id)
+                if screen_info is not None:
+                    self.broadcast(session_id, screen_info)
+                elif not self.has_session(session_id):
+                    self.close_viewers(session_id)
+            time.sleep(self.poll_interval)
+
+
+def recording_paths(directory, session_id):
+    """(segment path, index path) of a session's recording"""
+    base = os.path.join(directory, session_id)
+    return base + '.seg', base + '.idx'
+
+
+def parse_byte_range(header, size):
+    """Parse a single-range 'bytes=' Range header into inclusive (start, end)
+
+    Returns None when the range cannot be satisfied and raises ValueError for
+    headers that should be ignored (malformed or multi-range).
+    """
+    unit, _, spec = header.partition('=')
+    if unit.strip() != 'bytes' or ',' in spec:
+        raise ValueError(header)
+    first, _, last = spec.strip().partition('-')
+    if first:
+        start = int(first)
+        end = int(last) if last else size - 1
+    else:
+        start = size - int(last)  # Suffix range: the last N bytes
+        end = size - 1
+    start = max(start, 0)
+    end = min(end, size - 1)
+    if start > end:
+        return None
+    return start, end
+
+
+class Recording:
+    """Read-only view of a session recording through memory maps
+
+    Frames come back as memoryview slices of the mapped segment file, so
+    serving them copies nothing into Python objects, and seeking bisects
+    the mapped index instead of scanning it. The maps cover the files as
+    they were when the recording was opened; frames recorded later show up
+    the next time it is opened.
+    """
+
+    RECORD_SIZE = struct.calcsize(RECORD_INDEX_FORMAT)
+
+    def __init__(self, segment_path, index_path):
+        self.maps = []
+        self.segment = self.map_file(segment_path)
+        self.index = self.map_file(index_path)
+        self.count = len(self.index) // self.RECORD_SIZE
+        # Ignore index records whose bytes landed after the segment was mapped
+        while self.count and sum(self.entry(self.count - 1)[1:]) > len(self.segment):
+            self.count -= 1
+
+    @classmethod
+    def open(cls, directory, session_id):
+        """Open a session's recording, or return None if there is none"""
+        if not SessionRecorder.is_recordable(session_id):
+            return None
+        segment_path, index_path = recording_paths(directory, session_id)
+        if not (os.path.exists(segment_path) and os.path.exists(index_path)):
+            return None
+        return cls(segment_path, index_path)
+
+    def map_file(self, path):
+        """Map a whole file read-only; empty files map to an empty view"""
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return memoryview(b'')
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.maps.append(mapped)
+        return memoryview(mapped)
+
+    def entry(self, i):
+        """(timestamp, offset, length) of frame i"""
+        return struct.unpack_from(RECORD_INDEX_FORMAT, self.index, i * self.RECORD_SIZE)
+
+    def timestamp(self, i):
+        """Receive time of frame i in ms"""
+        return self.entry(i)[0]
+
+    def frame(self, i):
+        """(timestamp, image) of frame i; the image is a slice of the map"""
+        timestamp, offset, length = self.entry(i)
+        return timestamp, self.segment[offset:offset + length]
+
+    def seek(self, timestamp):
+        """Index of the frame on screen at timestamp (the last one at or before it)"""
+        i = bisect.bisect_right(range(self.count), timestamp, key=self.timestamp)
+        return max(i - 1, 0)
+
+    def info(self, session_id):
+        """Summary of the recording for the API"""
+        start = self.timestamp(0) if self.count else None
+        end = self.timestamp(self.count - 1) if self.count else None
+        return {
+            'sessionId': session_id,
+            'frames': self.count,
+            'bytes': len(self.segment),
+            'start': start,
+            'end': end,
+            'duration': (end - start) / 1000 if self.count else 0
+        }
+
+    def close(self):
+        """Release the maps; slices still held elsewhere keep theirs alive"""
+        self.segment.release()
+        self.index.release()
+        for mapped in self.maps:
+            try:
+                mapped.close()
+            except BufferError:
+                pass  # A frame slice is still in use; the map closes with it
+        self.maps = []
+
+
+class SessionRecorder:
+    """Appends every received frame to a per-session recording on disk
+
+    A recording is two files in the recording directory: <session>.seg holds
+    the raw image bytes back to back, and <session>.idx is a packed array of
+    RECORD_INDEX_FORMAT records (server receive time in ms, offset, length)
+    that can be memory-mapped and binary-searched. Frames reach a background
+    writer through a bounded queue, so ingest never waits on the disk; if
+    the disk falls that far behind, frames are dropped and counted instead.
+    Index records are written only after their bytes are in the segment, and
+    on POSIX each batch holds an advisory lock so worker processes can share
+    a recording directory.
+    """
+
+    def __init__(self, directory, queue_size=RECORD_QUEUE_SIZE):
+        self.directory = directory
+        self.pending = queue.Queue(maxsize=queue_size)
+        # session_id -> (segment file, index file), opened lazily
+        self.files = {}
+        self.frames_written = 0
+        self.frames_dropped = 0
+        self.writer = None
+
+    @staticmethod
+    def is_recordable(session_id):
+        """True if a session ID is safe to use as a file name"""
+        return bool(session_id) and len(session_id) <= 64 and all(
+            c.isascii() and (c.isalnum() or c in '-_') for c in session_id)
+
+    def paths(self, session_id):
+        """(segment path, index path) of a session's recording"""
+        return recording_paths(self.directory, session_id)
+
+    def start(self):
+        """Start the background writer (idempotent)"""
+        if self.writer is None:
+            os.makedirs(self.directory, exist_ok=True)
+            self.writer = threading.Thread(target=self.writer_loop, daemon=True,
+                                           name='rc-recorder')
+            self.writer.start()
+
+    def stop(self):
+        """Write out queued frames, then stop the writer and close the files"""
+        if self.writer is not None:
+            self.pending.put(None)
+            self.writer.join(timeout=10)
+            self.writer = None
+
+    def record(self, session_id, image, timestamp):
+        """Queue a frame for writing without blocking; False if it was dropped
+
+        image is the frame's bytes, or a function returning them that the
+        writer calls, so frames that are costly to build (tile composites)
+        are built off the ingest path.
+        """
+        if not self.is_recordable(session_id):
+            return False
+        try:
+            self.pending.put_nowait((session_id, image, timestamp))
+            return True
+        except queue.Full:
+            self.frames_dropped += 1
+            return False
+
+    def writer_loop(self):
+        """Write frames in batches until stopped"""
+        running = True
+        while running:
+            try:
+                item = self.pending.get(timeout=RECORDER_IDLE_CLOSE)
+            except queue.Empty:
+                self.close_files()  # Nobody is streaming; release the handles
+                continue
+            batch = []
+            while item is not None:
+                batch.append(item)
+                try:
+                    item = self.pending.get_nowait()
+                except queue.Empty:
+                    break
+            running = item is not None
+            try:
+                self.write_batch(batch)
+            except OSError as e:
+                print(f"⚠️  Recording write failed: {e}")
+                self.close_files()
+        self.close_files()
+
+    def write_batch(self, batch):
+        """Append a batch of frames, one locked append per session"""
+        by_session = {}
+        for session_id, image, timestamp in batch:
+            if callable(image):
+                try:
+                    image = image()
+                except (OSError, ValueError) as e:
+                    print(f"⚠️  Recording frame build failed: {e}")
+                    self.frames_dropped += 1
+                    continue
+            by_session.setdefault(session_id, []).append((image, timestamp))
+        
+        for session_id, frames in by_session.items():
+            segment, index = self.open_files(session_id)
+            if HAS_FCNTL:
+                fcntl.flock(segment.fileno(), fcntl.LOCK_EX)
+            try:
+                offset = segment.seek(0, os.SEEK_END)
+                records = bytearray()
+                for image, timestamp in frames:
+                    segment.write(image)
+                    records += struct.pack(RECORD_INDEX_FORMAT, timestamp, offset, len(image))
+                    offset += len(image)
+                segment.flush()
+                index.write(records)
+                index.flush()
+            finally:
+                if HAS_FCNTL:
+                    fcntl.flock(segment.fileno(), fcntl.LOCK_UN)
+            self.frames_written += len(frames)
+
+    def open_files(self, session_id):
+        """Open (or reuse) a session's segment and index files for appending"""
+        files = self.files.get(session_id)
+        if files is None:
+            segment_path, index_path = self.paths(session_id)
+            files = (open(segment_path, 'ab'), open(index_path, 'ab'))
+            self.files[session_id] = files
+        return files
+
+    def close_files(self):
+        """Close every open recording file"""
+        for segment, index in self.files.values():
+            segment.close()
+            index.close()
+        self.files = {}
+
+
+def accepts_gzip(header):
+    """True if an Accept-Encoding header allows gzip (q=0 refuses it)"""
+    for item in (header or '').split(','):
+        coding, _, params = item.partition(';')
+        if coding.strip().lower() not in ('gzip', 'x-gzip', '*'):
+            continue
+        quality = params.strip().lower()
+        if quality.startswith('q='):
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
+
+
+def route_name(path):
+    """Collapse a request path to its route template for metric labels
+
+    Session IDs are replaced by {id} so the number of label values stays
+    fixed however many sessions come and go.
+    """
+    path = urlparse(path).path
+    if path in ROUTES:
+        return path
+    for prefix in ROUTE_PREFIXES:
+        if path.startswith(prefix):
+            if prefix == '/api/screen/' and path.endswith(('.jpg', '.frame')):
+                return '/api/screen/{id}' + path[path.rindex('.'):]
+            if prefix == '/api/recordings/':
+                parts = path.split('/')
+                if len(parts) > 4:
+                    return '/api/recordings/{id}/' + parts[4]
+                return '/api/recordings/{id}.seg' if path.endswith('.seg') else '/api/recordings/{id}'
+            return prefix + '{id}'
+    return 'other'
+
+
+def escape_label(value):
+    """Escape a Prometheus label value: backslash, double quote and newline"""
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class Histogram:
+    """Fixed-bucket histogram with constant memory
+
+    observe() is a bisect plus two increments under a lock that is held for
+    nothing else, so recording a sample costs well under a microsecond.
+    """
+
+    def __init__(self, bounds=LATENCY_BUCKETS):
+        self.bounds = bounds
+        # One count per bound plus the +Inf bucket
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, value):
+        """Count one sample"""
+        i = bisect.bisect_left(self.bounds, value)
+        with self.lock:
+            self.counts[i] += 1
+            self.total += value
+
+    def render(self, name, labels):
+        """Prometheus text lines for this histogram"""
+        with self.lock:
+            counts = list(self.counts)
+            total = self.total
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.bounds + (float('inf'),), counts):
+            cumulative += count
+            le = '+Inf' if bound == float('inf') else repr(bound)
+            lines.append(f'{name}_bucket{{{labels},le="{le}"}} {cumulative}')
+        lines.append(f'{name}_sum{{{labels}}} {total}')
+        lines.append(f'{name}_count{{{labels}}} {cumulative}')
+        return lines
+
+
+class IngestRate:
+    """Frames and bytes received per second over a sliding window
+
+    One slot per second in a ring of INGEST_RATE_WINDOW slots, so memory is
+    fixed regardless of the frame rate.
+    """
+
+    def __init__(self):
+        self.seconds = [0] * INGEST_RATE_WINDOW
+        self.frames = [0] * INGEST_RATE_WINDOW
+        self.bytes = [0] * INGEST_RATE_WINDOW
+
+    def record(self, size, now):
+        """Count one received frame of size bytes"""
+        second = int(now)
+        slot = second % INGEST_RATE_WINDOW
+        if self.seconds[slot] != second:
+            self.seconds[slot] = second
+            self.frames[slot] = 0
+            self.bytes[slot] = 0
+        self.frames[slot] += 1
+        self.bytes[slot] += size
+
+    def rates(self, now):
+        """(frames per second, bytes per second) over the window"""
+        oldest = int(now) - INGEST_RATE_WINDOW
+        frames = sum(f for s, f in zip(self.seconds, self.frames) if s > oldest)
+        size = sum(b for s, b in zip(self.seconds, self.bytes) if s > oldest)
+        return frames / INGEST_RATE_WINDOW, size / INGEST_RATE_WINDOW
+
+    def idle(self, now):
+        """True once nothing was received for a whole window"""
+        return max(self.seconds) <= int(now) - INGEST_RATE_WINDOW
+
+
+class ServerMetrics:
+    """Request, ingest and frame-age metrics for /api/metrics
+
+    Everything is keyed by route template, method and status, or by live
+    session, so memory stays bounded. In pre-fork mode each worker process
+    keeps and reports its own metrics.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # (method, route, status) -> request count
+        self.requests = {}
+        # (method, route) -> Histogram of handling time
+        self.latency = {}
+        # route -> Histogram of how old a frame was when it was served
+        self.frame_age = {}
+        # session_id -> IngestRate
+        self.ingest = {}
+
+    def histogram(self, table, key):
+        """Fetch or create the histogram for key"""
+        histogram = table.get(key)
+        if histogram is None:
+            with self.lock:
+                histogram = table.setdefault(key, Histogram())
+        return histogram
+
+    def observe_request(self, method, path, status, duration):
+        """Count a finished request and its handling time"""
+        route = route_name(path)
+        key = (method, route, str(status))
+        with self.lock:
+            self.requests[key] = self.requests.get(key, 0) + 1
+        self.histogram(self.latency, (method, route)).observe(duration)
+
+    def observe_frame_age(self, route, screen_info):
+        """Record how long ago a frame being served was received"""
+        age = max(time.time() * 1000 - screen_info['received_at'], 0) / 1000
+        self.histogram(self.frame_age, route).observe(age)
+
+    def observe_ingest(self, session_id, size):
+        """Count a frame received from an agent"""
+        with self.lock:
+            rate = self.ingest.get(session_id)
+            if rate is None:
+                rate = self.ingest[session_id] = IngestRate()
+            rate.record(size, time.time())
+
+    def forget_session(self, session_id):
+        """Drop the ingest rate of a session that was removed"""
+        with self.lock:
+            self.ingest.pop(session_id, None)
+
+    def prune_ingest(self, live):
+        """Drop ingest rates of sessions that stopped sending and are not in live"""
+        now = time.time()
+        with self.lock:
+            for session_id in [s for s, rate in self.ingest.items()
+                               if s not in live and rate.idle(now)]:
+                del self.ingest[session_id]
+
+    def render(self, store, recorder=None, admission=None):
+        """All metrics in Prometheus text exposition format"""
+        now = time.time()
+        sessions = store.list_sessions()
+        depths = store.queue_depths()
+        lines = []
+        
+        def header(name, kind, help_text):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+        
+        header('rc_http_requests_total', 'counter', 'HTTP requests by method, route and status')
+        with self.lock:
+            requests = sorted(self.requests.items())
+            latency = sorted(self.latency.items())
+            frame_age = sorted(self.frame_age.items())
+            ingest = sorted((s, rate.rates(now)) for s, rate in self.ingest.items())
+        for (method, route, status), count in requests:
+            lines.append(f'rc_http_requests_total{{method="{escape_label(method)}",route="{escape_label(route)}",'
+                         f'status="{escape_label(status)}"}} {count}')
+        
+        header('rc_http_request_duration_seconds', 'histogram', 'Request handling time by route')
+        for (method, route), histogram in latency:
+            lines += histogram.render('rc_http_request_duration_seconds',
+                                      f'method="{escape_label(method)}",route="{escape_label(route)}"')
+        
+        header('rc_frame_age_seconds', 'histogram', 'Age of frames when served to viewers')
+        for route, histogram in frame_age:
+            lines += histogram.render('rc_frame_age_seconds', f'route="{escape_label(route)}"')
+        
+        header('rc_session_ingest_fps', 'gauge', 'Frames received per second by session')
+        for session_id, (fps, _) in ingest:
+            lines.append(f'rc_session_ingest_fps{{session="{escape_label(session_id)}"}} {fps}')
+        header('rc_session_ingest_bytes_per_second', 'gauge', 'Frame bytes received per second by session')
+        for session_id, (_, bytes_per_second) in ingest:
+            lines.append(f'rc_session_ingest_bytes_per_second{{session="{escape_label(session_id)}"}} '
+                         f'{bytes_per_second}')
+        
+        header('rc_command_queue_depth', 'gauge', 'Commands waiting for the agent by session')
+        for session_id, depth in sorted(depths.items()):
+            lines.append(f'rc_command_queue_depth{{session="{escape_label(session_id)}"}} {depth}')
+        header('rc_session_viewers', 'gauge', 'Push viewers by session in this process')
+        for session in sessions:
+            lines.append(f'rc_session_viewers{{session="{escape_label(session["sessionId"])}"}} '
+                         f'{session["viewers"]}')
+        
+        header('rc_sessions', 'gauge', 'Active sessions')
+        lines.append(f'rc_sessions {len(sessions)}')
+        header('rc_commands_dropped_total', 'counter', 'Commands evicted or refused by full queues')
+        lines.append(f'rc_commands_dropped_total {store.commands_dropped}')
+        if admission is not None:
+            header('rc_admission_rejected_total', 'counter', 'Requests refused by rate limits')
+            with admission.lock:
+                rejected = sorted(admission.rejected.items())
+            for (limit, scope), count in rejected:
+                lines.append(f'rc_admission_rejected_total{{limit="{escape_label(limit)}",'
+                             f'scope="{escape_label(scope)}"}} {count}')
+        if recorder is not None:
+            header('rc_recording_frames_total', 'counter', 'Frames written to recordings')
+            lines.append(f'rc_recording_frames_total {recorder.frames_written}')
+            header('rc_recording_frames_dropped_total', 'counter', 'Frames the recorder could not keep up with')
+            lines.append(f'rc_recording_frames_dropped_total {recorder.frames_dropped}')
+        return '\n'.join(lines) + '\n'
+
+
+class TokenBucket:
+    """Token bucket refilled at rate per second up to capacity"""
+
+    __slots__ = ('rate', 'capacity', 'tokens', 'updated')
+
+    def __init__(self, rate, capacity, now):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def refill(self, now):
+        """Add the tokens earned since the last call"""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self, cost):
+        """Seconds until cost can be taken, 0 if it can be now
+
+        A cost above the capacity (a frame bigger than the burst) is let
+        through on a full bucket and paid off as debt, so it is slowed
+        down rather than refused forever.
+        """
+        needed = min(cost, self.capacity)
+        return 0 if self.tokens >= needed else (needed - self.tokens) / self.rate
+
+
+def request_admission(method, path):
+    """(limit, session ID or None) for a rate-limited request, or None"""
+    if method == 'POST':
+        if path == '/api/screen':
+            return 'ingest', None  # Session ID is in the body
+        if path.startswith('/api/screen/'):
+            return 'ingest', path.split('/')[-1]
+        if path == '/api/command':
+            return 'commands', None
+    elif method == 'GET':
+        if path.startswith('/api/commands/'):
+            return 'polls', path.split('/')[-1]
+        if path.startswith('/api/screen/'):
+            return 'polls', path.split('/')[-1].split('.')[0]
+    return None
+
+
+class AdmissionControl:
+    """Per-session and per-client-IP token buckets ahead of the route handlers
+
+    Each limit ('ingest' in frame bytes, 'commands' and 'polls' in requests)
+    has a rate per session and per IP, with a burst of burst_seconds worth
+    of tokens. A request is admitted only when every bucket it touches has
+    room, so a refused request costs nothing. Buckets that refilled are
+    identical to new ones, which is what lets pruning drop them.
+
+    Clients can write any ip_header they like, so it is only read on
+    connections from trusted_proxies (addresses or networks). Without it,
+    behind a proxy every client has the proxy's address and shares one
+    per-IP bucket.
+
+    Buckets live in one process: under --workers N each worker admits the
+    full rates, so the deployment as a whole allows N times them.
+    """
+
+    def __init__(self, limits=None, burst_seconds=2, ip_header=None, exempt_ips=(),
+                 trusted_proxies=()):
+        # limit -> {'session': rate, 'ip': rate}; missing or 0 means unlimited
+        self.limits = {limit: {scope: rate for scope, rate in scopes.items() if rate}
+                       for limit, scopes in (limits or {}).items()}
+        self.burst_seconds = burst_seconds
+        self.ip_header = ip_header
+        self.exempt_ips = set(exempt_ips)
+        self.trusted_proxies = [ipaddress.ip_network(proxy, strict=False) for proxy in trusted_proxies]
+        self.lock = threading.Lock()
+        # (limit, scope, key) -> TokenBucket
+        self.buckets = {}
+        # (limit, scope) -> refused requests
+        self.rejected = {}
+
+    @classmethod
+    def from_config(cls, config):
+        """Build from the "rate_limits" section of the server config"""
+        section = config.get('rate_limits') or {}
+        limits = {}
+        for limit, key in RATE_LIMITS.items():
+            scopes = section.get(key) or {}
+            limits[limit] = {'session': scopes.get('session'), 'ip': scopes.get('ip')}
+        ip_header = section.get('client_ip_header')
+        trusted_proxies = section.get('trusted_proxies') or ()
+        if ip_header and not trusted_proxies:
+            print(f"⚠️  Ignoring client_ip_header {ip_header}: no trusted_proxies are configured")
+        if any(scopes['ip'] for scopes in limits.values()) and not (ip_header and trusted_proxies):
+            print("⚠️  Per-IP rate limits count the connecting address; behind a proxy every "
+                  "client shares it (set client_ip_header and trusted_proxies)")
+        return cls(limits, section.get('burst_seconds', 2), ip_header,
+                   section.get('exempt_ips', ()), trusted_proxies)
+
+    def is_trusted_proxy(self, address):
+        """True if address belongs to one of the trusted proxies"""
+        try:
+            ip = ipaddress.ip_address(address)
+        except ValueError:
+            return False
+        if ip.version == 6 and ip.ipv4_mapped:
+            ip = ip.ipv4_mapped
+        return any(ip in network for network in self.trusted_proxies)
+
+    def client_ip(self, client_address, headers):
+        """Client IP: the right-most forwarded hop that is not a trusted proxy
+
+        Each proxy appends the address it was connected from, so only the
+        hops added by our own proxies can be believed; anything further
+        left came from the client.
+        """
+        peer = client_address[0]
+        if not self.ip_header or not self.is_trusted_proxy(peer):
+            return peer
+        hops = [hop.strip() for hop in (headers.get(self.ip_header) or '').split(',') if hop.strip()]
+        for hop in reversed(hops):
+            if not self.is_trusted_proxy(hop):
+                return hop
+        # Every hop is one of ours: the left-most is closest to the client
+        return hops[0] if hops else peer
+
+    def admit(self, limit, session_id=None, ip=None, cost=1):
+        """Take cost from the buckets of limit; returns 0, or seconds to retry after"""
+        rates = self.limits.get(limit)
+        if not rates or ip in self.exempt_ips:
+            return 0
+        keys = [(scope, key) for scope, key in (('session', session_id), ('ip', ip))
+                if key is not None and scope in rates]
+        if not keys:
+            return 0
+        now = time.monotonic()
+        with self.lock:
+            buckets = []
+            for scope, key in keys:
+                bucket = self.buckets.get((limit, scope, key))
+                if bucket is None:
+                    rate = rates[scope]
+                    bucket = self.buckets[(limit, scope, key)] = TokenBucket(
+                        rate, rate * self.burst_seconds, now)
+                bucket.refill(now)
+                buckets.append((scope, bucket))
+            wait = max(bucket.wait_time(cost) for _, bucket in buckets)
+            if wait:
+                # Count against the scope that is out of tokens
+                scope = max(buckets, key=lambda item: item[1].wait_time(cost))[0]
+                self.rejected[(limit, scope)] = self.rejected.get((limit, scope), 0) + 1
+            else:
+                for _, bucket in buckets:
+                    bucket.tokens -= cost
+            if len(self.buckets) > MAX_ADMISSION_BUCKETS:
+                self.prune(now)
+        return wait
+
+    def prune(self, now):
+        """Drop buckets that have refilled completely (caller holds the lock)"""
+        for key in [key for key, bucket in self.buckets.items()
+                    if bucket.tokens + (now - bucket.updated) * bucket.rate >= bucket.capacity]:
+            del self.buckets[key]
+
+
+def create_session_store(config):
+    """Build the session store selected by the "server" config section"""
+    options = {
+        'max_queue': config.get('command_queue_limit', MAX_COMMAND_QUEUE),
+        'drop_policy': config.get('command_drop_policy', 'drop-motion')
+    }
+    backend = config.get('session_store', 'memory')
+    if backend == 'memory':
+        return MemorySessionStore(**options)
+    if backend == 'sqlite':
+        return SqliteSessionStore(config.get('session_db', DEFAULT_SESSION_DB), **options)
+    raise ValueError(f"Unknown session store: {backend}")
+
+
+class RemoteControlServer:
+    """HTTP-based server for remote control coordination"""
+    
+    def __init__(self, port=8080, max_workers=512, store=None, config=None):
+        self.port = port
+        self.max_workers = max_workers
+        self.config = config or {}
+        self.store = store or create_session_store(self.config)
+        self.metrics = ServerMetrics()
+        self.admission = AdmissionControl.from_config(self.config)
+        self.recording_dir = self.config.get('recording_dir', 'recordings')
+        self.recorder = None
+        if self.config.get('record_sessions'):
+            self.recorder = SessionRecorder(self.recording_dir)
+        # Controller page bytes, built once by create_handler
+        self.web_page = None
+
+    def make_command(self, data):
+        """Build a queued command from a controller's request payload
+
+        Commands the controller traces carry its sequence number and send
+        time (already on the server's clock); agents echo both back in the
+        first frame captured after running the command. Raises ValueError
+        when a coordinate or scroll delta is not a number.
+        """
+        for field in ('x', 'y', 'deltaY'):
+            value = data.get(field)
+            if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+                raise ValueError(f"'{field}' must be a number")
+        command = {
+            'type': data.get('type'),
+            'action': data.get('action'),
+            'x': data.get('x'),
+            'y': data.get('y'),
+            'button': data.get('button'),
+            'key': data.get('key'),
+            'deltaY': data.get('deltaY'),
+            'timestamp': time.time() * 1000
+        }
+        if data.get('seq') is not None:
+            command['seq'] = data['seq']
+            command['sentAt'] = data.get('sentAt')
+        return command
+
+    def deliver_commands(self, commands):
+        """Stamp traced commands with the time they leave for the agent"""
+        now = time.time() * 1000
+        for command in commands:
+            if 'seq' in command:
+                command['deliveredAt'] = now
+        return commands
+
+    def screen_json(self, screen_info):
+        """Legacy JSON view of a frame, with the image as base64 in 'data'"""
+        return {
+            'data': base64.b64encode(self.frame_image(screen_info)).decode(),
+            'timestamp': screen_info['timestamp'],
+            'received_at': screen_info['received_at'],
+            'version': screen_info['version']
+        }
+
+    def screen_json_bytes(self, screen_info):
+        """Encoded JSON response for a frame, serialized once and cached on it
+
+        Every viewer polling the same frame gets these bytes. A frame record
+        is never mutated after it is stored, so a concurrent first read can at
+        worst build the same bytes twice.
+        """
+        body = screen_info.get('json')
+        if body is None:
+            body = json.dumps(self.screen_json(screen_info)).encode('utf-8')
+            screen_info['json'] = body
+        return body
+
+    def encoded_frame(self, screen_info, transport):
+        """Wire bytes of a frame for a push transport, built once per frame
+
+        Every viewer of the session writes the same bytes object. The first
+        viewer to ask builds it under the frame's own lock, so N viewers woken
+        by the same frame cost one encoding rather than N, and other frames
+        and sessions never wait on it.
+        """
+        encoded = screen_info.get(transport)
+        if encoded is None:
+            if transport == 'mjpeg':
+                # Its image may be the composite, built under the same lock
+                self.frame_image(screen_info)
+            with screen_info.setdefault('encode_lock', threading.Lock()):
+                encoded = screen_info.get(transport)
+                if encoded is None:
+                    encoded = self.encode_frame(screen_info, transport)
+                    screen_info[transport] = encoded
+        return encoded
+
+    def encode_frame(self, screen_info, transport, since=None):
+        """Build a frame's bytes for 'mjpeg', 'ws', 'frame', 'sse' or 'composite'
+
+        'ws' and 'frame' are frame messages (see frame_message), framed for
+        the WebSocket or raw for GET /api/screen/<id>.frame. Their '-delta'
+        variants carry only the tiles of this update, for viewers that
+        showed the frame it was applied on; since asks for the tiles after
+        that version instead.
+        """
+        if transport == 'composite':
+            return composite_tiles(screen_info['image'], screen_info['tiles'])
+        if transport == 'mjpeg':
+            image = self.frame_image(screen_info)
+            return (f"--{MJPEG_BOUNDARY}\r\n"
+                    f"Content-Type: {screen_info['content_type']}\r\n"
+                    f"Content-Length: {len(image)}\r\n\r\n".encode()
+                    + image + b"\r\n")
+        meta = {'timestamp': screen_info['timestamp'], 'version': screen_info['version'],
+                'receivedAt': screen_info['received_at']}
+        if 'trace' in screen_info:
+            meta['trace'] = screen_info['trace']
+        if transport == 'sse':
+            meta['sessionId'] = screen_info['session_id']
+            return f"event: frame\ndata: {json.dumps(meta)}\n\n".encode()
+        transport, _, delta = transport.partition('-')
+        if delta:
+            since = tiles_base_version(screen_info)
+        message = self.frame_message(screen_info, meta, since)
+        if transport == 'ws':
+            return WebSocket.encode(message, WebSocket.OP_BINARY)
+        if transport == 'frame':
+            return message
+        raise ValueError(f"Unknown transport: {transport}")
+
+    def frame_message(self, screen_info, meta, since=None):
+        """Binary frame message for a viewer that shows version since
+
+        meta['keyVersion'] names the keyframe. When the viewer already shows
+        that keyframe, only the tiles stored after since are sent; otherwise
+        meta['image'] is the length of the keyframe JPEG that starts the
+        payload, followed by every tile on it. meta['tiles'] lists the tiles
+        as [x, y, w, h, length] and meta['size'] is the keyframe's size.
+        """
+        meta['keyVersion'] = screen_info['key_version']
+        tiles = screen_info.get('tiles') or []
+        image = b''
+        if since is not None and since >= screen_info['key_version']:
+            tiles = [tile for tile in tiles if tile[0] > since]
+        else:
+            image = screen_info['image']
+            meta['image'] = len(image)
+        if tiles or not image:
+            meta['size'] = screen_info.get('size')
+            meta['tiles'] = [[x, y, w, h, len(data)] for _, x, y, w, h, data in tiles]
+        return pack_frame_message(meta, image + b''.join(tile[5] for tile in tiles))
+
+    def frame_update(self, screen_info, since, transport):
+        """Bytes that bring a viewer showing version since up to screen_info
+
+        Viewers that kept up share the cached delta, viewers that skipped
+        updates on the same keyframe get the tiles they missed, and
+        everyone else the keyframe with all of its tiles.
+        """
+        if screen_info.get('tiles') and since is not None and since >= screen_info['key_version']:
+            if since == tiles_base_version(screen_info):
+                return self.encoded_frame(screen_info, transport + '-delta')
+            return self.encode_frame(screen_info, transport, since)
+        return self.encoded_frame(screen_info, transport)
+
+    def frame_image(self, screen_info):
+        """The frame as one image: the keyframe with its tiles pasted on
+
+        For the viewers that cannot apply tiles themselves (the .jpg, JSON
+        and MJPEG endpoints and recordings). Compositing needs PIL and runs
+        at most once per frame; without PIL they get the keyframe, which
+        lags until the agent sends the next one.
+        """
+        if not screen_info.get('tiles') or not HAS_PIL:
+            return screen_info['image']
+        return self.encoded_frame(screen_info, 'composite')
+
+    def ingest_frame(self, session_id, image, timestamp=None, content_type='image/jpeg',
+                     trace=None, key=None):
+        """Store a frame from an agent and hand it to the recorder, if any"""
+        screen_info = self.store.store_screen(session_id, image, timestamp, content_type, trace, key)
+        self.metrics.observe_ingest(session_id, len(image))
+        if self.recorder is not None:
+            self.recorder.record(session_id, image, screen_info['received_at'])
+        return screen_info
+
+    def ingest_tiles(self, session_id, key, tiles, size=None, timestamp=None, trace=None):
+        """Store a tile update from an agent; None when it needs a new keyframe"""
+        screen_info = self.store.store_tiles(session_id, key, tiles, size, timestamp, trace)
+        if screen_info is None:
+            return None
+        self.metrics.observe_ingest(session_id, sum(len(tile[4]) for tile in tiles))
+        if self.recorder is not None and HAS_PIL:
+            # The recorder's writer composites the frame; without PIL only
+            # keyframes are recorded
+            self.recorder.record(session_id, lambda: self.frame_image(screen_info),
+                                 screen_info['received_at'])
+        return screen_info
+
+    def frame_etag(self, screen_info):
+        """Strong ETag identifying one frame version"""
+        return f'"{self.store.instance_id}-{screen_info["version"]}"'
+
+    def create_httpd(self, host='', reuse_port=False):
+        """Create the pooled HTTP server for this instance"""
+        self.store.start_reaper(self.prune_session_state)
+        if self.recorder is not None:
+            self.recorder.start()
+        return PooledHTTPServer((host, self.port), self.create_handler(),
+                                max_workers=self.max_workers, reuse_port=reuse_port,
+                                stream_limits=self.config.get('stream_limits'))
+
+    def prune_session_state(self):
+        """Reaper hook: forget metrics of sessions that are gone, wherever they were dropped"""
+        self.metrics.prune_ingest({session['sessionId'] for session in self.store.list_sessions()})
+
+    def start(self):
+        """Start the HTTP server"""
+        with self.create_httpd() as httpd:
+            print(f"🌐 Remote Control Server started on port {self.port}")
+            print(f"📱 Web interface: http://localhost:{self.port}")
+            print(f"🖥️  Agent URL: http://localhost:{self.port}")
+            if isinstance(self.store, SqliteSessionStore):
+                print(f"🗄️  Shared session store: {self.store.path}")
+            if self.recorder is not None:
+                print(f"🎥 Recording sessions to: {self.recorder.directory}")
+            print("Press Ctrl+C to stop")
+            try:
+                httpd.serve_forever()
+            except KeyboardInterrupt:
+                print("\n🛑 Server stopped")
+            finally:
+                self.shutdown()
+    
+    def shutdown(self):
+        """Stop the background threads and flush pending recordings"""
+        self.store.stop_reaper()
+        if self.recorder is not None:
+            self.recorder.stop()
+    
+    def build_web_page(self, html):
+        """Encode the controller page once: raw and gzip bytes with their ETags"""
+        body = html.encode('utf-8')
+        digest = hashlib.sha256(body).hexdigest()[:16]
+        return {
+            'identity': (body, f'"{digest}"'),
+            'gzip': (gzip.compress(body, compresslevel=9, mtime=0), f'"{digest}-gzip"'),
+        }
+
+    def create_handler(self):
+        """Create HTTP request handler with server reference"""
+        server_ref = self
+        
+        class RequestHandler(BaseHTTPRequestHandler):
+            # Persistent connections: every response carries Content-Length
+            # or Connection: close
+            protocol_version = 'HTTP/1.1'
+            
+            def setup(self):
+                """Start the connection's request count"""
+                super().setup()
+                self.requests_served = 0
+                # Headers and body go out as separate writes; without this, Nagle
+                # holds the body back for the client's delayed ACK on a reused connection
+                self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            
+            def log_message(self, format, *args):
+                """Suppress default logging"""
+                pass
+            
+            def log_request(self, code='-', size='-'):
+                """Remember the response status for metrics (logging stays off)"""
+                self.response_status = code
+            
+            def parse_request(self):
+                """Start the request clock once the request line has arrived
+
+                Also decides whether the connection stays open after this
+                request, and how much request body there is to consume.
+                """
+                self.request_started = time.perf_counter()
+                self.response_status = None
+                self.connection_announced = False
+                self.body_pending = 0
+                # The request has begun: allow slow uploads, but not clients
+                # that stop sending halfway through their headers or body
+                self.connection.settimeout(REQUEST_READ_TIMEOUT)
+                if not super().parse_request():
+                    return False
+                self.requests_served += 1
+                try:
+                    self.body_pending = int(self.headers.get('Content-Length') or 0)
+                except ValueError:
+                    self.close_connection = True
+                if self.headers.get('Transfer-Encoding'):
+                    self.close_connection = True  # Chunked bodies are not read
+                pending = getattr(self.server, 'pending', None)
+                if (self.requests_served >= KEEPALIVE_MAX_REQUESTS
+                        or (pending is not None and pending.qsize())):
+                    # Free this worker for connections waiting in the pool
+                    self.close_connection = True
+                return True
+            
+            def send_header(self, keyword, value):
+                """Send a header, noting when the Connection header is set by hand"""
+                if keyword.lower() == 'connection':
+                    self.connection_announced = True
+                super().send_header(keyword, value)
+            
+            def end_headers(self):
+                """Tell HTTP/1.1 clients when this response ends the connection"""
+                if (self.close_connection and self.request_version == 'HTTP/1.1'
+                        and not getattr(self, 'connection_announced', True)):
+                    self.send_header('Connection', 'close')
+                super().end_headers()
+            
+            def read_body(self):
+                """Read the request body announced by Content-Length"""
+                length, self.body_pending = self.body_pending, 0
+                try:
+                    body = self.rfile.read(length)
+                except OSError:
+                    self.close_connection = True
+                    raise
+                if len(body) < length:
+                    self.close_connection = True
+                return body
+            
+            def drain_body(self):
+                """Discard a body the handler did not read, or give up on the connection"""
+                length, self.body_pending = self.body_pending, 0
+                if self.close_connection or length > MAX_DRAIN_BYTES:
+                    self.close_connection = True
+                    return
+                try:
+                    if len(self.rfile.read(length)) < length:
+                        self.close_connection = True
+                except OSError:
+                    self.close_connection = True
+            
+            def handle_one_request(self):
+                """Handle a request, then record its route, status and duration"""
+                self.request_started = time.perf_counter()
+                self.response_status = None
+                self.body_pending = 0
+                self.stream_kind = None
+                # Idle keep-alive connections give their worker back after a while
+                self.connection.settimeout(KEEPALIVE_TIMEOUT)
+                try:
+                    super().handle_one_request()
+                finally:
+                    if self.stream_kind is not None:
+                        self.server.end_stream(self.stream_kind)
+                        self.stream_kind = None
+                if self.body_pending:
+                    self.drain_body()
+                if self.response_status is not None:
+                    status = getattr(self.response_status, 'value', self.response_status)
+                    server_ref.metrics.observe_request(
+                        self.command or '-', getattr(self, 'path', ''), status,
+                        time.perf_counter() - self.request_started)
+                
+            def admit_request(self, path):
+                """Admission layer: charge the request to its session and client IP
+
+                Answers 429 and returns False when a bucket is empty. Requests
+                whose session ID is in the body are charged to the session
+                by their handler once it is known.
+                """
+                self.client_ip = server_ref.admission.client_ip(self.client_address, self.headers)
+                admission = request_admission(self.command, path)
+                if admission is None:
+                    return True
+                limit, session_id = admission
+                cost = self.body_pending if limit == 'ingest' else 1
+                retry_after = server_ref.admission.admit(limit, session_id, self.client_ip, cost)
+                if retry_after:
+                    self.send_rate_limited(limit, retry_after)
+                    return False
+                return True
+            
+            def begin_stream(self, kind):
+                """Claim a stream slot for this connection; 503 and False when kind is full
+
+                A stream waits on purpose, so from here on the connection
+                has no read timeout.
+                """
+                begin = getattr(self.server, 'begin_stream', None)
+                if begin is None:
+                    self.connection.settimeout(None)
+                    return True
+                if not begin(kind):
+                    self.close_connection = True
+                    self.send_json_response(
+                        {'error': 'Too many open streams', 'stream': kind},
+                        status=503, headers={'Retry-After': str(STREAM_RETRY_AFTER)})
+                    return False
+                self.stream_kind = kind
+                self.connection.settimeout(None)
+                return True
+            
+            def peer_closed(self):
+                """True once the client hung up on a stream it never writes to"""
+                try:
+                    readable, _, _ = select.select([self.connection], [], [], 0)
+                    return bool(readable) and not self.connection.recv(1, socket.MSG_PEEK)
+                except (OSError, ValueError):
+                    return True
+            
+            def admit_session(self, limit, session_id, cost=1):
+                """Charge a request to a session found in its body; 429 and False if over"""
+                if self.client_ip in server_ref.admission.exempt_ips:
+                    return True
+                retry_after = server_ref.admission.admit(limit, session_id, cost=cost)
+                if retry_after:
+                    self.send_rate_limited(limit, retry_after)
+                    return False
+                return True
+            
+            def send_rate_limited(self, limit, retry_after):
+                """429 with a Retry-After hint; the backpressure flag slows controllers down"""
+                self.send_json_response(
+                    {'error': 'Rate limit exceeded', 'limit': limit, 'retryAfter': retry_after,
+                     'backpressure': True},
+                    status=429, headers={'Retry-After': str(max(1, math.ceil(retry_after)))})
+            
+            def do_GET(self):
+                """Handle GET requests"""
+                parsed = urlparse(self.path)
+                path = parsed.path
+                query = parse_qs(parsed.query)
+                if not self.admit_request(path):
+                    return
+                
+                if path == '/':
+                    self.serve_web_interface()
+                elif path == '/api/sessions':
+                    self.api_get_sessions()
+                elif path.startswith('/api/commands/'):
+                    session_id = path.split('/')[-1]
+                    self.api_get_commands(session_id, query)
+                elif path.startswith('/api/screen/') and path.endswith('.jpg'):
+                    session_id = path.split('/')[-1][:-len('.jpg')]
+                    self.api_get_screen_image(session_id)
+                elif path.startswith('/api/screen/') and path.endswith('.frame'):
+                    session_id = path.split('/')[-1][:-len('.frame')]
+                    self.api_get_screen_update(session_id, query)
+                elif path.startswith('/api/screen/'):
+                    session_id = path.split('/')[-1]
+                    self.api_get_screen(session_id)
+                elif path == '/api/events':
+                    self.api_events(query)
+                elif path == '/api/metrics':
+                    self.api_metrics()
+                elif path.startswith('/api/stream/'):
+                    session_id = path.split('/')[-1]
+                    self.api_stream_screen(session_id)
+                elif path == '/api/recordings':
+                    self.api_list_recordings()
+                elif path.startswith('/api/recordings/'):
+                    self.api_recording(path.split('/')[3:], query)
+                elif path.startswith('/ws/agent/'):
+                    session_id = path.split('/')[-1]
+                    self.ws_agent(session_id)
+                elif path.startswith('/ws/control/'):
+                    session_id = path.split('/')[-1]
+                    self.ws_control(session_id)
+                else:
+                    self.send_error(404)
+            
+            def do_POST(self):
+                """Handle POST requests"""
+                parsed = urlparse(self.path)
+                path = parsed.path
+                if not self.admit_request(path):
+                    return
+                
+                if path == '/api/register':
+                    self.api_register()
+                elif path == '/api/screen':
+                    self.api_post_screen()
+                elif path.startswith('/api/screen/'):
+                    session_id = path.split('/')[-1]
+                    self.api_post_screen_binary(session_id)
+                elif path == '/api/command':
+                    self.api_post_command()
+                elif path == '/api/unregister':
+                    self.api_unregister()
+                else:
+                    self.send_error(404)
+            
+            def serve_web_interface(self):
+                """Serve the controller page: prebuilt, gzip when accepted, 304 on a matching ETag"""
+                page = server_ref.web_page
+                encoding = 'gzip' if accepts_gzip(self.headers.get('Accept-Encoding')) else 'identity'
+                body, etag = page[encoding]
+                
+                # Either variant's tag revalidates: both name the same page
+                if_none_match = [tag.strip() for tag in self.headers.get('If-None-Match', '').split(',')]
+                matched = '*' in if_none_match or any(tag in if_none_match for _, tag in page.values())
+                self.send_response(304 if matched else 200)
+                self.send_header('ETag', etag)
+                self.send_header('Cache-Control', f'public, max-age={WEB_PAGE_MAX_AGE}')
+                self.send_header('Vary', 'Accept-Encoding')
+                if matched:
+                    self.end_headers()
+                    return
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                if encoding == 'gzip':
+                    self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def api_get_sessions(self):
+                """API: Get list of active sessions"""
+                self.send_json_response(server_ref.store.list_sessions())
+            
+            def api_get_commands(self, session_id, query):
+                """API: Get pending commands for a session
+
+                Pass ?wait=SECONDS to long-poll: the response is held until a
+                command is queued or the wait expires (capped at MAX_LONG_POLL).
+                """
+                received = time.time() * 1000
+                try:
+                    wait = float(query.get('wait', ['0'])[0])
+                except ValueError:
+                    wait = 0
+                if wait > 0 and not self.begin_stream('poll'):
+                    return
+                commands = server_ref.deliver_commands(server_ref.store.take_commands(session_id, wait))
+                # Every poll doubles as a clock sample for the agent
+                self.send_json_response(commands, headers=self.clock_headers(received))
+            
+            def api_get_screen(self, session_id):
+                """API: Get latest screen data for a session (optimized)"""
+                screen_info = server_ref.store.get_screen(session_id)
+                if screen_info is not None:
+                    # Serialized once per frame, shared by every viewer
+                    response = server_ref.screen_json_bytes(screen_info)
+                    server_ref.metrics.observe_frame_age('/api/screen/{id}', screen_info)
+                    
+                    # Add caching headers for better performance
+                    self.send_response(200)
+                    self.send_header('Content-Type', 'application/json')
+                    self.send_header('Content-Length', str(len(response)))
+                    self.send_header('Cache-Control', 'no-cache, must-revalidate')
+                    self.send_header('Pragma', 'no-cache')
+                    self.end_headers()
+                    self.wfile.write(response)
+                else:
+                    self.send_json_response({'error': 'No screen data available', 'data': None})
+            
+            def api_get_screen_image(self, session_id):
+                """API: Latest frame as a raw image, 304 when the ETag still matches"""
+                screen_info = server_ref.store.get_screen(session_id)
+                if screen_info is None:
+                    self.send_error(404, 'No screen data available')
+                    return
+                
+                etag = server_ref.frame_etag(screen_info)
+                if_none_match = self.headers.get('If-None-Match', '')
+                if etag in [tag.strip() for tag in if_none_match.split(',')]:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Cache-Control', 'no-cache')
+                    self.end_headers()
+                    return
+                
+                image = server_ref.frame_image(screen_info)
+                server_ref.metrics.observe_frame_age('/api/screen/{id}.jpg', screen_info)
+                self.send_response(200)
+                self.send_header('Content-Type', screen_info['content_type'])
+                self.send_header('Content-Length', str(len(image)))
+                self.send_header('ETag', etag)
+                self.send_header('Cache-Control', 'no-cache')
+                self.send_header('X-Frame-Timestamp', str(screen_info['timestamp']))
+                self.send_header('X-Frame-Version', str(screen_info['version']))
+                self.send_header('X-Frame-Received', str(screen_info['received_at']))
+                if 'trace' in screen_info:
+                    self.send_header('X-Frame-Trace', json.dumps(screen_info['trace']))
+                self.end_headers()
+                self.wfile.write(image)
+            
+            def api_get_screen_update(self, session_id, query):
+                """API: Latest frame as a frame message, 304 while ?since= is current
+
+                The controller's polling path. ?since= is the version the
+                page shows; on the same keyframe only the newer tiles come
+                back, otherwise the keyframe with its tiles.
+                """
+                screen_info = server_ref.store.get_screen(session_id)
+                if screen_info is None:
+                    self.send_error(404, 'No screen data available')
+                    return
+                
+                try:
+                    since = int(query.get('since', [''])[0])
+                except ValueError:
+                    since = None
+                if since == screen_info['version']:
+                    self.send_response(304)
+                    self.send_header('Cache-Control', 'no-cache')
+                    self.end_headers()
+                    return
+                
+                body = server_ref.frame_update(screen_info, since, 'frame')
+                server_ref.metrics.observe_frame_age('/api/screen/{id}.frame', screen_info)
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/octet-stream')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('Cache-Control', 'no-cache')
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def api_stream_screen(self, session_id):
+                """API: MJPEG stream that pushes each new frame as it arrives"""
+                if not server_ref.store.has_session(session_id):
+                    self.send_error(404, 'Unknown session')
+                    return
+                if not self.begin_stream('mjpeg'):
+                    return
+                
+                self.send_response(200)
+                self.send_header('Content-Type', f'multipart/x-mixed-replace; boundary={MJPEG_BOUNDARY}')
+                self.send_header('Cache-Control', 'no-cache, no-store')
+                self.send_header('Pragma', 'no-cache')
+                self.send_header('Connection', 'close')
+                self.end_headers()
+                self.close_connection = True
+                
+                viewer = server_ref.store.add_viewer(session_id)
+                screen_info = None
+                try:
+                    while True:
+                        newer = viewer.take(WS_PING_INTERVAL)
+                        if newer is None:
+                            if viewer.closed or self.peer_closed():
+                                break  # Session or viewer is gone
+                            if screen_info is None:
+                                continue
+                            # Repeat the last frame so dead viewers are noticed
+                        else:
+                            screen_info = newer
+                            server_ref.metrics.observe_frame_age('/api/stream/{id}', screen_info)
+                        self.wfile.write(server_ref.encoded_frame(screen_info, 'mjpeg'))
+                except OSError:
+                    pass  # Viewer went away
+                finally:
+                    server_ref.store.remove_viewer(viewer)
+            
+            def api_events(self, query):
+                """API: Server-Sent Events for frame versions and session changes
+
+                ?session=ID adds 'frame' events for that session. Session
+                events carry an id so reconnecting clients resume from
+                Last-Event-ID; 'resync' means some were missed.
+                """
+                session_id = query.get('session', [None])[0]
+                try:
+                    last_event_id = int(self.headers.get('Last-Event-ID') or 0)
+                except ValueError:
+                    last_event_id = 0
+                if not last_event_id:
+                    last_event_id = server_ref.store.latest_event_id()
+                if not self.begin_stream('sse'):
+                    return
+                
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Cache-Control', 'no-cache')
+                self.send_header('X-Accel-Buffering', 'no')
+                self.send_header('Connection', 'close')
+                self.end_headers()
+                self.close_connection = True
+                
+                version = 0
+                try:
+                    self.wfile.write(b'retry: 3000\n\n')
+                    while True:
+                        screen_info, events, resync = server_ref.store.wait_for_updates(
+                            session_id, version, last_event_id, WS_PING_INTERVAL)
+                        chunks = []
+                        if resync:
+                            chunks.append(b'event: resync\ndata: {}\n\n')
+                        for event_id, event in events:
+                            chunks.append(f'id: {event_id}\nevent: session\ndata: {json.dumps(event)}\n\n'.encode())
+                            last_event_id = event_id
+                        if screen_info is not None:
+                            version = screen_info['version']
+                            chunks.append(server_ref.encoded_frame(screen_info, 'sse'))
+                        if not chunks:
+                            if self.peer_closed():
+                                break  # Frees the stream slot without waiting for a failed write
+                            chunks.append(b': keep-alive\n\n')
+                        self.wfile.write(b''.join(chunks))
+                except OSError:
+                    pass  # Subscriber went away
+            
+            def api_list_recordings(self):
+                """API: Summary of every recording on disk"""
+                recordings = []
+                if os.path.isdir(server_ref.recording_dir):
+                    for name in sorted(os.listdir(server_ref.recording_dir)):
+                        if not name.endswith('.idx'):
+                            continue
+                        session_id = name[:-len('.idx')]
+                        recording = Recording.open(server_ref.recording_dir, session_id)
+                        if recording is not None:
+                            try:
+                                recordings.append(recording.info(session_id))
+                            finally:
+                                recording.close()
+                self.send_json_response(recordings)
+            
+            def api_recording(self, parts, query):
+                """API: A recording's summary, frame at ?t=, playback or raw segment
+
+                /api/recordings/<id>             summary
+                /api/recordings/<id>/frame?t=MS  frame on screen at time t
+                /api/recordings/<id>/play        MJPEG playback (?speed=1|2|4|8&t=MS)
+                /api/recordings/<id>.seg         segment file, honours Range
+                """
+                session_id = parts[0]
+                action = parts[1] if len(parts) > 1 else 'info'
+                if session_id.endswith('.seg'):
+                    session_id, action = session_id[:-len('.seg')], 'segment'
+                
+                try:
+                    speed = int(query.get('speed', ['1'])[0])
+                    timestamp = float(query['t'][0]) if 't' in query else None
+                except ValueError:
+                    self.send_json_response({'error': 'Invalid speed or t'}, status=400)
+                    return
+                if speed not in PLAYBACK_SPEEDS:
+                    self.send_json_response({'error': f'speed must be one of {PLAYBACK_SPEEDS}'},
+                                            status=400)
+                    return
+                
+                recording = Recording.open(server_ref.recording_dir, session_id)
+                if recording is None:
+                    self.send_error(404, 'No such recording')
+                    return
+                try:
+                    if action == 'info':
+                        self.send_json_response(recording.info(session_id))
+                    elif action == 'segment':
+                        self.api_recording_segment(recording)
+                    elif not recording.count:
+                        self.send_error(404, 'Recording is empty')
+                    elif action == 'frame':
+                        self.api_recording_frame(recording, timestamp)
+                    elif action == 'play':
+                        self.api_play_recording(recording, speed, timestamp)
+                    else:
+                        self.send_error(404)
+                except OSError:
+                    pass  # Viewer went away
+                finally:
+                    recording.close()
+            
+            def api_recording_frame(self, recording, timestamp):
+                """API: The recorded frame that was on screen at a given time"""
+                index = recording.seek(timestamp) if timestamp is not None else 0
+                frame_timestamp, image = recording.frame(index)
+                self.send_response(200)
+                self.send_header('Content-Type', 'image/jpeg')
+                self.send_header('Content-Length', str(len(image)))
+                self.send_header('Cache-Control', 'max-age=3600')
+                self.send_header('X-Frame-Timestamp', str(frame_timestamp))
+                self.send_header('X-Frame-Index', str(index))
+                self.end_headers()
+                self.wfile.write(image)
+            
+            def api_play_recording(self, recording, speed, timestamp):
+                """API: Replay a recording as MJPEG, paced by its timestamps
+
+                Pauses longer than PLAYBACK_MAX_GAP are shortened so idle
+                stretches of a lab session do not stall the reviewer.
+                """
+                if not self.begin_stream('mjpeg'):
+                    return
+                self.send_response(200)
+                self.send_header('Content-Type', f'multipart/x-mixed-replace; boundary={MJPEG_BOUNDARY}')
+                self.send_header('Cache-Control', 'no-cache, no-store')
+                self.send_header('Connection', 'close')
+                self.end_headers()
+                self.close_connection = True
+                
+                first = recording.seek(timestamp) if timestamp is not None else 0
+                started = time.monotonic()
+                played = 0.0  # Recorded seconds so far, after shortening pauses
+                previous = recording.timestamp(first)
+                for index in range(first, recording.count):
+                    frame_timestamp, image = recording.frame(index)
+                    played += min(max(frame_timestamp - previous, 0) / 1000, PLAYBACK_MAX_GAP)
+                    previous = frame_timestamp
+                    delay = played / speed - (time.monotonic() - started)
+                    if delay > 0:
+                        time.sleep(delay)
+                    self.wfile.write(
+                        f"--{MJPEG_BOUNDARY}\r\n"
+                        f"Content-Type: image/jpeg\r\n"
+                        f"Content-Length: {len(image)}\r\n"
+                        f"X-Frame-Timestamp: {frame_timestamp}\r\n\r\n".encode())
+                    # Straight from the memory map, no copy
+                    self.wfile.write(image)
+                    self.wfile.write(b"\r\n")
+            
+            def api_recording_segment(self, recording):
+                """API: Download a segment file, or a byte range of it"""
+                size = len(recording.segment)
+                start, end = 0, size - 1
+                status = 200
+                range_header = self.headers.get('Range')
+                if range_header:
+                    try:
+                        byte_range = parse_byte_range(range_header, size)
+                    except ValueError:
+                        byte_range = (start, end)  # Malformed ranges are ignored
+                        range_header = None
+                    if byte_range is None:
+                        self.send_response(416)
+                        self.send_header('Content-Range', f'bytes */{size}')
+                        self.send_header('Content-Length', '0')
+                        self.end_headers()
+                        return
+                    if range_header:
+                        start, end = byte_range
+                        status = 206
+                
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/octet-stream')
+                self.send_header('Accept-Ranges', 'bytes')
+                self.send_header('Content-Length', str(end - start + 1))
+                if status == 206:
+                    self.send_header('Content-Range', f'bytes {start}-{end}/{size}')
+                self.end_headers()
+                chunk = 1024 * 1024
+                for offset in range(start, end + 1, chunk):
+                    self.wfile.write(recording.segment[offset:min(offset + chunk, end + 1)])
+            
+            def api_metrics(self):
+                """API: Server metrics in Prometheus text format"""
+                body = server_ref.metrics.render(server_ref.store, server_ref.recorder,
+                                                 server_ref.admission).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('Cache-Control', 'no-cache')
+                self.end_headers()
+                self.wfile.write(body)
+            
+            def api_unregister(self):
+                """API: Agent is shutting down; drop its session"""
+                try:
+                    data = json.loads(self.read_body().decode())
+                    removed = server_ref.store.drop_session(data.get('sessionId'), 'left')
+                    if removed:
+                        server_ref.metrics.forget_session(data.get('sessionId'))
+                    self.send_json_response({'status': 'removed' if removed else 'unknown'})
+                except Exception as e:
+                    self.send_json_response({'error': str(e)}, status=400)
+            
+            def api_register(self):
+                """API: Register a new agent session"""
+                try:
+                    data = json.loads(self.read_body().decode())
+                    
+                    session_id = server_ref.store.register_session(data)
+                    
+                    # serverTime gives the agent its first clock offset sample
+                    # 'tiles': agents may send partial frame updates
+                    response = {'sessionId': session_id, 'status': 'registered',
+                                'serverTime': time.time() * 1000, 'features': ['tiles']}
+                    self.send_json_response(response)
+                    
+                    print(f"🤖 Agent registered: {session_id} ({data.get('platform', 'unknown')})")
+                    
+                except Exception as e:
+                    self.send_json_response({'error': str(e)}, status=400)
+            
+            def api_post_screen(self):
+                """API: Receive screen data from agent"""
+                try:
+                    data = json.loads(self.read_body().decode())
+                    
+                    session_id = data.get('sessionId')
+                    if not session_id:
+                        self.send_json_response({'error': 'Missing sessionId'}, status=400)
+                        return
+                    
+                    image = base64.b64decode(data.get('data') or '')
+                    if not self.admit_session('ingest', session_id, len(image)):
+                        return
+                    server_ref.ingest_frame(session_id, image, data.get('timestamp'),
+                                            trace=data.get('trace'))
+                    
+                    self.send_json_response({'status': 'received'})
+                    
+                except Exception as e:
+                    self.send_json_response({'error': str(e)}, status=400)
+            
+            def api_post_screen_binary(self, session_id):
+                """API: Receive a raw image frame, metadata in X-Frame-* headers
+
+                A TILES_CONTENT_TYPE body is a tile message instead (see
+                pack_tiles) for the keyframe named in its 'key'; 409 asks
+                the agent for a new keyframe.
+                """
+                try:
+                    if self.body_pending > MAX_FRAME_BYTES:
+                        self.close_connection = True
+                        self.send_json_response({'error': 'Frame too large'}, status=413)
+                        return
+                    image = self.read_body()
+                    content_type = self.headers.get('Content-Type', 'image/jpeg')
+                    
+                    if content_type == TILES_CONTENT_TYPE:
+                        meta, payload = unpack_frame_message(image)
+                        screen_info = server_ref.ingest_tiles(
+                            session_id, meta.get('key'), unpack_tiles(meta, payload),
+                            meta.get('size'), meta.get('timestamp'), meta.get('trace'))
+                        if screen_info is None:
+                            self.send_json_response({'error': 'Unknown keyframe', 'keyframe': True},
+                                                    status=409)
+                            return
+                        self.send_json_response({'status': 'received'})
+                        return
+                    
+                    timestamp = self.headers.get('X-Frame-Timestamp')
+                    trace = self.headers.get('X-Frame-Trace')
+                    server_ref.ingest_frame(
+                        session_id, image,
+                        float(timestamp) if timestamp else None,
+                        content_type,
+                        json.loads(trace) if trace else None,
+                        self.headers.get('X-Frame-Key'))
+                    
+                    self.send_json_response({'status': 'received'})
+                    
+                except Exception as e:
+                    self.send_json_response({'error': str(e)}, status=400)
+            
+            def api_post_command(self):
+                """API: Send command to agent"""
+                received = time.time() * 1000
+                try:
+                    data = json.loads(self.read_body().decode())
+                    if not self.admit_session('commands', data.get('sessionId')):
+                        return
+                    
+                    command = server_ref.make_command(data)
+                    result = server_ref.store.queue_command(data.get('sessionId'), command)
+                    if result is None:
+                        self.send_json_response({'error': 'Invalid session'}, status=400)
+                        return
+                    
+                    # A full queue is the agent falling behind: tell the controller to back off
+                    self.send_json_response(result, status=429 if result['status'] == 'rejected' else 200,
+                                            headers=self.clock_headers(received))
+                    
+                except Exception as e:
+                    self.send_json_response({'error': str(e)}, status=400)
+            
+            def accept_websocket(self):
+                """Complete the WebSocket upgrade handshake, or answer 400"""
+                key = self.headers.get('Sec-WebSocket-Key')
+                if not key or self.headers.get('Upgrade', '').lower() != 'websocket':
+                    self.send_error(400, 'Expected WebSocket upgrade')
+                    return None
+                
+                self.send_response(101, 'Switching Protocols')
+                self.send_header('Upgrade', 'websocket')
+                self.send_header('Connection', 'Upgrade')
+                self.send_header('Sec-WebSocket-Accept', WebSocket.accept_key(key))
+                self.end_headers()
+                self.close_connection = True
+                return WebSocket(self.rfile, self.wfile.write)
+            
+            def run_websocket_reader(self, ws, on_message, closed, on_close=None):
+                """Read messages on a helper thread until the socket closes"""
+                def reader():
+                    try:
+                        while True:
+                            opcode, payload = ws.recv()
+                            try:
+                                on_message(opcode, payload)
+                            except (ValueError, KeyError, TypeError, AttributeError, struct.error):
+                                continue  # Ignore malformed messages
+                    except (WebSocketClosed, OSError):
+                        pass
+                    finally:
+                        closed.set()
+                        server_ref.store.wake_waiters()
+                        if on_close is not None:
+                            on_close()
+                
+                threading.Thread(target=reader, daemon=True).start()
+            
+            def ws_agent(self, session_id):
+                """WebSocket: agent pushes frames, server pushes commands"""
+                if not self.begin_stream('ws'):
+                    return
+                ws = self.accept_websocket()
+                if ws is None:
+                    return
+                
+                def on_message(opcode, payload):
+                    if opcode == WebSocket.OP_TEXT:
+                        self.answer_clock(ws, parse_json_object(payload))
+                        return
+                    if opcode != WebSocket.OP_BINARY:
+                        return
+                    meta, image = unpack_frame_message(payload)
+                    retry_after = server_ref.admission.admit('ingest', session_id, self.client_ip, len(image))
+                    if retry_after:
+                        # Drop the frame and tell the agent how long to hold off
+                        ws.send_text(json.dumps({'type': 'throttle', 'limit': 'ingest',
+                                                 'retryAfter': retry_after}))
+                        return
+                    if 'tiles' in meta:
+                        if server_ref.ingest_tiles(session_id, meta.get('key'), unpack_tiles(meta, image),
+                                                   meta.get('size'), meta.get('timestamp'),
+                                                   meta.get('trace')) is None:
+                            ws.send_text(json.dumps({'type': 'keyframe'}))
+                        return
+                    server_ref.ingest_frame(session_id, image, meta.get('timestamp'),
+                                            trace=meta.get('trace'), key=meta.get('key'))
+                
+                closed = threading.Event()
+                self.run_websocket_reader(ws, on_message, closed)
+                try:
+                    while not closed.is_set():
+                        commands = server_ref.store.take_commands(session_id, WS_PING_INTERVAL, closed)
+                        if commands:
+                            server_ref.deliver_commands(commands)
+                            ws.send_text(json.dumps({'type': 'commands', 'commands': commands}))
+                        elif not closed.is_set():
+                            ws.ping()
+                except (WebSocketClosed, OSError):
+                    pass
+                finally:
+                    ws.close()
+            
+            def ws_control(self, session_id):
+                """WebSocket: server pushes frames, controller sends input"""
+                if not self.begin_stream('ws'):
+                    return
+                ws = self.accept_websocket()
+                if ws is None:
+                    return
+                
+                backpressure = [False]
+                
+                def on_message(opcode, payload):
+                    if opcode != WebSocket.OP_TEXT:
+                        return
+                    data = parse_json_object(payload)
+                    if self.answer_clock(ws, data):
+                        return
+                    retry_after = server_ref.admission.admit('commands', session_id, self.client_ip)
+                    if retry_after:
+                        backpressure[0] = True
+                        ws.send_text(json.dumps({'type': 'backpressure', 'backpressure': True,
+                                                 'status': 'rate-limited', 'retryAfter': retry_after}))
+                        return
+                    result = server_ref.store.queue_command(session_id, server_ref.make_command(data))
+                    # Only report changes so an idle queue costs no extra messages
+                    if result is not None and (result['backpressure'] != backpressure[0]
+                                               or result['status'] == 'rejected'):
+                        backpressure[0] = result['backpressure']
+                        ws.send_text(json.dumps(dict(result, type='backpressure')))
+                
+                viewer = server_ref.store.add_viewer(session_id)
+                closed = threading.Event()
+                self.run_websocket_reader(ws, on_message, closed, on_close=viewer.close)
+                shown = None  # Version the controller shows, for tile deltas
+                try:
+                    while not viewer.closed:
+                        screen_info = viewer.take(WS_PING_INTERVAL)
+                        if screen_info is None:
+                            if not viewer.closed:
+                                ws.ping()
+                            continue
+                        server_ref.metrics.observe_frame_age('/ws/control/{id}', screen_info)
+                        ws.send_frame(server_ref.frame_update(screen_info, shown, 'ws'))
+                        shown = screen_info['version']
+                except (WebSocketClosed, OSError):
+                    pass
+                finally:
+                    server_ref.store.remove_viewer(viewer)
+                    ws.close()
+            
+            def answer_clock(self, ws, data):
+                """Reply to a WebSocket clock sample; False for any other message"""
+                if data.get('type') != 'clock':
+                    return False
+                ws.send_text(json.dumps({'type': 'clock', 'clientTime': data.get('clientTime'),
+                                         'serverTime': time.time() * 1000}))
+                return True
+            
+            def clock_headers(self, received):
+                """Headers that let the client sample its clock offset against ours"""
+                return {'X-Server-Received': str(received),
+                        'X-Server-Time': str(time.time() * 1000)}
+            
+            def send_json_response(self, data, status=200, headers=None):
+                """Send JSON response"""
+                body = json.dumps(data).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('Access-Control-Allow-Origin', '*')
+                self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
+                self.send_header('Access-Control-Allow-Headers', 'Content-Type')
+                for name, value in (headers or {}).items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(body)
+            
+            @staticmethod
+            def get_web_interface_html():
+                """Generate the web interface HTML"""
+                return '''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>University Remote Control</title>
+    <style>
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            margin: 0;
+            padding: 20px;
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            min-height: 100vh;
+            color: white;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: rgba(255, 255, 255, 0.1);
+            border-radius: 15px;
+            padding: 30px;
+            backdrop-filter: blur(10px);
+            box-shadow: 0 8px 32px rgba(0, 0, 0, 0.1);
+        }
+        .header {
+            text-align: center;
+            margin-bottom: 30px;
+        }
+        .header h1 {
+            margin: 0;
+            font-size: 2.5em;
+            text-shadow: 2px 2px 4px rgba(0, 0, 0, 0.3);
+        }
+        .status {
+            padding: 15px;
+            margin: 20px 0;
+            border-radius: 8px;
+            text-align: center;
+        }
+        .status.connected {
+            background: rgba(46, 204, 113, 0.2);
+            border: 1px solid #2ecc71;
+        }
+        .status.disconnected {
+            background: rgba(231, 76, 60, 0.2);
+            border: 1px solid #e74c3c;
+        }
+        .controls {
+            display: grid;
+            grid-template-columns: 1fr 1fr;
+            gap: 20px;
+            margin: 20px 0;
+        }
+        .control-panel {
+            background: rgba(255, 255, 255, 0.1);
+            border-radius: 10px;
+            padding: 20px;
+        }
+        .control-panel h3 {
+            margin-top: 0;
+            color: #fff;
+        }
+        input, button, select {
+            width: 100%;
+            padding: 12px;
+            margin: 10px 0;
+            border: none;
+            border-radius: 6px;
+            font-size: 16px;
+        }
+        input {
+            background: rgba(255, 255, 255, 0.9);
+            color: #333;
+        }
+        button {
+            background: #3498db;
+            color: white;
+            cursor: pointer;
+            font-weight: bold;
+            transition: background 0.3s;
+        }
+        button:hover {
+            background: #2980b9;
+        }
+        button:disabled {
+            background: #7f8c8d;
+            cursor: not-allowed;
+        }
+        .screen-container {
+            margin: 20px 0;
+            text-align: center;
+            background: rgba(0, 0, 0, 0.3);
+            border-radius: 10px;
+            padding: 20px;
+        }
+        #screen {
+            max-width: 100%;
+            height: auto;
+            border-radius: 8px;
+            box-shadow: 0 4px 16px rgba(0, 0, 0, 0.3);
+            cursor: crosshair;
+        }
+        .screen-frame {
+            position: relative;
+            display: inline-block;
+            max-width: 100%;
+            line-height: 0;
+        }
+        .tile-layer {
+            position: absolute;
+            top: 0;
+            left: 0;
+            width: 100%;
+            height: 100%;
+            overflow: hidden;
+            border-radius: 8px;
+            pointer-events: none;
+        }
+        .tile-layer img {
+            position: absolute;
+        }
+        .sessions-list {
+            background: rgba(255, 255, 255, 0.1);
+            border-radius: 10px;
+            padding: 20px;
+            margin: 20px 0;
+        }
+        .session-item {
+            display: flex;
+            justify-content: space-between;
+            align-items: center;
+            padding: 10px;
+            margin: 5px 0;
+            background: rgba(255, 255, 255, 0.1);
+            border-radius: 6px;
+            cursor: pointer;
+            transition: background 0.3s;
+        }
+        .session-item:hover {
+            background: rgba(255, 255, 255, 0.2);
+        }
+        .session-item.active {
+            background: rgba(52, 152, 219, 0.3);
+        }
+        .latency-panel table {
+            margin: 10px auto 0;
+            border-collapse: collapse;
+            font-size: 14px;
+        }
+        .latency-panel td {
+            padding: 2px 12px;
+            text-align: right;
+        }
+        .latency-panel td:first-child {
+            text-align: left;
+        }
+        @media (max-width: 768px) {
+            .controls {
+                grid-template-columns: 1fr;
+            }
+            .header h1 {
+                font-size: 2em;
+            }
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>🎓 University Remote Control</h1>
+            <p>Connect to university computers from anywhere</p>
+        </div>
+
+        <div id="status" class="status disconnected">
+            <strong>⚠️ Disconnected</strong> - Enter a Session ID to connect
+        </div>
+
+        <div class="controls">
+            <div class="control-panel">
+                <h3>🔗 Connection</h3>
+                <input type="text" id="sessionId" placeholder="Enter Session ID (e.g., A1B2C3)" maxlength="8">
+                <button onclick="connectToSession()">Connect to Computer</button>
+                <button onclick="disconnectSession()" id="disconnectBtn" disabled>Disconnect</button>
+            </div>
+
+            <div class="control-panel">
+                <h3>📋 Available Sessions</h3>
+                <div id="sessionsList">Loading sessions...</div>
+                <button onclick="refreshSessions()">Refresh Sessions</button>
+            </div>
+        </div>
+
+        <div class="screen-container">
+            <h3>🖥️ Remote Screen</h3>
+            <div class="screen-frame" id="screenFrame">
+                <img id="screen" src="data:image/png;base64,iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg==" alt="Remote screen will appear here">
+            </div>
+            <p id="screenStatus">Not connected</p>
+            <div class="latency-panel">
+                <h3>⏱️ Input Latency</h3>
+                <div id="latency">Click or type on the remote screen to measure</div>
+            </div>
+        </div>
+    </div>
+
+    <script>
+        let currentSessionId = null;
+        let screenUpdateInterval = null;
+        let sessionsUpdateInterval = null;
+        let lastMouseMove = 0; // For throttling mouse movement
+        const BLANK_IMAGE = document.getElementById('screen').src;
+        let socket = null; // WebSocket channel; HTTP polling is the fallback
+        let shownVersion = null; // Frame version on screen; polls and tiles build on it
+        let shownKeyVersion = null; // Keyframe under the tiles on screen
+        let tileLayer = null; // Tiles drawn over the current keyframe
+        let screenRequestPending = false;
+        let screenRefetch = false; // A frame was announced while a fetch was running
+        let polling = false; // True while frames are fetched from /api/screen/<id>.frame
+        let events = null; // EventSource for frame and session notifications
+        let eventsOpen = false;
+        let streaming = false; // True while the <img> shows the MJPEG stream
+        let frameUrl = null; // Object URL of the frame currently shown
+        let backpressure = false; // Server says the agent is falling behind
+        let commandSeq = Math.floor(Math.random() * 1e9); // Traced command IDs, unique per tab
+        const tracedCommands = new Map(); // seq -> true for commands this tab sent
+        const clockSamples = []; // [round trip, offset] pairs against the server clock
+        let clockOffset = 0; // Server clock minus ours (ms)
+        let clockTimer = null;
+        const latencySamples = []; // Recent per-command stage breakdowns
+        // Input-to-photon stages: [label, from, to] over the echoed trace times
+        const LATENCY_STAGES = [
+            ['controller → server', 'sentAt', 'queuedAt'],
+            ['server queue', 'queuedAt', 'deliveredAt'],
+            ['agent poll', 'deliveredAt', 'receivedAt'],
+            ['execute', 'receivedAt', 'executedAt'],
+            ['capture', 'executedAt', 'capturedAt'],
+            ['encode', 'capturedAt', 'encodedAt'],
+            ['upload', 'encodedAt', 'frameReceivedAt'],
+            ['serve', 'frameReceivedAt', 'shownAt']
+        ];
+
+        function updateStatus(message, isConnected) {
+            const statusEl = document.getElementById('status');
+            statusEl.innerHTML = message;
+            statusEl.className = 'status ' + (isConnected ? 'connected' : 'disconnected');
+            document.getElementById('disconnectBtn').disabled = !isConnected;
+        }
+
+        function connectToSession() {
+            const sessionId = document.getElementById('sessionId').value.trim().toUpperCase();
+            if (!sessionId) {
+                alert('Please enter a Session ID');
+                return;
+            }
+
+            currentSessionId = sessionId;
+            updateStatus(`🔄 Connecting to ${sessionId}...`, false);
+            openEvents(sessionId);
+
+            // Show the MJPEG stream right away, then upgrade to a WebSocket
+            startStream();
+            openSocket(sessionId);
+            updateStatus(`✅ Connected to ${sessionId}`, true);
+            
+            // Add mouse and keyboard event listeners
+            addControlListeners();
+            
+            console.log('Connected to session:', sessionId);
+            console.log('Event listeners added');
+        }
+
+        function disconnectSession() {
+            currentSessionId = null;
+            closeSocket();
+            stopStream();
+            stopScreenUpdates();
+            clearTiles();
+            closeEvents();
+            removeControlListeners();
+            updateStatus('⚠️ Disconnected', false);
+            document.getElementById('screenStatus').textContent = 'Not connected';
+        }
+
+        function startScreenUpdates() {
+            stopScreenUpdates();
+            polling = true;
+            fetchScreen();
+            
+            // With the event stream open, frames are only fetched when announced
+            if (!eventsOpen) {
+                screenUpdateInterval = setInterval(fetchScreen, 66);  // ~15 FPS (66ms) matching agent performance
+            }
+        }
+
+        function stopScreenUpdates() {
+            polling = false;
+            if (screenUpdateInterval) {
+                clearInterval(screenUpdateInterval);
+                screenUpdateInterval = null;
+            }
+        }
+
+        function fetchScreen() {
+            if (!currentSessionId) return;
+            if (screenRequestPending) {
+                screenRefetch = true;
+                return;
+            }
+            
+            // Frame message since the version on screen: 304 when unchanged,
+            // only the new tiles while the keyframe stays the same
+            screenRequestPending = true;
+            const since = shownVersion === null ? '' : `?since=${shownVersion}`;
+            fetch(`/api/screen/${currentSessionId}.frame${since}`, {cache: 'no-store'})
+                .then(response => {
+                    if (response.status !== 200) return;
+                    return response.arrayBuffer().then(applyFrameMessage);
+                })
+                .catch(error => {
+                    console.error('Screen update error:', error);
+                    document.getElementById('screenStatus').textContent = 'Screen update failed';
+                })
+                .finally(() => {
+                    screenRequestPending = false;
+                    if (screenRefetch && polling) {
+                        screenRefetch = false;
+                        fetchScreen();
+                    }
+                });
+        }
+
+        function openEvents(sessionId) {
+            // Server-Sent Events: works where WebSockets are blocked by proxies
+            if (!window.EventSource) return;
+            closeEvents();
+            
+            const source = new EventSource(`/api/events?session=${encodeURIComponent(sessionId)}`);
+            events = source;
+            
+            source.onopen = () => {
+                if (events !== source) return;
+                eventsOpen = true;
+                if (polling) startScreenUpdates();  // Switch to event-driven fetching
+            };
+            source.onerror = () => {
+                if (events !== source) return;
+                // EventSource reconnects on its own; poll on a timer meanwhile
+                eventsOpen = false;
+                if (polling && !screenUpdateInterval) {
+                    screenUpdateInterval = setInterval(fetchScreen, 66);
+                }
+            };
+            source.addEventListener('frame', (event) => {
+                const frame = JSON.parse(event.data);
+                if (polling && frame.sessionId === currentSessionId) fetchScreen();
+            });
+            source.addEventListener('session', refreshSessions);
+            source.addEventListener('resync', refreshSessions);
+        }
+
+        function closeEvents() {
+            // Only a connected tab holds an event stream open on the server
+            if (events) events.close();
+            events = null;
+            eventsOpen = false;
+        }
+
+        function startStream() {
+            stopScreenUpdates();
+            clearTiles();  // The stream carries whole frames
+            const screen = document.getElementById('screen');
+            streaming = true;
+            screen.onerror = () => {
+                if (!streaming) return;
+                // No MJPEG support on this server or network: poll instead
+                streaming = false;
+                screen.onerror = null;
+                console.log('MJPEG stream failed, falling back to polling');
+                startScreenUpdates();
+            };
+            screen.src = `/api/stream/${currentSessionId}?t=${Date.now()}`;
+            document.getElementById('screenStatus').textContent = 'Streaming';
+        }
+
+        function stopStream() {
+            if (!streaming) return;
+            streaming = false;
+            const screen = document.getElementById('screen');
+            screen.onerror = null;
+            // Pointing the image elsewhere closes the stream connection
+            screen.src = frameUrl || BLANK_IMAGE;
+        }
+
+        function openSocket(sessionId) {
+            if (!window.WebSocket) return;
+            const protocol = location.protocol === 'https:' ? 'wss:' : 'ws:';
+            const ws = new WebSocket(`${protocol}//${location.host}/ws/control/${sessionId}`);
+            ws.binaryType = 'arraybuffer';
+
+            ws.onopen = () => {
+                if (currentSessionId !== sessionId) return ws.close();
+                socket = ws;
+                stopStream();
+                stopScreenUpdates();
+                syncClock();
+                clearInterval(clockTimer);
+                clockTimer = setInterval(syncClock, 10000);
+                console.log('WebSocket connected');
+            };
+            ws.onmessage = (event) => {
+                if (typeof event.data === 'string') {
+                    const message = JSON.parse(event.data);
+                    if (message.type === 'backpressure') setBackpressure(message.backpressure);
+                    if (message.type === 'clock') {
+                        addClockSample(message.clientTime, message.serverTime, Date.now());
+                    }
+                    return;
+                }
+                applyFrameMessage(event.data);
+            };
+            ws.onclose = () => {
+                if (socket !== ws) return;
+                socket = null;
+                clearInterval(clockTimer);
+                clockTimer = null;
+                // Fall back to the MJPEG stream while the session is still open
+                if (currentSessionId === sessionId) {
+                    console.log('WebSocket closed, falling back to MJPEG stream');
+                    startStream();
+                }
+            };
+        }
+
+        function closeSocket() {
+            if (socket) {
+                const ws = socket;
+                socket = null;
+                ws.close();
+            }
+        }
+
+        function parseFrameMessage(buffer) {
+            // 4-byte header length, JSON header, then the JPEG bytes
+            const headerLength = new DataView(buffer).getUint32(0);
+            const header = new TextDecoder().decode(new Uint8Array(buffer, 4, headerLength));
+            return {meta: JSON.parse(header), payload: new Uint8Array(buffer, 4 + headerLength)};
+        }
+
+        function applyFrameMessage(buffer) {
+            // A keyframe (meta.image bytes of JPEG) and/or tiles to draw over it
+            const frame = parseFrameMessage(buffer);
+            const meta = frame.meta;
+            let offset = 0;
+            if (meta.image !== undefined) {
+                showFrame(new Blob([frame.payload.subarray(0, meta.image)], {type: 'image/jpeg'}),
+                          meta.timestamp, meta);
+                startTileLayer();
+                offset = meta.image;
+            } else if (meta.keyVersion !== shownKeyVersion || !tileLayer) {
+                shownVersion = null;  // Tiles for a keyframe we do not show: refetch it all
+                return;
+            } else {
+                frameShown(meta.timestamp, meta);
+            }
+            for (const [x, y, w, h, length] of meta.tiles || []) {
+                drawTile(frame.payload.subarray(offset, offset + length), x, y, w, h, meta.size);
+                offset += length;
+            }
+            shownVersion = meta.version;
+            shownKeyVersion = meta.keyVersion;
+        }
+
+        function startTileLayer() {
+            // Tiles of a new keyframe go on a fresh layer; the older layers
+            // stay until the keyframe image has loaded (see clearTiles)
+            tileLayer = document.createElement('div');
+            tileLayer.className = 'tile-layer';
+            document.getElementById('screenFrame').appendChild(tileLayer);
+        }
+
+        function drawTile(bytes, x, y, w, h, size) {
+            const screen = document.getElementById('screen');
+            const [width, height] = size || [screen.naturalWidth, screen.naturalHeight];
+            const tile = document.createElement('img');
+            const url = URL.createObjectURL(new Blob([bytes], {type: 'image/jpeg'}));
+            tile.onload = tile.onerror = () => URL.revokeObjectURL(url);
+            tile.src = url;
+            tile.style.left = `${100 * x / width}%`;
+            tile.style.top = `${100 * y / height}%`;
+            tile.style.width = `${100 * w / width}%`;
+            tile.style.height = `${100 * h / height}%`;
+            tileLayer.appendChild(tile);
+        }
+
+        function clearTiles(keep) {
+            // Drop every tile layer but keep (by default all of them)
+            for (const layer of document.querySelectorAll('.tile-layer')) {
+                if (layer !== keep) layer.remove();
+            }
+            if (!keep) {
+                tileLayer = null;
+                shownVersion = null;
+                shownKeyVersion = null;
+            }
+        }
+
+        function showFrame(blob, timestamp, meta) {
+            const url = URL.createObjectURL(blob);
+            document.getElementById('screen').src = url;
+            if (frameUrl) URL.revokeObjectURL(frameUrl);
+            frameUrl = url;
+            frameShown(timestamp, meta);
+        }
+
+        function frameShown(timestamp, meta) {
+            document.getElementById('screenStatus').textContent =
+                'Last update: ' + new Date(timestamp).toLocaleTimeString();
+            if (meta && meta.trace) recordTrace(meta.trace, meta.receivedAt, serverNow());
+        }
+
+        function syncClock() {
+            if (socket && socket.readyState === WebSocket.OPEN) {
+                socket.send(JSON.stringify({type: 'clock', clientTime: Date.now()}));
+            }
+        }
+
+        function addClockSample(sent, serverReceived, received, serverSent) {
+            // NTP-style: trust the sample with the shortest round trip
+            if (serverSent === undefined) serverSent = serverReceived;
+            clockSamples.push([(received - sent) - (serverSent - serverReceived),
+                               ((serverReceived - sent) + (serverSent - received)) / 2]);
+            if (clockSamples.length > 8) clockSamples.shift();
+            clockOffset = clockSamples.reduce((best, sample) => sample[0] < best[0] ? sample : best)[1];
+        }
+
+        function serverNow() {
+            return Date.now() + clockOffset;
+        }
+
+        function recordTrace(trace, frameReceivedAt, shownAt) {
+            // The agent echoes commands it ran before grabbing this frame
+            (trace.commands || []).forEach(command => {
+                if (!tracedCommands.delete(command.seq)) return;  // Sent by another controller
+                latencySamples.push(Object.assign({}, command, {
+                    capturedAt: trace.capturedAt,
+                    encodedAt: trace.encodedAt,
+                    frameReceivedAt: frameReceivedAt,
+                    shownAt: shownAt
+                }));
+                if (latencySamples.length > 50) latencySamples.shift();
+            });
+            renderLatency();
+        }
+
+        function median(values) {
+            const sorted = values.slice().sort((a, b) => a - b);
+            return sorted[Math.floor(sorted.length / 2)];
+        }
+
+        function renderLatency() {
+            if (latencySamples.length === 0) return;
+            const last = latencySamples[latencySamples.length - 1];
+            const rows = LATENCY_STAGES.map(([label, from, to]) => {
+                const values = latencySamples.filter(s => s[from] != null && s[to] != null)
+                    .map(s => s[to] - s[from]);
+                const latest = last[from] != null && last[to] != null ? (last[to] - last[from]).toFixed(0) : '-';
+                const typical = values.length ? median(values).toFixed(0) : '-';
+                return `<tr><td>${label}</td><td>${latest} ms</td><td>${typical} ms</td></tr>`;
+            });
+            const totals = latencySamples.map(s => s.shownAt - s.sentAt);
+            rows.push(`<tr><td><strong>input → photon</strong></td>` +
+                      `<td><strong>${(last.shownAt - last.sentAt).toFixed(0)} ms</strong></td>` +
+                      `<td><strong>${median(totals).toFixed(0)} ms</strong></td></tr>`);
+            document.getElementById('latency').innerHTML =
+                `<table><tr><td></td><td>last</td><td>median of ${latencySamples.length}</td></tr>` +
+                rows.join('') + '</table>';
+        }
+
+        function addControlListeners() {
+            const screen = document.getElementById('screen');
+            console.log('Adding event listeners to screen element:', screen);
+            
+            screen.addEventListener('click', handleMouseClick);
+            screen.addEventListener('mousemove', handleMouseMove);
+            screen.addEventListener('wheel', handleMouseWheel);
+            document.addEventListener('keydown', handleKeyDown);
+            document.addEventListener('keyup', handleKeyUp);
+            
+            console.log('Event listeners added successfully');
+        }
+
+        function removeControlListeners() {
+            const screen = document.getElementById('screen');
+            
+            screen.removeEventListener('click', handleMouseClick);
+            screen.removeEventListener('mousemove', handleMouseMove);
+            screen.removeEventListener('wheel', handleMouseWheel);
+            document.removeEventListener('keydown', handleKeyDown);
+            document.removeEventListener('keyup', handleKeyUp);
+        }
+
+        function handleMouseClick(event) {
+            if (!currentSessionId) return;
+            
+            console.log('Mouse click detected!', event);
+            
+            const rect = event.target.getBoundingClientRect();
+            
+            // Calculate more accurate coordinates
+            const x = (event.clientX - rect.left) / rect.width;
+            const y = (event.clientY - rect.top) / rect.height;
+            
+            // Ensure coordinates are within bounds
+            const clampedX = Math.max(0, Math.min(1, x));
+            const clampedY = Math.max(0, Math.min(1, y));
+            
+            console.log('Click coordinates (relative):', clampedX, clampedY);
+            console.log('Screen rect:', rect);
+            console.log('Event position:', event.clientX, event.clientY);
+            
+            const command = {
+                type: 'mouse',
+                action: 'click',
+                x: clampedX,
+                y: clampedY,
+                button: event.button === 2 ? 'right' : 'left'
+            };
+            
+            console.log('Sending command:', command);
+            sendCommand(command);
+            
+            // Prevent default action and stop propagation
+            event.preventDefault();
+            event.stopPropagation();
+        }
+
+        function handleMouseMove(event) {
+            if (!currentSessionId) return;
+            
+            const rect = event.target.getBoundingClientRect();
+            const x = (event.clientX - rect.left) / rect.width;
+            const y = (event.clientY - rect.top) / rect.height;
+            
+            // Throttle mouse movement to reduce server load, harder while the agent lags
+            const now = Date.now();
+            const interval = backpressure ? 250 : 50; // Max 20 moves per second, 4 under backpressure
+            if (now - lastMouseMove < interval) return;
+            lastMouseMove = now;
+            
+            // Ensure coordinates are within bounds
+            const clampedX = Math.max(0, Math.min(1, x));
+            const clampedY = Math.max(0, Math.min(1, y));
+            
+            sendCommand({
+                type: 'mouse',
+                action: 'move',
+                x: clampedX,
+                y: clampedY
+            });
+        }
+
+        function handleMouseWheel(event) {
+            if (!currentSessionId) return;
+            
+            event.preventDefault();
+            sendCommand({
+                type: 'mouse',
+                action: 'scroll',
+                deltaY: event.deltaY
+            });
+        }
+
+        function handleKeyDown(event) {
+            if (!currentSessionId) return;
+            if (event.target.tagName === 'INPUT') return;
+            
+            event.preventDefault();
+            sendCommand({
+                type: 'keyboard',
+                action: 'keydown',
+                key: event.key
+            });
+        }
+
+        function handleKeyUp(event) {
+            if (!currentSessionId) return;
+            if (event.target.tagName === 'INPUT') return;
+            
+            event.preventDefault();
+            sendCommand({
+                type: 'keyboard',
+                action: 'keyup',
+                key: event.key
+            });
+        }
+
+        function sendCommand(command) {
+            if (!currentSessionId) return;
+            
+            // Tag the command so the agent echoes it in the frame that shows its effect
+            command.seq = ++commandSeq;
+            command.sentAt = serverNow();
+            tracedCommands.set(command.seq, true);
+            if (tracedCommands.size > 256) tracedCommands.delete(tracedCommands.keys().next().value);
+            
+            console.log('Sending command to server:', command);
+            
+            if (socket && socket.readyState === WebSocket.OPEN) {
+                socket.send(JSON.stringify(command));
+                return;
+            }
+            
+            const sent = Date.now();
+            fetch('/api/command', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify({
+                    sessionId: currentSessionId,
+                    ...command
+                })
+            }).then(response => {
+                console.log('Command response:', response);
+                const serverTime = response.headers.get('X-Server-Time');
+                if (serverTime) {
+                    addClockSample(sent, Number(response.headers.get('X-Server-Received')),
+                                   Date.now(), Number(serverTime));
+                }
+                return response.json();
+            }).then(data => {
+                console.log('Command result:', data);
+                if ('backpressure' in data) setBackpressure(data.backpressure);
+            }).catch(error => {
+                console.error('Command send error:', error);
+            });
+        }
+
+        function setBackpressure(active) {
+            if (active !== backpressure) {
+                console.log(active ? 'Agent is falling behind, slowing input' : 'Agent caught up');
+            }
+            backpressure = active;
+        }
+
+        function refreshSessions() {
+            fetch('/api/sessions')
+                .then(response => response.json())
+                .then(sessions => {
+                    const sessionsList = document.getElementById('sessionsList');
+                    
+                    if (sessions.length === 0) {
+                        sessionsList.innerHTML = '<p>No active sessions</p>';
+                        return;
+                    }
+                    
+                    sessionsList.innerHTML = sessions.map(session => `
+                        <div class="session-item ${session.sessionId === currentSessionId ? 'active' : ''}" 
+                             onclick="document.getElementById('sessionId').value='${session.sessionId}'">
+                            <div>
+                                <strong>${session.sessionId}</strong><br>
+                                <small>${session.platform} - ${session.hasScreen ? '📺' : '📱'}</small>
+                            </div>
+                            <div>
+                                <small>${new Date(session.lastSeen * 1000).toLocaleTimeString()}</small>
+                            </div>
+                        </div>
+                    `).join('');
+                })
+                .catch(error => {
+                    console.error('Sessions refresh error:', error);
+                    document.getElementById('sessionsList').innerHTML = '<p>Failed to load sessions</p>';
+                });
+        }
+
+        // Session changes are pushed over /api/events; poll only without it
+        setInterval(() => {
+            if (!eventsOpen) refreshSessions();
+        }, 10000);
+        
+        // Initial load; the event stream opens with a session
+        refreshSessions();
+
+        // A keyframe on screen covers the tiles of the keyframes before it
+        document.getElementById('screen').addEventListener('load', () => {
+            if (tileLayer) clearTiles(tileLayer);
+        });
+
+        // Handle right-click context menu prevention on screen
+        document.getElementById('screen').addEventListener('contextmenu', function(e) {
+            e.preventDefault();
+            return false;
+        });
+    </script>
+</body>
+</html>'''
+        
+        if self.web_page is None:
+            self.web_page = self.build_web_page(RequestHandler.get_web_interface_html())
+        return RequestHandler
+
+
+class RemoteControlAgent:
+    """Remote Control Agent for University Computers"""
+    
+    def __init__(self, server_url):
+        self.server_url = server_url.rstrip('/')
+        self.session_id = None
+        self.running = False
+        self.settings = {
+            'screen_fps': 1,
+            'screen_quality': 50,
+            'screen_width': 800,
+            'screen_height': 600,
+            'command_check_interval': 0.1,
+            'command_long_poll': 20,
+            'use_websocket': True,
+            'tile_updates': True,
+            'change_detection': CHANGE_DETECTION,
+            'connection_timeout': 10,
+            'retry_delay': 2
+        }
+        self.last_screen_time = 0
+        self.ws = None  # Open WebSocket to the server, None while on HTTP
+        self.binary_upload = True  # Cleared when the server lacks POST /api/screen/<id>
+        self.tile_updates = False  # Set when the server takes partial frame updates
+        self.change_detector = None
+        if HAS_CHANGE_DETECTION:
+            self.change_detector = ChangeDetector(self.settings.get('change_detection', CHANGE_DETECTION))
+        self.frame_size = None  # Size of the last keyframe sent
+        self.frame_key = None  # Our name for the last keyframe sent
+        self.tile_area = 0  # Pixels sent as tiles since that keyframe
+        self.need_keyframe = True  # The server may not have our last frame
+
+        # Persistent HTTP connections, one per thread (see http_request)
+        parsed = urllib.parse.urlsplit(self.server_url)
+        self.http_connection_class = (http.client.HTTPSConnection if parsed.scheme == 'https'
+                                      else http.client.HTTPConnection)
+        self.http_host = parsed.netloc
+        self.http_base_path = parsed.path
+        self.http_proxied = (parsed.scheme in urllib.request.getproxies()
+                             and not urllib.request.proxy_bypass(parsed.hostname or ''))
+        self.http_local = threading.local()
+        self.throttled_until = 0  # Server asked us to hold frames back until then
+        self.clock = ClockOffset()  # Our clock against the server's, for latency traces
+        self.next_clock_sync = 0
+        self.traces = deque(maxlen=MAX_FRAME_TRACES)  # Executed commands awaiting a frame
+        self.trace_lock = threading.Lock()
+
+    def start(self):
+        """Start the remote control agent"""
+        print("🤖 University Remote Control Agent Starting...")
+        print(f"📡 Server: {self.server_url}")
+        print(f"🔧 PIL Available: {HAS_PIL}")
+        print(f"🔧 Input Control: {HAS_PYNPUT}")
+        print(f"🔧 Change Detection: {HAS_CHANGE_DETECTION}")
+        
+        if not self.register():
+            print("❌ Failed to register with server")
+            return
+        
+        print()
+        print("=" * 60)
+        print(f"✅ Agent Active! Session ID: {self.session_id}")
+        print("📋 COPY THIS SESSION ID TO YOUR CONTROLLER!")
+        print(f"🌐 Controller URL: {self.server_url}")
+        print("=" * 60)
+        print()
+        print("🔄 Agent is running... Press Ctrl+C to stop")
+        
+        self.running = True
+        
+        # Start background threads for screen capture and command processing
+        if self.settings.get('use_websocket', True):
+            ws_thread = threading.Thread(target=self.websocket_loop, daemon=True)
+            ws_thread.start()
+        
+        if HAS_PIL:
+            screen_thread = threading.Thread(target=self.screen_capture_loop, daemon=True)
+            screen_thread.start()
+        
+        if HAS_PYNPUT:
+            command_thread = threading.Thread(target=self.command_loop, daemon=True)
+            command_thread.start()
+        
+        try:
+            while self.running:
+                time.sleep(1)
+                self.heartbeat()
+        except KeyboardInterrupt:
+            print("\n🛑 Agent stopped by user")
+            self.running = False
+            self.unregister()
+
+    def heartbeat(self):
+        """Resample the clock offset over the WebSocket every CLOCK_SYNC_INTERVAL"""
+        ws = self.ws
+        if ws is None or time.time() < self.next_clock_sync:
+            return  # Over HTTP every command poll is a sample
+        self.next_clock_sync = time.time() + CLOCK_SYNC_INTERVAL
+        try:
+            ws.send_text(json.dumps({'type': 'clock', 'clientTime': time.time() * 1000}))
+        except (WebSocketClosed, OSError):
+            pass
+
+    def unregister(self):
+        """Tell the server this session is over (best effort)"""
+        try:
+            self.http_post('/api/unregister', {'sessionId': self.session_id})
+        except Exception:
+            pass
+
+    def register(self):
+        """Register agent with server and get session ID"""
+        data = {
+            'platform': sys.platform,
+            'python_version': sys.version.split()[0],
+            'has_pil': HAS_PIL,
+            'has_pynput': HAS_PYNPUT,
+            'timestamp': datetime.now().isoformat(),
+            'agent_type': 'university'
+        }
+        
+        try:
+            print("📝 Registering with server...")
+            sent = time.time() * 1000
+            response = self.http_post('/api/register', data)
+            if response and 'sessionId' in response:
+                self.session_id = response['sessionId']
+                if 'serverTime' in response:
+                    self.clock.add(sent, response['serverTime'], time.time() * 1000)
+                self.tile_updates = (HAS_CHANGE_DETECTION and 'tiles' in response.get('features', [])
+                                     and self.settings.get('tile_updates', True))
+                print("✅ Server registration successful")
+                return True
+        except Exception as e:
+            print(f"⚠️ Server registration failed: {e}")
+        
+        # Fallback - generate local session ID
+        try:
+            self.session_id = secrets.token_hex(4).upper()
+            print("⚠️ Using local session ID (server unavailable)")
+            return True
+        except:
+            import random
+            self.session_id = f"{random.randint(1000, 9999):04d}"
+            print("⚠️ Using random session ID (crypto unavailable)")
+            return True
+
+    def screen_capture_loop(self):
+        """Continuously capture and send screen updates"""
+        fps_delay = 1.0 / self.settings.get('screen_fps', 1)
+        
+        while self.running:
+            try:
+                current_time = time.time()
+                if current_time < self.throttled_until:
+                    time.sleep(0.1)  # Over the server's rate limit
+                    continue
+                if current_time - self.last_screen_time >= fps_delay:
+                    # Commands run before the grab are echoed in this frame
+                    traces = self.take_traces()
+                    timings = {}
+                    screen_data = self.capture_screen(timings)
+                    trace = dict(timings, commands=traces) if traces else None
+                    if isinstance(screen_data, list):
+                        sent = not screen_data or self.send_tiles(screen_data, trace)
+                    else:
+                        sent = not screen_data or self.send_screen(screen_data, trace)
+                    if not sent:
+                        # The server missed a frame the next tiles would build on
+                        self.need_keyframe = True
+                    self.last_screen_time = current_time
+                time.sleep(0.1)
+            except Exception as e:
+                print(f"Screen capture error: {e}")
+                time.sleep(self.settings.get('retry_delay', 2))
+
+    def command_loop(self):
+        """Continuously check for and execute remote commands"""
+        check_interval = self.settings.get('command_check_interval', 0.1)
+        long_poll = self.settings.get('command_long_poll', 20)
+        failures = 0  # Polls failed in a row
+        
+        while self.running:
+            try:
+                if self.ws is not None:
+                    # Commands are pushed over the WebSocket
+                    time.sleep(0.5)
+                    continue
+                started = time.time()
+                try:
+                    commands = self.get_commands(long_poll)
+                except Exception as e:
+                    failures += 1
+                    delay = self.poll_backoff(e, failures)
+                    print(f"Command poll failed ({e}), retrying in {delay:.1f}s")
+                    time.sleep(delay)
+                    continue
+                failures = 0
+                self.run_commands(commands)
+                # An empty answer that came back straight away means long
+                # polling is off or the server does not support it
+                if not commands and (not long_poll or time.time() - started < long_poll / 2):
+                    time.sleep(check_interval)
+            except Exception as e:
+                print(f"Command loop error: {e}")
+                time.sleep(self.settings.get('retry_delay', 2))
+
+    def websocket_loop(self):
+        """Keep a WebSocket open for frames and commands, reconnecting with backoff"""
+        url = f"{self.server_url}/ws/agent/{self.session_id}"
+        retry_delay = self.settings.get('retry_delay', 2)
+        backoff = retry_delay
+        
+        while self.running:
+            try:
+                ws = WebSocket.connect(url, timeout=self.settings.get('connection_timeout', 10))
+            except Exception:
+                # Server without WebSocket support or blocked by a proxy: stay on HTTP
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 60)
+                continue
+            
+            backoff = retry_delay
+            self.ws = ws
+            self.next_clock_sync = 0
+            print("🔌 WebSocket connected")
+            try:
+                while self.running:
+                    opcode, payload = ws.recv()
+                    if opcode != WebSocket.OP_TEXT:
+                        continue
+                    message = parse_json_object(payload)
+                    if message.get('type') == 'commands':
+                        self.run_commands(message.get('commands', []))
+                    elif message.get('type') == 'throttle':
+                        # The frame was dropped, so tiles have nothing to build on
+                        self.throttled_until = time.time() + message.get('retryAfter', 1)
+                        self.need_keyframe = True
+                    elif message.get('type') == 'keyframe':
+                        self.need_keyframe = True
+                    elif message.get('type') == 'clock' and message.get('clientTime'):
+                        self.clock.add(message['clientTime'], message['serverTime'], time.time() * 1000)
+            except (WebSocketClosed, OSError, ValueError, TypeError, AttributeError):
+                pass
+            finally:
+                self.ws = None
+                ws.close()
+            print("🔌 WebSocket closed, using HTTP")
+            time.sleep(retry_delay)
+
+    def capture_screen(self, timings=None):
+        """Capture screen using PIL; fills timings with capturedAt/encodedAt
+
+        Returns a JPEG keyframe, or with tile updates on a list of changed
+        (x, y, w, h, jpeg) tiles; None when nothing changed.
+        """
+        if not HAS_PIL:
+            return None
+        timings = {} if timings is None else timings
+            
+        try:
+            screenshot = ImageGrab.grab()
+            timings['capturedAt'] = self.clock.server_time()
+            
+            # Find what changed on the raw capture, before the resize
+            changed = self.change_detector.update(screenshot) if self.change_detector else None
+            if changed == [] and not self.need_keyframe:
+                return None  # No change, skip this frame
+            
+            # Resize for performance
+            width = self.settings.get('screen_width', 800)
+            height = self.settings.get('screen_height', 600)
+            quality = self.settings.get('screen_quality', 50)
+            
+            rects = self.changed_tiles(changed, screenshot.size, (width, height))
+            if rects is not None:
+                # Resize only the changed tiles; a box keeps them identical
+                # to the same region of a whole resized frame
+                scale_x, scale_y = screenshot.width / width, screenshot.height / height
+                tiles = [(x, y, w, h, self.encode_jpeg(screenshot.resize(
+                             (w, h), box=(x * scale_x, y * scale_y,
+                                          (x + w) * scale_x, (y + h) * scale_y)), quality))
+                         for x, y, w, h in rects]
+                timings['encodedAt'] = self.clock.server_time()
+                return tiles
+            
+            # Convert to JPEG
+            screenshot = screenshot.resize((width, height))
+            image = self.encode_jpeg(screenshot, quality)
+            timings['encodedAt'] = self.clock.server_time()
+            self.frame_key = secrets.token_hex(8)
+            self.frame_size = (width, height)
+            self.tile_area = 0
+            self.need_keyframe = False
+            return image
+        except Exception as e:
+            print(f"Screen capture error: {e}")
+            return None
+
+    def changed_tiles(self, changed, source, size):
+        """Tiles of the resized frame to send, or None when a keyframe is due
+
+        changed are the rectangles that changed in the capture of the given
+        source size. A keyframe is due without tile support, when the server
+        may lack our last frame, when the frame size changed, when over
+        TILE_FULL_FRAME_RATIO of the screen changed, or once the tiles since
+        the last keyframe add up to a whole screen, so a viewer joining late
+        never downloads more than about two frames.
+        """
+        if not self.tile_updates or changed is None or self.need_keyframe or size != self.frame_size:
+            return None
+        rects = scale_tiles(changed, source, size)
+        width, height = size
+        area = sum(w * h for _, _, w, h in rects)
+        if area > TILE_FULL_FRAME_RATIO * width * height or self.tile_area + area > width * height:
+            return None
+        self.tile_area += area
+        return rects
+
+    def encode_jpeg(self, image, quality):
+        """JPEG bytes of a PIL image"""
+        buffer = io.BytesIO()
+        image.save(buffer, format='JPEG', quality=quality)
+        return buffer.getvalue()
+
+    def send_screen(self, screen_data, trace=None):
+        """Send a JPEG keyframe to the server, over the WebSocket when open; False if it failed"""
+        timestamp = int(time.time() * 1000)
+        meta = {'timestamp': timestamp, 'key': self.frame_key}
+        if trace:
+            meta['trace'] = trace
+        ws = self.ws
+        if ws is not None:
+            try:
+                ws.send(pack_frame_message(meta, screen_data))
+                return True
+            except (WebSocketClosed, OSError):
+                self.ws = None
+        
+        if self.binary_upload:
+            headers = {'X-Frame-Timestamp': str(timestamp)}
+            if self.frame_key:
+                headers['X-Frame-Key'] = self.frame_key
+            if trace:
+                headers['X-Frame-Trace'] = json.dumps(trace)
+            try:
+                self.http_post_bytes(f'/api/screen/{self.session_id}', screen_data,
+                                     'image/jpeg', headers)
+                return True
+            except urllib.error.HTTPError as e:
+                if e.code == 429:
+                    self.throttled_until = time.time() + float(e.headers.get('Retry-After') or 1)
+                if e.code != 404:
+                    return False
+                # Older server: fall back to base64 JSON uploads
+                self.binary_upload = False
+            except Exception:
+                return False
+        
+        data = dict(meta, sessionId=self.session_id, data=base64.b64encode(screen_data).decode())
+        
+        try:
+            self.http_post('/api/screen', data)
+            return True
+        except Exception as e:
+            # Don't spam console with screen upload errors
+            return False
+
+    def send_tiles(self, tiles, trace=None):
+        """Send changed tiles of the last keyframe, over the WebSocket when open; False if it failed"""
+        meta = {'timestamp': int(time.time() * 1000), 'key': self.frame_key,
+                'size': list(self.frame_size)}
+        if trace:
+            meta['trace'] = trace
+        message = pack_tiles(meta, tiles)
+        ws = self.ws
+        if ws is not None:
+            try:
+                ws.send(message)
+                return True
+            except (WebSocketClosed, OSError):
+                self.ws = None
+        
+        try:
+            self.http_post_bytes(f'/api/screen/{self.session_id}', message, TILES_CONTENT_TYPE)
+            return True
+        except urllib.error.HTTPError as e:
+            if e.code == 429:
+                self.throttled_until = time.time() + float(e.headers.get('Retry-After') or 1)
+            return False  # 409: the server wants a new keyframe
+        except Exception:
+            return False
+
+    def poll_backoff(self, error, failures):
+        """Seconds to wait after the given number of failed command polls in a row
+
+        A 429 or 503 names its wait in Retry-After; other failures back off
+        exponentially from retry_delay up to a minute. Up to half as much
+        again is added at random, so a fleet of agents does not come back
+        at the same moment.
+        """
+        delay = None
+        if isinstance(error, urllib.error.HTTPError) and error.headers is not None:
+            try:
+                delay = float(error.headers.get('Retry-After'))
+            except (TypeError, ValueError):
+                pass
+        if delay is None:
+            delay = min(self.settings.get('retry_delay', 2) * 2 ** (failures - 1), 60)
+        return delay * random.uniform(1, 1.5)
+
+    def get_commands(self, wait=0):
+        """Get pending commands from server, long-polling for up to wait seconds
+
+        A failed poll raises, urllib.error.HTTPError for an error status, so
+        the caller can back off instead of polling again straight away.
+        """
+        if wait:
+            timeout = wait + self.settings.get('connection_timeout', 10)
+            response = self.http_get(f'/api/commands/{self.session_id}?wait={wait}', timeout)
+        else:
+            response = self.http_get(f'/api/commands/{self.session_id}')
+        return response if isinstance(response, list) else []
+
+    def run_commands(self, commands):
+        """Execute commands, keeping traced ones for the next captured frame"""
+        received = self.clock.server_time()
+        for command in commands:
+            self.execute_command(command)
+            if command.get('seq') is None:
+                continue
+            with self.trace_lock:
+                self.traces.append({
+                    'seq': command['seq'],
+                    'sentAt': command.get('sentAt'),
+                    'queuedAt': command.get('timestamp'),
+                    'deliveredAt': command.get('deliveredAt'),
+                    'receivedAt': received,
+                    'executedAt': self.clock.server_time()
+                })
+
+    def take_traces(self):
+        """Remove and return the traces waiting for a frame"""
+        with self.trace_lock:
+            traces = list(self.traces)
+            self.traces.clear()
+        return traces
+
+    def execute_command(self, command):
+        """Execute a remote command"""
+        if not HAS_PYNPUT:
+            return
+            
+        try:
+            cmd_type = command.get('type')
+            
+            if cmd_type == 'mouse':
+                self.handle_mouse_command(command)
+            elif cmd_type == 'keyboard':
+                self.handle_keyboard_command(command)
+            elif cmd_type == 'special':
+                self.handle_special_command(command)
+        except Exception as e:
+            print(f"Command execution error: {e}")
+
+    def handle_mouse_command(self, command):
+        """Handle mouse commands using pynput"""
+        try:
+            x = int(command.get('x', 0) * 1920)  # Scale to screen
+            y = int(command.get('y', 0) * 1080)
+            
+            mouse_controller = mouse.Controller()
+            
+            action = command.get('action')
+            if action == 'move':
+                mouse_controller.position = (x, y)
+            elif action == 'click':
+                mouse_controller.position = (x, y)
+                button = mouse.Button.right if command.get('button') == 'right' else mouse.Button.left
+                mouse_controller.click(button)
+            elif action == 'scroll':
+                dy = command.get('deltaY', 0)
+                mouse_controller.scroll(0, -dy // 120)  # Convert to scroll units
+        except Exception as e:
+            print(f"Mouse command error: {e}")
+
+    def handle_keyboard_command(self, command):
+        """Handle keyboard commands using pynput"""
+        try:
+            key_controller = keyboard.Controller()
+            key = command.get('key', '')
+            
+            # Map special keys
+            key_map = {
+                'Enter': keyboard.Key.enter,
+                'Escape': keyboard.Key.esc,
+                'Backspace': keyboard.Key.backspace,
+                'Tab': keyboard.Key.tab,
+                'ArrowUp': keyboard.Key.up,
+                'ArrowDown': keyboard.Key.down,
+                'ArrowLeft': keyboard.Key.left,
+                'ArrowRight': keyboard.Key.right,
+                'Delete': keyboard.Key.delete,
+                'Home': keyboard.Key.home,
+                'End': keyboard.Key.end,
+                'PageUp': keyboard.Key.page_up,
+                'PageDown': keyboard.Key.page_down,
+            }
+            
+            if command.get('action') == 'keydown':
+                if key in key_map:
+                    key_controller.press(key_map[key])
+                elif len(key) == 1:
+                    key_controller.press(key)
+            elif command.get('action') == 'keyup':
+                if key in key_map:
+                    key_controller.release(key_map[key])
+                elif len(key) == 1:
+                    key_controller.release(key)
+            elif command.get('action') == 'type':
+                key_controller.type(key)
+        except Exception as e:
+            print(f"Keyboard command error: {e}")
+
+    def handle_special_command(self, command):
+        """Handle special system commands"""
+        action = command.get('action')
+        if action == 'ctrl-alt-del':
+            print("⚠️ Ctrl+Alt+Del requested (not implemented for security)")
+        elif action == 'alt-tab':
+            try:
+                key_controller = keyboard.Controller()
+                key_controller.press(keyboard.Key.alt)
+                key_controller.press(keyboard.Key.tab)
+                key_controller.release(keyboard.Key.tab)
+                key_controller.release(keyboard.Key.alt)
+            except:
+                pass
+        else:
+            print(f"Special command: {action}")
+
+    def http_request(self, method, path, body=None, headers=None, timeout=None):
+        """Send one request and return (headers, body), reusing this thread's connection
+
+        urllib opens a new TCP (and TLS) connection for every request; a
+        persistent http.client connection per thread saves that on every
+        frame upload and command poll. A reused connection the server has
+        since closed is retried once on a fresh one. Behind a proxy urllib
+        is kept, since it knows the proxy settings. HTTP errors raise
+        urllib.error.HTTPError either way.
+        """
+        timeout = timeout or self.settings.get('connection_timeout', 10)
+        url = f"{self.server_url}{path}"
+        if self.http_proxied:
+            req = urllib.request.Request(url, data=body, headers=headers or {}, method=method)
+            with urllib.request.urlopen(req, timeout=timeout) as response:
+                return response.headers, response.read()
+        
+        while True:
+            conn = getattr(self.http_local, 'conn', None)
+            reused = conn is not None
+            if conn is None:
+                conn = self.http_connection_class(self.http_host, timeout=timeout)
+                self.http_local.conn = conn
+            try:
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                conn.request(method, self.http_base_path + path, body=body, headers=headers or {})
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                self.http_local.conn = None
+                if reused and isinstance(e, (ConnectionError, http.client.BadStatusLine)):
+                    continue  # The server closed the idle connection
+                raise
+            if response.will_close:
+                conn.close()
+                self.http_local.conn = None
+            if response.status >= 400:
+                raise urllib.error.HTTPError(url, response.status, response.reason, response.headers, None)
+            return response.headers, data
+
+    def http_get(self, path, timeout=None):
+        """Make HTTP GET request"""
+        try:
+            sent = time.time() * 1000
+            headers, body = self.http_request('GET', path, timeout=timeout)
+            # Command polls carry the server's clock: each one is an offset sample
+            served = headers.get('X-Server-Time')
+            if served:
+                self.clock.add(sent, float(headers.get('X-Server-Received', served)),
+                               time.time() * 1000, float(served))
+            return json.loads(body.decode())
+        except urllib.error.HTTPError:
+            raise  # Callers look at the status and Retry-After
+        except Exception as e:
+            raise Exception(f"GET {path} failed: {e}")
+
+    def http_post_bytes(self, path, body, content_type, headers=None):
+        """POST a raw body; HTTP errors propagate so callers can check the status"""
+        _, data = self.http_request('POST', path, body,
+                                    {'Content-Type': content_type, **(headers or {})})
+        return json.loads(data.decode())
+
+    def http_post(self, path, data):
+        """Make HTTP POST request"""
+        try:
+            _, body = self.http_request('POST', path, json.dumps(data).encode(),
+                                        {'Content-Type': 'application/json'})
+            return json.loads(body.decode())
+        except Exception as e:
+            raise Exception(f"POST {path} failed: {e}")
+
+
+def serve_worker(port, config):
+    """Run one pre-fork worker process until it is interrupted"""
+    server = RemoteControlServer(port, config=config)
+    with server.create_httpd(reuse_port=True) as httpd:
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.shutdown()
+
+
+def run_workers(port, workers, config):
+    """Pre-fork mode: N server processes accepting on one port
+
+    Each worker is a full pooled server bound with SO_REUSEPORT, so the
+    kernel spreads connections across them and request handling is no
+    longer limited to one core by the GIL. The workers share sessions,
+    commands and frames through the SQLite store. Dead workers are
+    restarted. Without SO_REUSEPORT (Windows) this runs a single process.
+    """
+    if not hasattr(socket, 'SO_REUSEPORT'):
+        print("⚠️  SO_REUSEPORT is not available here, running a single server process")
+        RemoteControlServer(port, config=config).start()
+        return
+    
+    import multiprocessing
+    import signal
+    config = dict(config, session_store='sqlite')
+    # Create the database before the workers race to do it
+    create_session_store(config)
+    
+    def start_worker():
+        process = multiprocessing.Process(target=serve_worker, args=(port, config), daemon=True)
+        process.start()
+        return process
+    
+    processes = [start_worker() for _ in range(workers)]
+    # Platforms like Railway stop the server with SIGTERM; take the workers down too
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    print(f"🌐 Remote Control Server started on port {port} with {workers} worker processes")
+    print(f"🗄️  Shared session store: {config.get('session_db', DEFAULT_SESSION_DB)}")
+    print("Press Ctrl+C to stop")
+    try:
+        while True:
+            time.sleep(1)
+            for i, process in enumerate(processes):
+                if not process.is_alive():
+                    print(f"⚠️  Worker {process.pid} exited ({process.exitcode}), restarting")
+                    processes[i] = start_worker()
+    except KeyboardInterrupt:
+        print("\n🛑 Server stopped")
+    finally:
+        for process in processes:
+            process.terminate()
+        for process in processes:
+            process.join(timeout=5)
+
+
+def synthetic_jpeg(size):
+    """A JPEG-framed blob of about size bytes for load testing
+
+    SOI, a JFIF header, random scan data and EOI: the server never decodes
+    frames, so this is byte-for-byte the same work as a real capture.
+    """
+    header = b'\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00'
+    body = os.urandom(max(0, size - len(header) - 2)).replace(b'\xff', b'\x00')
+    return header + body + b'\xff\xd9'
+
+
+def percentile(values, pct):
+    """Return the pct-th percentile of a sorted list of numbers"""
+    if not values:
+        return 0.0
+    return values[min(len(values) - 1, int(round(pct / 100.0 * (len(values) - 1))))]
+
+
+class LoadStats:
+    """Per-route latencies and error counts gathered by the load generator"""
+
+    def __init__(self):
+        self.routes = {}
+        self.lock = threading.Lock()
+
+    def record(self, route, seconds, ok):
+        """Count one request; latencies are kept for successful requests"""
+        with self.lock:
+            latencies, errors = self.routes.setdefault(route, ([], [0]))
+            if ok:
+                latencies.append(seconds)
+            else:
+                errors[0] += 1
+
+    def merge(self, routes):
+        """Add the routes of another process's LoadStats"""
+        for route, (latencies, errors) in routes.items():
+            mine = self.routes.setdefault(route, ([], [0]))
+            mine[0].extend(latencies)
+            mine[1][0] += errors[0]
+
+
+class LoadClient:
+    """One persistent HTTP/1.1 connection that records every request in LoadStats"""
+
+    def __init__(self, host, port, stats, timeout=60):
+        self.host = host
+        self.port = port
+        self.stats = stats
+        self.timeout = timeout
+        self.conn = None
+
+    def request(self, method, path, body=None, headers=None):
+        """Issue one request; returns (status, headers, body) or None on a connection error"""
+        route = f'{method} {route_name(path)}'
+        started = time.perf_counter()
+        try:
+            if self.conn is None:
+                self.conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+            self.conn.request(method, path, body=body, headers=headers or {})
+            response = self.conn.getresponse()
+            data = response.read()
+            if response.will_close:
+                self.close()
+        except (OSError, http.client.HTTPException):
+            self.stats.record(route, time.perf_counter() - started, False)
+            self.close()
+            return None
+        self.stats.record(route, time.perf_counter() - started, response.status < 400)
+        return response.status, response.headers, data
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+def paced(rate, deadline):
+    """Yield rate times per second until the deadline, without bursting to catch up"""
+    interval = 1.0 / rate
+    next_at = time.time()
+    while True:
+        now = time.time()
+        if now >= deadline:
+            return
+        if next_at > now:
+            time.sleep(min(next_at, deadline) - now)
+            if next_at >= deadline:
+                return
+        elif next_at < now - interval:
+            # Fell behind: the server is saturated, so skip the missed slots
+            next_at = now
+        yield
+        next_at += interval
+
+
+def loadtest_agent(host, port, args, deadline, stats):
+    """Simulated agent: register, upload frames at args.fps and long-poll commands"""
+    client = LoadClient(host, port, stats)
+    result = client.request('POST', '/api/register',
+                            json.dumps({'platform': 'loadtest', 'hostname': 'loadtest'}),
+                            {'Content-Type': 'application/json'})
+    if result is None or result[0] != 200:
+        return
+    session_id = json.loads(result[2])['sessionId']
+    
+    def poll_commands():
+        poller = LoadClient(host, port, stats, timeout=args.poll_wait + 30)
+        while time.time() < deadline:
+            wait = max(0, min(args.poll_wait, deadline - time.time()))
+            if poller.request('GET', f'/api/commands/{session_id}?wait={wait:.1f}') is None:
+                time.sleep(0.5)
+        poller.close()
+    
+    poller = threading.Thread(target=poll_commands, daemon=True)
+    poller.start()
+    # A few distinct frames so consecutive uploads differ like a changing screen
+    frames = [synthetic_jpeg(args.frame_kb * 1024) for _ in range(4)]
+    headers = {'Content-Type': 'image/jpeg'}
+    for i, _ in enumerate(paced(args.fps, deadline)):
+        client.request('POST', f'/api/screen/{session_id}', frames[i % len(frames)], headers)
+    client.close()
+    poller.join()
+
+
+def loadtest_controller(host, port, index, args, deadline, stats):
+    """Simulated controller: poll one session's frame updates and post input events"""
+    client = LoadClient(host, port, stats)
+    session_id = None
+    while session_id is None and time.time() < deadline:
+        result = client.request('GET', '/api/sessions')
+        sessions = []
+        if result is not None and result[0] == 200:
+            sessions = [s['sessionId'] for s in json.loads(result[2])
+                        if s.get('platform') == 'loadtest' and s.get('hasScreen')]
+        if sessions:
+            session_id = sorted(sessions)[index % len(sessions)]
+        else:
+            time.sleep(0.2)
+    if session_id is None:
+        return
+    
+    def send_input():
+        sender = LoadClient(host, port, stats)
+        headers = {'Content-Type': 'application/json'}
+        for seq, _ in enumerate(paced(args.input_rate, deadline)):
+            command = {'sessionId': session_id, 'type': 'mouse', 'action': 'move',
+                       'x': (seq % 100) / 100, 'y': 0.5, 'seq': seq,
+                       'sentAt': time.time() * 1000}
+            sender.request('POST', '/api/command', json.dumps(command), headers)
+        sender.close()
+    
+    sender = threading.Thread(target=send_input, daemon=True)
+    if args.input_rate > 0:
+        sender.start()
+    shown = None
+    for _ in paced(args.poll_fps, deadline):
+        since = '' if shown is None else f'?since={shown}'
+        result = client.request('GET', f'/api/screen/{session_id}.frame{since}')
+        if result is not None and result[0] == 200:
+            shown = unpack_frame_message(result[2])[0]['version']
+    client.close()
+    if args.input_rate > 0:
+        sender.join()
+
+
+def loadtest_process(host, port, agents, controllers, args, deadline, results):
+    """Run a share of the simulated fleet as threads and report its LoadStats"""
+    stats = LoadStats()
+    threads = [threading.Thread(target=loadtest_agent, args=(host, port, args, deadline, stats))
+               for _ in range(agents)]
+    threads += [threading.Thread(target=loadtest_controller,
+                                 args=(host, port, index, args, deadline, stats))
+                for index in controllers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    results.put(stats.routes)
+
+
+def start_loadtest_server(port, workers, directory):
+    """Start `remote_control.py server` in a child process and wait until it answers"""
+    import subprocess
+    command = [sys.executable, os.path.abspath(__file__), 'server', str(port)]
+    if workers > 1:
+        command += ['--workers', str(workers)]
+    process = subprocess.Popen(command, cwd=directory,
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+            conn.request('GET', '/api/sessions')
+            conn.getresponse().read()
+            conn.close()
+            return process
+        except OSError:
+            if process.poll() is not None:
+                break
+            time.sleep(0.1)
+    process.terminate()
+    raise RuntimeError('load test server did not start')
+
+
+def print_load_report(stats, duration):
+    """Throughput, error rate and latency percentiles per route"""
+    print(f"{'route':<30} {'requests':>9} {'req/s':>8} {'errors':>7} {'err %':>6} "
+          f"{'p50 ms':>8} {'p90 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    report = {}
+    total_requests = total_errors = 0
+    for route in sorted(stats.routes, key=lambda r: r.split(' ', 1)[::-1]):
+        latencies, errors = stats.routes[route]
+        latencies.sort()
+        requests = len(latencies) + errors[0]
+        total_requests += requests
+        total_errors += errors[0]
+        row = {
+            'requests': requests,
+            'rps': requests / duration,
+            'errors': errors[0],
+            'error_rate': errors[0] / requests if requests else 0.0,
+            'p50_ms': percentile(latencies, 50) * 1000,
+            'p90_ms': percentile(latencies, 90) * 1000,
+            'p99_ms': percentile(latencies, 99) * 1000,
+            'max_ms': (latencies[-1] if latencies else 0.0) * 1000,
+        }
+        report[route] = row
+        print(f"{route:<30} {row['requests']:>9} {row['rps']:>8.1f} {row['errors']:>7} "
+              f"{row['error_rate'] * 100:>6.2f} {row['p50_ms']:>8.1f} {row['p90_ms']:>8.1f} "
+              f"{row['p99_ms']:>8.1f} {row['max_ms']:>8.1f}")
+    error_rate = total_errors / total_requests if total_requests else 0.0
+    print(f"{'total':<30} {total_requests:>9} {total_requests / duration:>8.1f} "
+          f"{total_errors:>7} {error_rate * 100:>6.2f}")
+    return report
+
+
+def run_loadtest(argv):
+    """Load test mode: a synthetic fleet of agents and controllers against a server
+
+    Agents register, upload synthetic JPEG frames at --fps and long-poll
+    their commands; controllers poll one session's frame updates at
+    --poll-fps and post mouse moves at --input-rate. Every simulated client
+    keeps a persistent connection, like the real agent and browser. By
+    default the server is this file's `server` mode started in a child
+    process on a free local port, so its CPU time is measured on its own;
+    --url targets a server that is already running instead (for example an
+    older checkout). Nothing leaves the machine.
+    """
+    import argparse
+    import multiprocessing
+    import tempfile
+    try:
+        import resource
+    except ImportError:
+        resource = None  # Windows: no server CPU figure
+    
+    parser = argparse.ArgumentParser(prog='remote_control.py loadtest',
+                                     description='Load test a Remote Control server with a synthetic fleet')
+    parser.add_argument('--agents', type=int, default=10, help='simulated agents (default 10)')
+    parser.add_argument('--controllers', type=int, default=20, help='simulated controllers (default 20)')
+    parser.add_argument('--duration', type=float, default=30, help='seconds to run (default 30)')
+    parser.add_argument('--fps', type=float, default=5, help='frames per second per agent (default 5)')
+    parser.add_argument('--frame-kb', type=int, default=50, help='synthetic frame size in KB (default 50)')
+    parser.add_argument('--poll-fps', type=float, default=10,
+                        help='frame polls per second per controller (default 10)')
+    parser.add_argument('--input-rate', type=float, default=10,
+                        help='input events per second per controller (default 10)')
+    parser.add_argument('--poll-wait', type=float, default=20,
+                        help='agent command long-poll wait in seconds (default 20)')
+    parser.add_argument('--workers', type=int, default=1, help='server worker processes (default 1)')
+    parser.add_argument('--procs', type=int, default=1,
+                        help='load generator processes the fleet is split across (default 1)')
+    parser.add_argument('--url', help='load an already running server instead of starting one')
+    parser.add_argument('--json', help='also write the report to this JSON file')
+    args = parser.parse_args(argv)
+    
+    print(f"🧪 Load test: {args.agents} agents at {args.fps:g} fps ({args.frame_kb} KB frames), "
+          f"{args.controllers} controllers at {args.poll_fps:g} polls/s and {args.input_rate:g} inputs/s, "
+          f"{args.duration:g}s")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        process = None
+        if args.url:
+            target = urlparse(args.url)
+            host, port = target.hostname, target.port or 80
+        else:
+            with socket.socket() as sock:
+                sock.bind(('127.0.0.1', 0))
+                port = sock.getsockname()[1]
+            host = '127.0.0.1'
+            process = start_loadtest_server(port, args.workers, directory)
+            print(f"🌐 Server on port {port} with {args.workers} worker process(es)")
+        
+        try:
+            procs = max(1, args.procs)
+            results = multiprocessing.Queue()
+            deadline = time.time() + args.duration
+            clients = []
+            for n in range(procs):
+                agents = args.agents // procs + (1 if n < args.agents % procs else 0)
+                controllers = list(range(n, args.controllers, procs))
+                clients.append(multiprocessing.Process(
+                    target=loadtest_process,
+                    args=(host, port, agents, controllers, args, deadline, results)))
+            for client in clients:
+                client.start()
+            stats = LoadStats()
+            for _ in clients:
+                stats.merge(results.get())
+            for client in clients:
+                client.join()
+            # The load generators are reaped now, so from here on the
+            # children's CPU time grows only by the server's
+            if resource is not None:
+                cpu_before = resource.getrusage(resource.RUSAGE_CHILDREN)
+        finally:
+            if process is not None:
+                process.terminate()
+                process.wait(timeout=30)
+    
+    print()
+    report = {'config': vars(args), 'routes': print_load_report(stats, args.duration)}
+    if process is not None and resource is not None:
+        cpu_after = resource.getrusage(resource.RUSAGE_CHILDREN)
+        cpu = (cpu_after.ru_utime + cpu_after.ru_stime) - (cpu_before.ru_utime + cpu_before.ru_stime)
+        report['server_cpu_seconds'] = cpu
+        print(f"🖥️  Server CPU: {cpu:.1f}s ({cpu / args.duration * 100:.0f}% of one core)")
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"📝 Report written to {args.json}")
+
+
+def main():
+    """Main entry point"""
+    if len(sys.argv) < 2:
+        print("University Remote Control System")
+        print("Usage:")
+        print("  python remote_control.py server [PORT] [--workers N]  # Start server")
+        print("  python remote_control.py agent SERVER_URL             # Start agent")
+        print("  python remote_control.py loadtest [--agents N] [--controllers M] ...  # Load test a local server")
+        sys.exit(1)
+    
+    mode = sys.argv[1].lower()
+    
+    if mode == 'server':
+        # Start server mode
+        args = sys.argv[2:]
+        workers = 1
+        if '--workers' in args:
+            index = args.index('--workers')
+            workers = int(args[index + 1])
+            del args[index:index + 2]
+        
+        port = int(os.environ.get('PORT', 8080))  # Railway sets PORT environment variable
+        if args:
+            port = int(args[0])
+        
+        config = load_server_config()
+        if workers > 1:
+            run_workers(port, workers, config)
+        else:
+            server = RemoteControlServer(port, config=config)
+            server.start()
+        
+    elif mode == 'agent':
+        # Start agent mode
+        if len(sys.argv) < 3:
+            print("Error: Agent mode requires server URL")
+            print("Usage: python remote_control.py agent SERVER_URL")
+            sys.exit(1)
+        
+        server_url = sys.argv[2]
+        agent = RemoteControlAgent(server_url)
+        agent.start()
+        
+    elif mode == 'loadtest':
+        # Synthetic fleet against a local server; --help lists the options
+        run_loadtest(sys.argv[2:])
+        
+    else:
+        print(f"Unknown mode: {mode}")
+        print("Available modes: server, agent, loadtest")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
     main()
\ No newline at end of file
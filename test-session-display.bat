@@ -1,25 +1,25 @@
-@echo off
-echo Testing Session ID display...
-echo.
-echo ============================================================
-echo SUCCESS! Agent Active! Session ID: ABC123XY
-echo ============================================================
-echo COPY THIS SESSION ID TO YOUR CONTROLLER!
-echo Session ID: ABC123XY
-echo Controller URL: https://web-production-463b89.up.railway.app
-echo ============================================================
-echo.
-echo Agent is running... Press Ctrl+C to stop
-echo.
-echo.
-echo ★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★
-echo ★                                                                     ★
-echo ★  Agent finished! The Session ID was displayed above.               ★
-echo ★  Look for lines containing "Session ID:" in the output above.       ★
-echo ★                                                                     ★
-echo ★  Use it at: https://web-production-463b89.up.railway.app           ★
-echo ★                                                                     ★
-echo ★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★
-echo.
-echo Press any key to close this window...
-pause >nul
+@echo off
+echo Testing Session ID display...
+echo.
+echo ============================================================
+echo SUCCESS! Agent Active! Session ID: ABC123XY
+echo ============================================================
+echo COPY THIS SESSION ID TO YOUR CONTROLLER!
+echo Session ID: ABC123XY
+echo Controller URL: https://web-production-463b89.up.railway.app
+echo ============================================================
+echo.
+echo Agent is running... Press Ctrl+C to stop
+echo.
+echo.
+echo ★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★
+echo ★                                                                     ★
+echo ★  Agent finished! The Session ID was displayed above.               ★
+echo ★  Look for lines containing "Session ID:" in the output above.       ★
+echo ★                                                                     ★
+echo ★  Use it at: https://web-production-463b89.up.railway.app           ★
+echo ★                                                                     ★
+echo ★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★★
+echo.
+echo Press any key to close this window...
+pause >nul
@@ -0,0 +1,136 @@
+"""
+Push streams of tile frames
+An MJPEG viewer needs the keyframe with its tiles pasted on, and that
+composite is built under the same per-frame encoding as the stream bytes.
+These tests stream a tile frame over MJPEG and SSE against a live server.
+"""
+
+import http.client
+import io
+import json
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from remote_control import HAS_PIL, MJPEG_BOUNDARY, RemoteControlServer
+
+if HAS_PIL:
+    from PIL import Image
+
+TIMEOUT = 5
+
+
+def jpeg(size, color):
+    buffer = io.BytesIO()
+    Image.new('RGB', size, color).save(buffer, format='JPEG', quality=95)
+    return buffer.getvalue()
+
+
+def read_mjpeg_part(response):
+    """Next image of a multipart/x-mixed-replace stream"""
+    length = None
+    while True:
+        line = response.fp.readline()
+        if not line:
+            raise EOFError('MJPEG stream closed')
+        line = line.strip()
+        if line.lower().startswith(b'content-length:'):
+            length = int(line.split(b':', 1)[1])
+        elif not line and length is not None:
+            return response.fp.read(length)
+
+
+def read_sse_frame(response):
+    """Data of the next 'frame' event of an SSE stream"""
+    event = None
+    while True:
+        line = response.fp.readline()
+        if not line:
+            raise EOFError('SSE stream closed')
+        line = line.decode().rstrip('\n')
+        if line.startswith('event: '):
+            event = line[len('event: '):]
+        elif line.startswith('data: ') and event == 'frame':
+            return json.loads(line[len('data: '):])
+
+
+@unittest.skipUnless(HAS_PIL, 'compositing tile frames needs Pillow')
+class TileFrameStreamTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = RemoteControlServer(port=0, max_workers=8)
+        self.httpd = self.server.create_httpd('127.0.0.1')
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        self.port = self.httpd.server_address[1]
+        self.session_id = self.server.store.register_session({'platform': 'test'})
+        self.server.ingest_frame(self.session_id, jpeg((64, 64), (255, 0, 0)), key='key')
+
+    def tearDown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.server.shutdown()
+
+    def open(self, path):
+        connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=TIMEOUT)
+        connection.request('GET', path)
+        response = connection.getresponse()
+        self.addCleanup(connection.close)
+        self.assertEqual(response.status, 200)
+        return response
+
+    def send_tile(self):
+        tile = (0, 0, 32, 32, jpeg((32, 32), (0, 0, 255)))
+        screen_info = self.server.ingest_tiles(self.session_id, 'key', [tile], [64, 64])
+        self.assertIsNotNone(screen_info)
+        return screen_info
+
+    def test_mjpeg_streams_the_composite(self):
+        response = self.open(f'/api/stream/{self.session_id}')
+        self.assertIn(MJPEG_BOUNDARY, response.getheader('Content-Type'))
+        first = Image.open(io.BytesIO(read_mjpeg_part(response))).convert('RGB')
+        self.assertGreater(first.getpixel((8, 8))[0], 200)
+
+        self.send_tile()
+        frame = Image.open(io.BytesIO(read_mjpeg_part(response))).convert('RGB')
+        red, _, blue = frame.getpixel((8, 8))
+        self.assertGreater(blue, 200)
+        self.assertLess(red, 60)
+        self.assertGreater(frame.getpixel((48, 48))[0], 200)
+        self.assert_still_serving()
+
+    def test_sse_announces_tile_frames(self):
+        response = self.open(f'/api/events?session={self.session_id}')
+        self.assertEqual(read_sse_frame(response)['version'], 1)
+        screen_info = self.send_tile()
+        self.assertEqual(read_sse_frame(response)['version'], screen_info['version'])
+        self.assert_still_serving()
+
+    def test_mjpeg_and_sse_together(self):
+        stream = self.open(f'/api/stream/{self.session_id}')
+        events = self.open(f'/api/events?session={self.session_id}')
+        read_mjpeg_part(stream)
+        read_sse_frame(events)
+        for _ in range(3):
+            screen_info = self.send_tile()
+            read_mjpeg_part(stream)
+            self.assertEqual(read_sse_frame(events)['version'], screen_info['version'])
+        self.assert_still_serving()
+
+    def assert_still_serving(self):
+        """Plain requests and the .jpg view are answered while the streams are open"""
+        connection = http.client.HTTPConnection('127.0.0.1', self.port, timeout=TIMEOUT)
+        try:
+            connection.request('GET', f'/api/screen/{self.session_id}.jpg')
+            response = connection.getresponse()
+            self.assertEqual(response.status, 200)
+            image = Image.open(io.BytesIO(response.read())).convert('RGB')
+            self.assertGreater(image.getpixel((8, 8))[2], 200)
+        finally:
+            connection.close()
+
+
+if __name__ == '__main__':
+    unittest.main()